@@ -0,0 +1,73 @@
+"""트리 복사 벤치마크: shutil.copytree vs CopyEngine (스레드 수별).
+
+사용법:
+    python benchmarks/bench_copy_tree.py [파일 수] [원본 경로 상위] [대상 경로 상위]
+
+작은 파일이 많은 트리(디렉토리당 100개)를 만든 뒤 단일 스레드 copytree 와
+병렬 복사 엔진의 소요 시간을 비교한다. 기본 위치는 임시 디렉토리이며,
+SSD/NFS 등 실제 장치에서 재려면 경로를 지정한다.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mdir.operations.copy import CopyEngine  # noqa: E402
+from mdir.operations.device import default_workers  # noqa: E402
+
+
+def _make_tree(root: Path, n: int) -> None:
+    for i in range(n):
+        d = root / f"d{i // 100:05d}"
+        if i % 100 == 0:
+            d.mkdir(parents=True)
+        (d / f"f{i:07d}.txt").write_bytes(b"x" * (i % 4096))
+
+
+def _engine_copy(workers: int):
+    def run(src: Path, dest: Path) -> None:
+        engine = CopyEngine(workers)
+        try:
+            engine.copy_tree(str(src), str(dest))
+            engine.finish()
+        finally:
+            engine.close()
+
+    return run
+
+
+def _run(label: str, fn, src: Path, dest_parent: Path, n: int) -> None:
+    dest = dest_parent / "out"
+    start = time.perf_counter()
+    fn(src, dest)
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(dest)
+    print(f"{label:<14} {n:>8} 파일  {elapsed * 1000:>9.1f} ms  ({n / elapsed:>8.0f} 파일/초)")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    src_base = sys.argv[2] if len(sys.argv) > 2 else None
+    dest_base = sys.argv[3] if len(sys.argv) > 3 else src_base
+    with (
+        tempfile.TemporaryDirectory(dir=src_base) as src_tmp,
+        tempfile.TemporaryDirectory(dir=dest_base) as dest_tmp,
+    ):
+        src = Path(src_tmp) / "tree"
+        _make_tree(src, n)
+        dest_parent = Path(dest_tmp)
+        _run("copytree", lambda s, d: shutil.copytree(s, d, symlinks=True), src, dest_parent, n)
+        default = default_workers(src, dest_parent)
+        for workers in sorted({1, 4, default, 16}):
+            mark = " *" if workers == default else ""
+            _run(f"engine x{workers}{mark}", _engine_copy(workers), src, dest_parent, n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""FileItem 메모리 벤치마크: 기존 @dataclass 구현 vs __slots__ 구현.
+
+사용법:
+    python benchmarks/bench_file_item_memory.py [항목 수]
+
+tracemalloc 으로 항목 N 개를 만들 때의 메모리 증가량을 비교한다.
+기존 구현은 항목마다 Path / datetime 객체를 미리 만들어 두었다.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mdir.models.file_item import FileItem  # noqa: E402
+
+
+@dataclass
+class LegacyFileItem:
+    """0.1.x 의 FileItem 정의."""
+
+    path: Path
+    name: str
+    is_dir: bool
+    is_hidden: bool
+    size: int
+    modified: datetime
+    is_symlink: bool = False
+    is_selected: bool = False
+
+
+def _names(n: int) -> list[str]:
+    return [f"IMG_{i:08d}.jpg" for i in range(n)]
+
+
+def _build_legacy(parent: Path, names: list[str]) -> list[LegacyFileItem]:
+    return [
+        LegacyFileItem(
+            path=parent / name,
+            name=name,
+            is_dir=False,
+            is_hidden=False,
+            size=1_000_000 + i,
+            modified=datetime.fromtimestamp(1_700_000_000 + i),
+        )
+        for i, name in enumerate(names)
+    ]
+
+
+def _build_compact(parent: Path, names: list[str]) -> list[FileItem]:
+    return [
+        FileItem(
+            name=sys.intern(name),
+            parent=parent,
+            is_dir=False,
+            size=1_000_000 + i,
+            mtime_ns=(1_700_000_000 + i) * 1_000_000_000,
+        )
+        for i, name in enumerate(names)
+    ]
+
+
+def _measure(label: str, build, n: int) -> None:
+    parent = Path("/data/photos")
+    names = _names(n)  # 이름 문자열은 두 구현에서 공통이므로 측정에서 제외
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build(parent, names)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    per_item = (after - before) / n
+    print(f"{label:<10} {n:>9} 항목  {(after - before) / 1024 / 1024:>8.1f} MiB  항목당 {per_item:>6.0f} B")
+    del items
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    _measure("dataclass", _build_legacy, n)
+    _measure("slots", _build_compact, n)
+
+
+if __name__ == "__main__":
+    main()
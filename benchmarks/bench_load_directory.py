@@ -0,0 +1,107 @@
+"""load_directory 벤치마크: iterdir+from_path 방식 vs scandir 방식.
+
+사용법:
+    python benchmarks/bench_load_directory.py [항목 수]
+
+임시 디렉토리에 파일을 만든 뒤 두 방식의 소요 시간과
+항목당 stat 계열 시스템 호출 수를 비교한다.
+(os.stat 호출 + DirEntry.stat 호출을 세며, DirEntry 의 타입 판별은
+d_type 캐시를 쓰므로 시스템 호출로 집계하지 않는다.)
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mdir.models.file_item import FileItem, load_directory  # noqa: E402
+
+
+class _StatCounter:
+    """os.stat / DirEntry.stat 호출 횟수 집계."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._orig_stat = os.stat
+        self._orig_scandir = os.scandir
+
+    def __enter__(self) -> _StatCounter:
+        counter = self
+
+        def counting_stat(*args, **kwargs):
+            counter.count += 1
+            return counter._orig_stat(*args, **kwargs)
+
+        class _Entry:
+            def __init__(self, entry: os.DirEntry[str]) -> None:
+                self._entry = entry
+                self.name = entry.name
+                self.path = entry.path
+
+            def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+                return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+            def is_symlink(self) -> bool:
+                return self._entry.is_symlink()
+
+            def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+                counter.count += 1
+                return self._entry.stat(follow_symlinks=follow_symlinks)
+
+        class _Scandir:
+            def __init__(self, path) -> None:
+                self._it = counter._orig_scandir(path)
+
+            def __enter__(self):
+                return (_Entry(e) for e in self._it)
+
+            def __exit__(self, *exc) -> None:
+                self._it.close()
+
+        os.stat = counting_stat
+        os.scandir = _Scandir
+        return self
+
+    def __exit__(self, *exc) -> None:
+        os.stat = self._orig_stat
+        os.scandir = self._orig_scandir
+
+
+def _legacy_load(path: Path) -> list[FileItem]:
+    """기존 구현: iterdir() + FileItem.from_path()."""
+    items = [FileItem.from_path(p) for p in path.iterdir()]
+    items.sort(key=lambda x: (not x.is_dir, x.name.lower()))
+    return items
+
+
+def _run(label: str, fn, path: Path, n: int) -> None:
+    with _StatCounter() as counter:
+        start = time.perf_counter()
+        items = fn(path)
+        elapsed = time.perf_counter() - start
+    print(
+        f"{label:<10} {len(items):>8} 항목  {elapsed * 1000:>9.1f} ms  "
+        f"stat 호출 {counter.count:>8} (항목당 {counter.count / max(n, 1):.2f})"
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(n):
+            if i % 10 == 0:
+                (root / f"dir{i:07d}").mkdir()
+            else:
+                (root / f"file{i:07d}.txt").write_bytes(b"x" * (i % 100))
+        _run("iterdir", _legacy_load, root, n)
+        _run("scandir", lambda p: load_directory(p, show_hidden=True), root, n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""동기화 벤치마크: 바뀐 것이 없는 트리를 다시 비교하는 시간 (스레드 수별).
+
+사용법:
+    python benchmarks/bench_sync.py [파일 수] [경로 상위]
+
+작은 파일이 많은 트리(디렉토리당 100개)를 만들어 한 번 동기화한 뒤,
+같은 트리를 다시 계획(plan_sync)하는 데 걸리는 시간을 잰다. 마지막 줄은
+파일 하나만 바꾼 경우다.
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mdir.operations.device import default_workers  # noqa: E402
+from mdir.operations.sync import plan_sync, run_sync  # noqa: E402
+
+
+def _make_tree(root: Path, n: int) -> None:
+    for i in range(n):
+        d = root / f"d{i // 100:05d}"
+        if i % 100 == 0:
+            d.mkdir(parents=True)
+        (d / f"f{i:07d}.txt").write_bytes(b"x" * (i % 512))
+
+
+def _plan(label: str, src: Path, dest: Path, workers: int, n: int) -> None:
+    start = time.perf_counter()
+    plan = plan_sync(src, dest, workers=workers)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<14} {n:>8} 파일  {elapsed * 1000:>9.1f} ms  "
+        f"({n / elapsed:>9.0f} 파일/초)  복사 {len(plan.copies)}"
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    base = sys.argv[2] if len(sys.argv) > 2 else None
+    with tempfile.TemporaryDirectory(dir=base) as tmp:
+        src = Path(tmp) / "src"
+        dest = Path(tmp) / "dest"
+        _make_tree(src, n)
+        dest.mkdir()
+        start = time.perf_counter()
+        run_sync(plan_sync(src, dest))
+        print(f"첫 동기화      {n:>8} 파일  {(time.perf_counter() - start) * 1000:>9.1f} ms")
+
+        default = default_workers(src, dest)
+        for workers in sorted({1, 4, default, 16}):
+            mark = " *" if workers == default else ""
+            _plan(f"재비교 x{workers}{mark}", src, dest, workers, n)
+        (src / "d00000" / "f0000001.txt").write_bytes(b"changed")
+        _plan("1개 변경", src, dest, default, n)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,22 +3,61 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from collections.abc import Callable, Iterable
 from pathlib import Path
 
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
+from textual.timer import Timer
 
+from mdir.models.changes import ChangeSet
+from mdir.models.disk_usage import DISK_USAGE_MAX_AGE, DiskUsageCache
 from mdir.models.file_item import FileItem
-from mdir.operations.copy import copy_items
-from mdir.operations.delete import delete_items, make_directory, rename_item
-from mdir.operations.exceptions import DiskFullError, FileOperationError, PathNotFoundError, PermissionDeniedError
+from mdir.models.listing_cache import ListingCache
+from mdir.operations.cancel import CancelToken
+from mdir.operations.compare import CompareResult, compare_listings, compare_trees
+from mdir.operations.copy import CopyReport, copy_items
+from mdir.operations.delete import delete_items, make_directory, purge_items, rename_item
+from mdir.operations.du import DirSizeCache
+from mdir.operations.exceptions import (
+    DiskFullError,
+    FileOperationError,
+    OperationCancelledError,
+    PathNotFoundError,
+    PermissionDeniedError,
+)
+from mdir.operations.jobs import RUNNING, Job, JobQueue, job_devices
+from mdir.operations.journal import CopyJournal
 from mdir.operations.move import move_items
-from mdir.panels.dialogs import ConfirmScreen, InputScreen, PreviewScreen
-from mdir.panels.file_panel import FilePanel, FilePanelCursorMoved, FilePanelFileSelected
+from mdir.operations.progress import PROGRESS_REFRESH_INTERVAL
+from mdir.operations.rename import rename_batch
+from mdir.operations.sync import SyncOptions, plan_sync, run_sync
+from mdir.operations.verify import VerifyOptions, VerifyReport, new_hasher, report_path
+from mdir.panels.dialogs import (
+    BatchRenameScreen,
+    ConfirmScreen,
+    InputScreen,
+    JobsScreen,
+    PreviewScreen,
+)
+from mdir.panels.file_panel import (
+    FilePanel,
+    FilePanelCursorMoved,
+    FilePanelFileSelected,
+    FilePanelLoadProgress,
+    FilePanelPathRemoved,
+)
 from mdir.panels.status_bar import FunctionBar, StatusBar
 
+# 영구 삭제 확인 입력어
+_PURGE_CONFIRM_WORD = "삭제"
+
+# 동기화(F9) 때 크기가 같은 파일을 내용(해시)으로 비교할지 (1/true)
+_SYNC_CHECKSUM_ENV = "MDIR_SYNC_CHECKSUM"
+
 
 class MdirApp(App):
     """mdir-tui: 모던 두 패널 TUI 파일 매니저."""
@@ -28,17 +67,33 @@ class MdirApp(App):
     BINDINGS = [
         Binding("tab", "switch_panel", "패널 전환", show=False, priority=True),
         Binding("f2", "rename", "이름변경", priority=True),
+        Binding("shift+f2", "batch_rename", "일괄 이름변경", show=False, priority=True),
         Binding("f3", "preview", "보기", priority=True),
         Binding("f5", "copy", "복사", priority=True),
+        Binding("shift+f5", "copy_verified", "검증 복사", show=False, priority=True),
         Binding("f6", "move", "이동", priority=True),
         Binding("f7", "mkdir", "새 폴더", priority=True),
         Binding("f8", "delete", "삭제", priority=True),
+        Binding("shift+f8", "purge", "영구 삭제", show=False, priority=True),
+        Binding("f9", "sync", "동기화", priority=True),
+        Binding("shift+f9", "sync_mirror", "동기화 (삭제 포함)", show=False, priority=True),
+        Binding("escape", "cancel_operation", "작업 취소", show=False),
+        Binding("ctrl+j", "jobs", "작업 목록", show=False, priority=True),
         Binding("f10", "quit", "종료", priority=True),
         Binding("q", "quit", "종료", show=False),
         Binding("ctrl+h", "toggle_hidden", "숨김 토글", show=False, priority=True),
         Binding("ctrl+g", "goto_path", "경로 이동", show=False, priority=True),
         Binding("ctrl+a", "select_all", "전체 선택", show=False, priority=True),
         Binding("ctrl+s", "cycle_sort", "정렬 변경", show=False, priority=True),
+        Binding("ctrl+d", "compare", "폴더 비교", show=False, priority=True),
+        Binding("alt+d", "compare_trees", "하위 폴더까지 비교", show=False, priority=True),
+        # 터미널에 따라 Ctrl+Space 는 ctrl+@ (NUL) 로 들어온다
+        Binding("ctrl+space,ctrl+@", "dir_sizes", "폴더 크기", show=False, priority=True),
+        Binding("asterisk", "invert_selection", "선택 반전", show=False),
+        Binding("plus", "select_pattern", "패턴 선택", show=False),
+        Binding("minus", "unselect_pattern", "패턴 해제", show=False),
+        Binding("shift+up", "extend_selection_up", "범위 선택", show=False),
+        Binding("shift+down", "extend_selection_down", "범위 선택", show=False),
         # 다이얼로그 Input 위젯과 충돌하지 않도록 priority=True 제거
         Binding("up", "cursor_up", "위", show=False),
         Binding("down", "cursor_down", "아래", show=False),
@@ -50,18 +105,35 @@ class MdirApp(App):
     def __init__(self) -> None:
         super().__init__()
         self._active_panel_id = "left"
+        # 두 패널이 공유하는 디렉토리 목록 캐시
+        self._listing_cache = ListingCache()
+        # 두 패널이 공유하는 마운트별 디스크 용량 캐시
+        self._disk_usage = DiskUsageCache()
+        # 두 패널이 공유하는 폴더 크기 계산 캐시
+        self._dir_sizes = DirSizeCache()
+        # 파일 작업 큐 (장치별 동시 실행 수 제한) 와 진행 표시 타이머
+        self._jobs = JobQueue()
+        self._jobs_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         cwd = Path.cwd()
         with Horizontal(id="panels-container"):
-            yield FilePanel(id="left", start_path=cwd)
-            yield FilePanel(id="right", start_path=cwd)
+            for panel_id in ("left", "right"):
+                yield FilePanel(
+                    id=panel_id,
+                    start_path=cwd,
+                    cache=self._listing_cache,
+                    disk_usage=self._disk_usage,
+                    dir_sizes=self._dir_sizes,
+                )
         yield StatusBar()
         yield FunctionBar()
 
     def on_mount(self) -> None:
         self._active_panel.focus()
         self._update_status()
+        # 디스크 용량은 백그라운드에서 주기적으로만 다시 읽는다
+        self.set_interval(DISK_USAGE_MAX_AGE, self._refresh_disk_usage)
         # 포커스 변경을 감지하여 active panel 동기화 (마우스 클릭, Tab 등 모든 경로)
         self.watch(self.screen, "focused", self._sync_active_panel)
 
@@ -76,6 +148,11 @@ class MdirApp(App):
         other = "right" if self._active_panel_id == "left" else "left"
         return self.query_one(f"#{other}", FilePanel)
 
+    @property
+    def _panels(self) -> tuple[FilePanel, FilePanel]:
+        """(왼쪽, 오른쪽) 패널."""
+        return self.query_one("#left", FilePanel), self.query_one("#right", FilePanel)
+
     @property
     def _status_bar(self) -> StatusBar:
         return self.query_one(StatusBar)
@@ -96,8 +173,8 @@ class MdirApp(App):
     def action_switch_panel(self) -> None:
         """Tab: 반대 패널로 포커스 이동."""
         self._active_panel_id = "right" if self._active_panel_id == "left" else "left"
-        # FilePanel이 아닌 내부 DataTable에 직접 포커스
-        self._active_panel.query_one("DataTable").focus()
+        # FilePanel이 아닌 내부 FileTable에 직접 포커스
+        self._active_panel.query_one("FileTable").focus()
         self._update_status()
 
     def action_cursor_up(self) -> None:
@@ -111,7 +188,7 @@ class MdirApp(App):
         self._active_panel.navigate_down()
 
     def action_enter_item(self) -> None:
-        """Enter: DataTable이 priority 없이 처리하므로 fallback 용도."""
+        """Enter: FileTable이 priority 없이 처리하므로 fallback 용도."""
         pass
 
     def action_go_parent(self) -> None:
@@ -136,6 +213,46 @@ class MdirApp(App):
         self._active_panel.select_all()
         self._update_status()
 
+    def action_invert_selection(self) -> None:
+        """*: 선택 반전."""
+        if len(self.screen_stack) > 1:
+            return
+        self._active_panel.invert_selection()
+        self._update_status()
+
+    def action_extend_selection_up(self) -> None:
+        """Shift+↑: 범위 선택 확장."""
+        if len(self.screen_stack) > 1:
+            return
+        self._active_panel.extend_selection(-1)
+        self._update_status()
+
+    def action_extend_selection_down(self) -> None:
+        """Shift+↓: 범위 선택 확장."""
+        if len(self.screen_stack) > 1:
+            return
+        self._active_panel.extend_selection(1)
+        self._update_status()
+
+    @work
+    async def action_select_pattern(self) -> None:
+        """+: glob 패턴으로 선택."""
+        await self._pattern_selection(select=True)
+
+    @work
+    async def action_unselect_pattern(self) -> None:
+        """-: glob 패턴으로 선택 해제."""
+        await self._pattern_selection(select=False)
+
+    def action_dir_sizes(self) -> None:
+        """Ctrl+Space: 선택한 폴더(없으면 모든 폴더)의 전체 크기 계산."""
+        if len(self.screen_stack) > 1:
+            return
+        panel = self._active_panel
+        names = {i.name for i in panel.state.selection.items()} or None
+        if not panel.compute_dir_sizes(names):
+            self.notify("크기를 계산할 폴더가 없습니다", markup=False)
+
     def action_cycle_sort(self) -> None:
         """Ctrl+S: 정렬 기준 순환 (이름→크기→날짜, FR-13 보완)."""
         state = self._active_panel.state
@@ -156,40 +273,86 @@ class MdirApp(App):
     @work
     async def action_copy(self) -> None:
         """F5: 반대 패널로 파일 복사."""
-        items = self._active_panel.get_selected_items()
+        await self._copy_selected()
+
+    @work
+    async def action_copy_verified(self) -> None:
+        """Shift+F5: 반대 패널로 복사하며 해시로 검증 (결과 파일을 남김)."""
+        options = VerifyOptions.from_env()
+        try:
+            new_hasher(options.algorithm)
+        except ValueError as e:
+            self._status_bar.set_error(str(e))
+            return
+        await self._copy_selected(options)
+
+    async def _copy_selected(self, verify: VerifyOptions | None = None) -> None:
+        panel = self._active_panel
+        items = panel.get_selected_items()
         if not items:
             return
+        src = panel.current_path
         dest = self._inactive_panel.current_path
         names = _format_names(items)
 
         confirmed = await self.push_screen_wait(
             ConfirmScreen(
-                title=" 복사 ",
+                title=" 복사 " if verify is None else f" 검증 복사 ({verify.algorithm}) ",
                 message=f"{names}\n→ {dest}",
             )
         )
         if not confirmed:
             return
 
+        journal = await self._open_copy_journal(items, dest)
+        changes = ChangeSet()
+        report = CopyReport()
+        verify_report = VerifyReport(verify.algorithm) if verify is not None else None
+        # 작업이 도는 동안 패널을 계속 쓰므로 선택은 작업을 넣을 때 푼다
+        panel.clear_selection()
         try:
-            await asyncio.to_thread(copy_items, items, dest)
-            self._inactive_panel.refresh_current()
-            self._active_panel.state.clear_selection()
-            self._active_panel.refresh_current()
-            self._status_bar.update(left=f"복사 완료: {names}")
+            await self._run_with_progress(
+                "복사" if verify is None else "검증 복사",
+                copy_items,
+                items,
+                dest,
+                paths=(src, dest),
+                description=f"{names} → {dest}",
+                changes=changes,
+                report=report,
+                journal=journal,
+                verify=verify,
+                verify_report=verify_report,
+                cancel=CancelToken(),
+            )
+            summary = report.summary()
+            self._status_bar.update(left=f"복사 완료: {names}" + (f" ({summary})" if summary else ""))
+        except OperationCancelledError as e:
+            notes = []
+            if report.discarded:
+                notes.append(f"복사하던 파일 {report.discarded}개는 지웠습니다.")
+            if journal is not None:
+                notes.append("같은 복사를 다시 하면 끝난 파일은 건너뛰고 이어서 합니다.")
+            self._notify_cancelled("복사", e, *notes)
         except PermissionDeniedError as e:
             self._status_bar.set_error(str(e))
         except DiskFullError:
             self._status_bar.set_error("디스크 공간이 부족합니다.")
         except FileOperationError as e:
             self._status_bar.set_error(str(e))
+        finally:
+            self._apply_changes(changes)
+            if verify_report is not None and verify_report.results:
+                await self._save_verify_report(verify_report)
 
     @work
     async def action_move(self) -> None:
         """F6: 반대 패널로 파일 이동."""
-        items = self._active_panel.get_selected_items()
+        panel = self._active_panel
+        items = panel.get_selected_items()
         if not items:
             return
+        src = panel.current_path
         dest = self._inactive_panel.current_path
         names = _format_names(items)
 
@@ -202,18 +365,32 @@ class MdirApp(App):
         if not confirmed:
             return
 
+        changes = ChangeSet()
+        panel.clear_selection()
         try:
-            await asyncio.to_thread(move_items, items, dest)
-            self._active_panel.refresh_current()
-            self._inactive_panel.refresh_current()
+            await self._run_with_progress(
+                "이동",
+                move_items,
+                items,
+                dest,
+                paths=(src, dest),
+                description=f"{names} → {dest}",
+                changes=changes,
+                cancel=CancelToken(),
+            )
             self._status_bar.update(left=f"이동 완료: {names}")
+        except OperationCancelledError as e:
+            self._notify_cancelled("이동", e, "옮기지 못한 파일은 원래 자리에 그대로 있습니다.")
         except FileOperationError as e:
             self._status_bar.set_error(str(e))
+        finally:
+            self._apply_changes(changes)
 
     @work
     async def action_delete(self) -> None:
         """F8: 선택 항목 삭제 (휴지통)."""
-        items = self._active_panel.get_selected_items()
+        panel = self._active_panel
+        items = panel.get_selected_items()
         if not items:
             return
         names = _format_names(items)
@@ -227,17 +404,161 @@ class MdirApp(App):
         if not confirmed:
             return
 
+        changes = ChangeSet()
+        panel.clear_selection()
         try:
-            await asyncio.to_thread(delete_items, items)
-            self._active_panel.refresh_current()
-            self._refresh_sibling_if_same_path()
+            await self._run_with_progress(
+                "삭제",
+                delete_items,
+                items,
+                paths=(panel.current_path,),
+                description=names,
+                changes=changes,
+                cancel=CancelToken(),
+            )
             self._status_bar.update(left=f"삭제 완료: {names}")
+        except OperationCancelledError as e:
+            self._notify_cancelled("삭제", e)
         except FileOperationError as e:
             self._status_bar.set_error(str(e))
+        finally:
+            self._apply_changes(changes)
+
+    @work
+    async def action_purge(self) -> None:
+        """Shift+F8: 선택 항목 영구 삭제 (휴지통을 거치지 않음, 입력 확인 필요)."""
+        panel = self._active_panel
+        items = panel.get_selected_items()
+        if not items:
+            return
+        names = _format_names(items)
+
+        answer = await self.push_screen_wait(
+            InputScreen(
+                title=" 영구 삭제 ",
+                prompt=f"{names}\n휴지통을 거치지 않으며 되돌릴 수 없습니다.\n"
+                f"계속하려면 '{_PURGE_CONFIRM_WORD}' 를 입력하세요:",
+                default="",
+            )
+        )
+        if (answer or "").strip() != _PURGE_CONFIRM_WORD:
+            self._status_bar.update(left="영구 삭제를 취소했습니다.")
+            return
+
+        changes = ChangeSet()
+        panel.clear_selection()
+        try:
+            await self._run_with_progress(
+                "영구 삭제",
+                purge_items,
+                items,
+                paths=(panel.current_path,),
+                description=names,
+                changes=changes,
+                cancel=CancelToken(),
+            )
+            self._status_bar.update(left=f"영구 삭제 완료: {names}")
+        except OperationCancelledError as e:
+            self._notify_cancelled("영구 삭제", e, "이미 지운 항목은 되돌릴 수 없습니다.")
+        except FileOperationError as e:
+            self._status_bar.set_error(str(e))
+        finally:
+            self._apply_changes(changes)
+
+    @work
+    async def action_sync(self) -> None:
+        """F9: 현재 폴더(선택 항목)의 새 파일·바뀐 파일만 반대 패널 폴더로 복사."""
+        await self._sync(delete=False)
+
+    @work
+    async def action_sync_mirror(self) -> None:
+        """Shift+F9: 동기화하며 원본에 없는 대상 항목도 지움 (미러)."""
+        await self._sync(delete=True)
+
+    async def _sync(self, delete: bool) -> None:
+        panel = self._active_panel
+        src = panel.current_path
+        dest = self._inactive_panel.current_path
+        # 선택한 항목이 있으면 그것만, 없으면 폴더 전체
+        state = panel.state
+        names = [item.name for item in state.get_selected_items()] if state.selection else None
+        checksum = os.environ.get(_SYNC_CHECKSUM_ENV, "").lower() in ("1", "true", "yes")
+        options = SyncOptions(checksum=checksum, delete=delete)
+
+        # 1) 계획 (dry-run) — 아무것도 바꾸지 않는다
+        try:
+            plan = await self._run_with_progress(
+                "비교",
+                plan_sync,
+                src,
+                dest,
+                options,
+                paths=(src, dest),
+                description=f"{src} → {dest}",
+                names=names,
+                cancel=CancelToken(),
+            )
+        except OperationCancelledError:
+            self.notify("동기화를 취소했습니다.", severity="warning", markup=False)
+            return
+        except FileOperationError as e:
+            self._status_bar.set_error(str(e))
+            return
+        if plan.empty:
+            self.notify(f"동기화할 항목이 없습니다 — {plan.summary()}", markup=False)
+            return
+
+        title = " 동기화 (삭제 포함) " if delete else " 동기화 "
+        lines = "\n".join(plan.preview())
+        confirmed = await self.push_screen_wait(
+            ConfirmScreen(title=title, message=f"{src}\n→ {dest}\n\n{plan.summary()}\n\n{lines}")
+        )
+        if not confirmed:
+            return
+
+        # 2) 실행
+        changes = ChangeSet()
+        panel.clear_selection()
+        try:
+            await self._run_with_progress(
+                "동기화",
+                run_sync,
+                plan,
+                paths=(src, dest),
+                description=f"{src} → {dest}",
+                changes=changes,
+                cancel=CancelToken(),
+            )
+            self._status_bar.update(left=f"동기화 완료: {plan.summary()}")
+        except OperationCancelledError as e:
+            self._notify_cancelled("동기화", e, "다시 동기화하면 남은 파일만 복사합니다.")
+        except PermissionDeniedError as e:
+            self._status_bar.set_error(str(e))
+        except DiskFullError:
+            self._status_bar.set_error("디스크 공간이 부족합니다.")
+        except FileOperationError as e:
+            self._status_bar.set_error(str(e))
+        finally:
+            self._apply_changes(changes)
+
+    def action_cancel_operation(self) -> None:
+        """Esc: 상태바에 보이는 작업 취소 (실행 중이면 취소할 수 있는 작업만)."""
+        job = self._shown_job()
+        if job is not None and self._jobs.cancel(job):
+            self._show_jobs()
+
+    def action_jobs(self) -> None:
+        """Ctrl+J: 작업 목록 (실행 중 · 대기 · 최근에 끝난 작업)."""
+        if len(self.screen_stack) > 1:
+            return
+        self.push_screen(JobsScreen(self._jobs))
 
     @work
     async def action_rename(self) -> None:
-        """F2: 파일/폴더 이름 변경."""
+        """F2: 파일/폴더 이름 변경 (여러 항목이 선택돼 있으면 일괄 이름 변경)."""
+        if len(self._active_panel.state.selection) > 1:
+            self.action_batch_rename()
+            return
         item = self._active_panel.state.active_item
         if item is None or item.name == "..":
             return
@@ -252,14 +573,53 @@ class MdirApp(App):
         if not new_name or new_name == item.name:
             return
 
+        changes = ChangeSet()
         try:
-            rename_item(item, new_name)
-            self._active_panel.refresh_current()
-            self._refresh_sibling_if_same_path()
+            await asyncio.to_thread(rename_item, item, new_name, changes)
+            self._apply_changes(changes)
             self._status_bar.update(left=f"이름 변경: {item.name} → {new_name}")
         except FileOperationError as e:
             self._status_bar.set_error(str(e))
 
+    @work
+    async def action_batch_rename(self) -> None:
+        """Shift+F2: 선택 항목 이름을 템플릿·정규식으로 한꺼번에 변경 (미리보기 후 실행)."""
+        if len(self.screen_stack) > 1:
+            return
+        panel = self._active_panel
+        state = panel.state
+        if state.selection:
+            # 순번은 화면에 보이는 순서대로 매긴다
+            items = [item for item in state.items if item.is_selected]
+        else:
+            items = state.get_selected_items()
+        if not items:
+            return
+
+        plan = await self.push_screen_wait(BatchRenameScreen(items))
+        if plan is None:
+            return
+
+        changes = ChangeSet()
+        panel.clear_selection()
+        try:
+            count = await self._run_with_progress(
+                "이름 변경",
+                rename_batch,
+                plan,
+                paths=(plan.parent,),
+                description=f"{_format_names(items)} ({plan.parent})",
+                changes=changes,
+                cancel=CancelToken(),
+            )
+            self._status_bar.update(left=f"이름 변경 완료: {count:,}개")
+        except OperationCancelledError as e:
+            self._notify_cancelled("이름 변경", e)
+        except FileOperationError as e:
+            self._status_bar.set_error(str(e))
+        finally:
+            self._apply_changes(changes)
+
     @work
     async def action_mkdir(self) -> None:
         """F7: 새 폴더 생성."""
@@ -273,10 +633,12 @@ class MdirApp(App):
         if not folder_name:
             return
 
+        changes = ChangeSet()
         try:
-            make_directory(self._active_panel.current_path, folder_name)
-            self._active_panel.refresh_current()
-            self._refresh_sibling_if_same_path()
+            await asyncio.to_thread(
+                make_directory, self._active_panel.current_path, folder_name, changes
+            )
+            self._apply_changes(changes)
             self._status_bar.update(left=f"폴더 생성: {folder_name}")
         except FileOperationError as e:
             self._status_bar.set_error(str(e))
@@ -294,7 +656,7 @@ class MdirApp(App):
         )
         if not new_path:
             return
-        if not self._active_panel.go_to(new_path):
+        if not await self._active_panel.go_to(new_path):
             self._status_bar.set_error(f"경로를 찾을 수 없음: {new_path}")
         else:
             self._update_status()
@@ -304,16 +666,205 @@ class MdirApp(App):
     def on_file_panel_cursor_moved(self, message: FilePanelCursorMoved) -> None:
         self._update_status()
 
+    def on_file_panel_load_progress(self, message: FilePanelLoadProgress) -> None:
+        """스트리밍 로드 진행 상황을 상태바에 반영 (활성 패널만)."""
+        if message.panel is self._active_panel:
+            self._update_status()
+
+    def on_file_panel_path_removed(self, message: FilePanelPathRemoved) -> None:
+        """현재 경로가 사라져 상위 폴더로 옮겨 간 경우 알림.
+
+        상태바 왼쪽은 곧이어 오는 커서 이동 알림이 덮어쓰므로 토스트로 알린다.
+        """
+        self.notify(
+            f"[경로 없음] 상위 폴더로 이동: {message.panel.current_path}",
+            severity="warning",
+            markup=False,
+        )
+
     def on_file_panel_file_selected(self, message: FilePanelFileSelected) -> None:
         """Enter로 파일 선택 시 미리보기 화면 열기."""
         self.push_screen(PreviewScreen(message.item.path))
 
     # ── 내부 헬퍼 ─────────────────────────────
 
-    def _refresh_sibling_if_same_path(self) -> None:
-        """비활성 패널이 활성 패널과 같은 경로이면 함께 갱신."""
-        if self._inactive_panel.current_path == self._active_panel.current_path:
-            self._inactive_panel.refresh_current()
+    @work
+    async def action_compare(self) -> None:
+        """Ctrl+D: 두 패널 목록 비교 — 다른 항목을 양쪽에서 선택."""
+        if len(self.screen_stack) > 1:
+            return
+        left, right = self._panels
+        try:
+            result = await asyncio.to_thread(
+                compare_listings, list(left.state.items), list(right.state.items)
+            )
+        except OSError as e:
+            self._status_bar.set_error(f"비교 실패: {e}")
+            return
+        self._show_comparison(result)
+
+    @work
+    async def action_compare_trees(self) -> None:
+        """Alt+D: 두 패널 폴더를 하위 트리까지 비교 (Esc 로 취소)."""
+        if len(self.screen_stack) > 1:
+            return
+        left, right = self._panels
+        # 패널에 보이는 최상위 항목만 (숨김 파일 설정을 따름)
+        names = {i.name for i in [*left.state.items, *right.state.items] if i.name != ".."}
+        try:
+            result = await self._run_with_progress(
+                "비교",
+                compare_trees,
+                left.current_path,
+                right.current_path,
+                names,
+                paths=(left.current_path, right.current_path),
+                description=f"{left.current_path} ↔ {right.current_path}",
+                cancel=CancelToken(),
+            )
+        except OperationCancelledError:
+            self.notify("비교를 취소했습니다.", severity="warning", markup=False)
+            return
+        except FileOperationError as e:
+            self._status_bar.set_error(str(e))
+            return
+        self._show_comparison(result)
+
+    def _show_comparison(self, result: CompareResult) -> None:
+        left, right = self._panels
+        left.select_names(result.left_marks())
+        right.select_names(result.right_marks())
+        self._update_status()
+        title = "같음" if result.identical else "차이 있음"
+        self.notify(result.summary(), title=f"폴더 비교 — {title}", markup=False)
+
+    def _notify_cancelled(self, label: str, error: OperationCancelledError, *notes: str) -> None:
+        """취소된 작업이 끝낸 분량 알림 (상태바 왼쪽은 곧이어 오는 목록 갱신이 덮어쓰므로 토스트로)."""
+        message = "\n".join([error.completed or "완료한 항목 없음", *notes])
+        self.notify(message, title=f"{label} 취소됨", severity="warning", markup=False)
+
+    async def _pattern_selection(self, select: bool) -> None:
+        if len(self.screen_stack) > 1:
+            return
+        pattern = await self.push_screen_wait(
+            InputScreen(
+                title=" 패턴 선택 " if select else " 패턴 선택 해제 ",
+                prompt="패턴 입력 (예: *.jpg;*.png):",
+                default="*",
+            )
+        )
+        if not pattern:
+            return
+        changed = self._active_panel.select_pattern(pattern, select)
+        self._update_status()
+        verb = "선택" if select else "선택 해제"
+        self._status_bar.update(
+            left=f"{pattern}: {changed}개 {verb}",
+            right=self._active_panel.status_text(),
+        )
+
+    async def _open_copy_journal(self, items: list[FileItem], dest: Path) -> CopyJournal | None:
+        """복사 작업 저널 열기. 중단된 같은 작업이 있으면 이어서 할지 묻는다.
+
+        저널을 쓸 수 없으면(상태 디렉토리 권한 등) 저널 없이 복사한다.
+        """
+        try:
+            journal = await asyncio.to_thread(CopyJournal.open, [i.path for i in items], dest)
+        except OSError:
+            return None
+        if journal.resumable:
+            resume = await self.push_screen_wait(
+                ConfirmScreen(
+                    title=" 이어서 복사 ",
+                    message="같은 복사 작업이 중단된 기록이 있습니다.\n"
+                    "이미 복사된 파일은 건너뛰고 이어서 복사할까요?",
+                )
+            )
+            if not resume:
+                await asyncio.to_thread(journal.discard)
+        return journal
+
+    async def _save_verify_report(self, report: VerifyReport) -> None:
+        """검증 결과를 상태 디렉토리에 저장하고 위치를 알림."""
+        path = report_path(report)
+        try:
+            await asyncio.to_thread(report.write, path)
+        except OSError as e:
+            self.notify(f"검증 결과를 저장하지 못했습니다: {e}", severity="error", markup=False)
+            return
+        severity = "error" if report.mismatches else "information"
+        self.notify(f"{report.summary()}\n{path}", title="검증 복사", severity=severity, markup=False)
+
+    async def _run_with_progress(
+        self,
+        label: str,
+        operation: Callable,
+        *args,
+        paths: Iterable[Path] = (),
+        description: str = "",
+        **kwargs,
+    ):
+        """operation(..., progress=) 을 작업 큐에 넣고 끝날 때까지 기다림.
+
+        paths 가 있는 장치마다 동시 작업 수를 넘지 않게 작업 스레드에서 실행되며,
+        그동안 패널은 계속 쓸 수 있다. 작업 스레드는 카운터만 갱신하고, 상태바는
+        타이머로 일정 간격마다 읽는다 (Ctrl+J: 작업 목록).
+        cancel=CancelToken 을 넘기면 실행 중에도 Esc 로 취소할 수 있다 (대기 중이면 항상).
+        """
+        devices = await asyncio.to_thread(job_devices, paths)
+        job = self._jobs.submit(
+            label, operation, *args, devices=devices, description=description, **kwargs
+        )
+        self._show_jobs()
+        if self._jobs_timer is None:
+            self._jobs_timer = self.set_interval(PROGRESS_REFRESH_INTERVAL, self._show_jobs)
+        return await asyncio.wrap_future(job.future)
+
+    def _shown_job(self) -> Job | None:
+        """상태바에 보이는 작업: 가장 먼저 시작한 실행 중인 작업 (없으면 대기 중인 첫 작업)."""
+        active = self._jobs.active()
+        return next((job for job in active if job.state == RUNNING), active[0] if active else None)
+
+    def _show_jobs(self) -> None:
+        """상태바에 작업 진행 표시. 남은 작업이 없으면 타이머를 멈춘다."""
+        job = self._shown_job()
+        if job is None:
+            if self._jobs_timer is not None:
+                self._jobs_timer.stop()
+                self._jobs_timer = None
+            self._status_bar.clear_progress()
+            return
+        if job.state != RUNNING:
+            text = f"{job.label} 대기 중"
+        elif job.cancel is not None and job.cancel.cancelled:
+            text = f"{job.label} 취소하는 중…"
+        elif job.paused:
+            text = f"{job.label} 일시정지 (Ctrl+J 에서 P: 재개)"
+        else:
+            text = job.progress.snapshot().describe()
+        others = self._jobs.running_count + self._jobs.queued_count - 1
+        if others > 0:
+            text += f" · 작업 {others}개 더 (Ctrl+J)"
+        if job.cancellable:
+            text += " · Esc 취소"
+        self._status_bar.show_progress(text)
+
+    def _apply_changes(self, changes: ChangeSet) -> None:
+        """파일 작업 결과를 두 패널에 반영 (변경된 경로만 다시 확인)."""
+        if not changes:
+            return
+        for panel in (self._active_panel, self._inactive_panel):
+            panel.apply_changes(changes)
+        # 왼쪽의 작업 결과 메시지는 남겨 둔다
+        self._update_status_info()
+        self._refresh_disk_usage(force=True)
+
+    @work(thread=True, exclusive=True, group="disk")
+    def _refresh_disk_usage(self, force: bool = False) -> None:
+        """두 패널 마운트의 디스크 용량을 다시 읽고 상태바 갱신 (백그라운드)."""
+        for panel in (self._active_panel, self._inactive_panel):
+            panel.state.refresh_disk_info(force)
+        self.call_from_thread(self._update_status_info)
 
     def _update_panel_classes(self) -> None:
         """활성/비활성 패널 CSS 클래스 및 경로 바 표시기 갱신."""
@@ -322,20 +873,22 @@ class MdirApp(App):
             panel.set_active(panel_id == self._active_panel_id)
 
     def _update_status(self) -> None:
+        """상태바 갱신. 커서 이동마다 호출되므로 시스템 호출을 하지 않는다.
+
+        현재 경로가 사라진 경우는 패널이 파일 감시/작업 결과로 감지해
+        FilePanelPathRemoved 로 알린다.
+        """
         panel = self._active_panel
-        # 현재 경로가 사라진 경우 상위 폴더로 자동 이동
-        if not panel.current_path.exists():
-            parent = panel.current_path.parent
-            if parent.exists():
-                panel.go_to(str(parent))
-                self._status_bar.update(left=f"[경로 없음] 상위 폴더로 이동: {parent}")
-                return
         self._update_panel_classes()
         self._status_bar.update(
             left=str(panel.current_path),
             right=panel.status_text(),
         )
 
+    def _update_status_info(self) -> None:
+        """상태바 오른쪽(항목 수, 선택, 디스크)만 갱신 — 백그라운드 진행 알림용."""
+        self._status_bar.update_right(self._active_panel.status_text())
+
 
 def _format_names(items: list[FileItem]) -> str:
     """파일 목록을 표시용 문자열로 변환."""
@@ -0,0 +1,69 @@
+"""디렉토리 변경 집합 (파일 감시 이벤트 / 파일 작업 결과를 패널에 반영)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from watchfiles import Change
+
+
+@dataclass
+class ChangeSet:
+    """추가/삭제/수정/이름변경된 경로 모음.
+
+    같은 경로에 대한 이벤트가 여러 번 와도 합쳐지며, 반영할 때는
+    경로마다 lstat 으로 현재 상태를 다시 확인하므로 이벤트 순서에 의존하지 않는다.
+    trusted=False 이면 (부분 실패 등) 기록이 불완전할 수 있으므로 전체 재스캔해야 한다.
+    """
+
+    added: set[Path] = field(default_factory=set)
+    removed: set[Path] = field(default_factory=set)
+    modified: set[Path] = field(default_factory=set)
+    renamed: dict[Path, Path] = field(default_factory=dict)  # 이전 경로 → 새 경로
+    trusted: bool = True
+
+    def __len__(self) -> int:
+        return len(self.touched())
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.added or self.removed or self.modified or self.renamed or not self.trusted
+        )
+
+    def touched(self) -> set[Path]:
+        """변경된 모든 경로."""
+        return (
+            self.added
+            | self.removed
+            | self.modified
+            | self.renamed.keys()
+            | set(self.renamed.values())
+        )
+
+    def merge(self, other: ChangeSet) -> None:
+        self.added |= other.added
+        self.removed |= other.removed
+        self.modified |= other.modified
+        self.renamed.update(other.renamed)
+        self.trusted = self.trusted and other.trusted
+
+    def clear(self) -> None:
+        self.added.clear()
+        self.removed.clear()
+        self.modified.clear()
+        self.renamed.clear()
+        self.trusted = True
+
+    @classmethod
+    def from_watch(cls, changes: set[tuple[Change, str]]) -> ChangeSet:
+        """watchfiles 의 (Change, 경로) 집합으로부터 생성."""
+        result = cls()
+        for change, path in changes:
+            if change == Change.added:
+                result.added.add(Path(path))
+            elif change == Change.deleted:
+                result.removed.add(Path(path))
+            else:
+                result.modified.add(Path(path))
+        return result
@@ -0,0 +1,57 @@
+"""마운트별 디스크 여유/전체 용량 캐시 (두 패널 공용).
+
+상태바는 커서가 움직일 때마다 갱신되므로 statvfs 를 매번 호출하지 않고
+장치 번호(st_dev)별로 마지막 값을 보관해 둔다. 값은 디렉토리 로드 워커와
+앱의 주기적 갱신 워커가 백그라운드에서 새로 고친다.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+# 이 시간(초)이 지나지 않은 값은 다시 읽지 않는다
+DISK_USAGE_MAX_AGE = 5.0
+
+
+def read_disk_usage(path: Path) -> tuple[int, int]:
+    """(free_bytes, total_bytes) 를 파일시스템에서 직접 읽음. 실패 시 (0, 0)."""
+    try:
+        if os.name != "nt":
+            stat = os.statvfs(str(path))
+            return stat.f_bavail * stat.f_frsize, stat.f_blocks * stat.f_frsize
+        # Windows
+        usage = shutil.disk_usage(str(path))
+        return usage.free, usage.total
+    except Exception:
+        return 0, 0
+
+
+class DiskUsageCache:
+    """장치 번호 → (free, total, 읽은 시각) 캐시."""
+
+    def __init__(self, max_age: float = DISK_USAGE_MAX_AGE) -> None:
+        self.max_age = max_age
+        self._entries: dict[int, tuple[int, int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, device: int) -> tuple[int, int] | None:
+        """캐시된 값 반환 (시스템 호출 없음). 없으면 None."""
+        entry = self._entries.get(device)
+        if entry is None:
+            return None
+        return entry[0], entry[1]
+
+    def refresh(self, path: Path, device: int, force: bool = False) -> tuple[int, int]:
+        """값이 max_age 보다 오래됐거나 force 이면 다시 읽음 (워커 스레드에서 호출)."""
+        with self._lock:
+            entry = self._entries.get(device)
+            if entry is not None and not force and time.monotonic() - entry[2] < self.max_age:
+                return entry[0], entry[1]
+        free, total = read_disk_usage(path)
+        with self._lock:
+            self._entries[device] = (free, total, time.monotonic())
+        return free, total
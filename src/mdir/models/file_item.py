@@ -3,30 +3,74 @@
 from __future__ import annotations
 
 import os
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
+from stat import S_ISDIR, S_ISLNK
 
+from mdir.models.changes import ChangeSet
+from mdir.models.disk_usage import DiskUsageCache, read_disk_usage
+from mdir.models.listing_cache import DirSignature, ListingCache, dir_signature
+from mdir.models.selection import Selection, compile_pattern
 
-@dataclass
+
+@dataclass(slots=True)
 class FileItem:
-    """파일/디렉토리 항목을 나타내는 데이터 클래스."""
+    """파일/디렉토리 항목을 나타내는 데이터 클래스.
+
+    대용량 디렉토리를 위해 __slots__ 기반으로 가볍게 유지한다.
+    - parent: 같은 디렉토리의 항목들이 하나의 Path 객체를 공유
+    - name: sys.intern 으로 인터닝
+    - mtime_ns: datetime 대신 정수로 보관
+    - tree_size: 디렉토리의 재귀 크기 (계산한 경우만, operations.du)
+    path / modified 는 접근할 때 만들어진다.
+    """
 
-    path: Path
     name: str
+    parent: Path
     is_dir: bool
-    is_hidden: bool
     size: int
-    modified: datetime
+    mtime_ns: int
     is_symlink: bool = False
     is_selected: bool = False
+    _path: Path | None = field(default=None, repr=False, compare=False)
+    _name_key: str | None = field(default=None, repr=False, compare=False)
+    tree_size: int | None = field(default=None, compare=False)
+
+    @property
+    def name_key(self) -> str:
+        """이름 정렬 키 (casefold, 처음 정렬할 때 한 번만 계산해 보관)."""
+        if self._name_key is None:
+            self._name_key = self.name.casefold()
+        return self._name_key
+
+    @property
+    def path(self) -> Path:
+        """항목의 전체 경로 (처음 접근할 때 생성)."""
+        if self._path is None:
+            self._path = self.parent / self.name
+        return self._path
+
+    @property
+    def is_hidden(self) -> bool:
+        return self.name.startswith(".")
+
+    @property
+    def modified(self) -> datetime:
+        """수정 시각 (접근할 때 생성)."""
+        return datetime.fromtimestamp(self.mtime_ns / 1_000_000_000)
 
     @property
     def size_str(self) -> str:
-        """사람이 읽기 좋은 파일 크기 문자열 반환."""
-        if self.is_dir:
+        """사람이 읽기 좋은 파일 크기 문자열 반환 (폴더는 크기를 계산한 경우만)."""
+        if self.is_dir and self.tree_size is None:
             return "  <DIR>"
-        size = float(self.size)
+        size = float(self.tree_size if self.is_dir else self.size)
         for unit in ("B", "K", "M", "G", "T"):
             if size < 1024:
                 return f"{size:>7.1f}{unit}"
@@ -38,6 +82,33 @@ class FileItem:
         """수정 날짜 문자열 반환."""
         return self.modified.strftime("%Y-%m-%d %H:%M")
 
+    def clone(self) -> FileItem:
+        """선택 해제된 복제본 반환 (캐시 공유용)."""
+        return FileItem(
+            self.name,
+            self.parent,
+            self.is_dir,
+            self.size,
+            self.mtime_ns,
+            self.is_symlink,
+            False,
+            self._path,
+            self._name_key,
+            self.tree_size,
+        )
+
+    def renamed(self, name: str) -> FileItem:
+        """이름만 바꾼 복제본 (이름 변경은 크기·수정 시각·폴더 크기를 바꾸지 않는다)."""
+        return FileItem(
+            sys.intern(name),
+            self.parent,
+            self.is_dir,
+            self.size,
+            self.mtime_ns,
+            self.is_symlink,
+            tree_size=self.tree_size,
+        )
+
     @classmethod
     def from_path(cls, path: Path) -> FileItem:
         """Path 객체로부터 FileItem 생성."""
@@ -47,18 +118,65 @@ class FileItem:
             # 일반 파일/폴더는 stat() 사용
             stat = path.lstat() if is_symlink else path.stat()
             size = stat.st_size
-            modified = datetime.fromtimestamp(stat.st_mtime)
+            mtime_ns = stat.st_mtime_ns
         except (PermissionError, OSError):
             size = 0
-            modified = datetime.fromtimestamp(0)
+            mtime_ns = 0
 
         return cls(
-            path=path,
-            name=path.name,
+            name=sys.intern(path.name),
+            parent=path.parent,
             is_dir=path.is_dir() and not is_symlink,
-            is_hidden=path.name.startswith("."),
             size=size,
-            modified=modified,
+            mtime_ns=mtime_ns,
+            is_symlink=is_symlink,
+            _path=path,
+        )
+
+    @classmethod
+    def from_stat(cls, parent: Path, name: str, stat: os.stat_result) -> FileItem:
+        """lstat 결과로부터 FileItem 생성 (추가 시스템 호출 없음, VULN-08)."""
+        is_symlink = S_ISLNK(stat.st_mode)
+        return cls(
+            name=sys.intern(name),
+            parent=parent,
+            is_dir=S_ISDIR(stat.st_mode),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            is_symlink=is_symlink,
+        )
+
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry[str], parent: Path | None = None) -> FileItem:
+        """os.scandir() 의 DirEntry 로부터 FileItem 생성.
+
+        타입 정보는 DirEntry 의 d_type 캐시를 사용하고,
+        stat 은 follow_symlinks=False 로 항목당 최대 1회만 호출한다.
+        심링크는 lstat 결과가 그대로 사용됨 (VULN-08).
+        parent: 같은 디렉토리 항목끼리 공유할 부모 Path (없으면 새로 생성)
+        """
+        try:
+            is_symlink = entry.is_symlink()
+            is_dir = not is_symlink and entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_symlink = False
+            is_dir = False
+        try:
+            stat = entry.stat(follow_symlinks=False)
+            size = stat.st_size
+            mtime_ns = stat.st_mtime_ns
+        except OSError:
+            size = 0
+            mtime_ns = 0
+
+        if parent is None:
+            parent = Path(os.path.dirname(entry.path))
+        return cls(
+            name=sys.intern(entry.name),
+            parent=parent,
+            is_dir=is_dir,
+            size=size,
+            mtime_ns=mtime_ns,
             is_symlink=is_symlink,
         )
 
@@ -66,17 +184,81 @@ class FileItem:
     def parent_entry(cls, path: Path) -> FileItem:
         """상위 폴더 진입을 위한 '..' 항목 생성."""
         return cls(
-            path=path.parent,
             name="..",
+            parent=path,
             is_dir=True,
-            is_hidden=False,
             size=0,
-            modified=datetime.fromtimestamp(0),
+            mtime_ns=0,
+            _path=path.parent,
         )
 
 
 SortKey = str  # "name" | "size" | "modified"
 
+# 스트리밍 로드 시 한 번에 넘겨주는 항목 수
+LOAD_BATCH_SIZE = 1000
+
+
+def iter_directory(
+    path: Path,
+    show_hidden: bool = False,
+    batch_size: int = LOAD_BATCH_SIZE,
+) -> Iterator[list[FileItem]]:
+    """디렉토리 내용을 batch_size 개씩 정렬되지 않은 FileItem 배치로 생성.
+
+    os.scandir 로 한 번에 읽으며, 숨김 항목은 stat 전에 이름으로 걸러낸다.
+    권한이 없으면 그때까지 읽은 항목만 내보내고 종료한다.
+    """
+    batch: list[FileItem] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if not show_hidden and entry.name.startswith("."):
+                    continue
+                batch.append(FileItem.from_dir_entry(entry, path))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+    except PermissionError:
+        pass
+    if batch:
+        yield batch
+
+
+# 정렬 키: 항목에 보관된 값을 그대로 사용 (정렬 시 파일시스템 접근 없음)
+_SORT_KEYS: dict[str, Callable[[FileItem], object]] = {
+    "name": attrgetter("name_key"),
+    "size": attrgetter("size"),
+    "modified": attrgetter("mtime_ns"),
+}
+
+
+def sort_items(
+    items: list[FileItem],
+    sort_by: SortKey = "name",
+    sort_reverse: bool = False,
+) -> list[FileItem]:
+    """정렬된 새 목록 반환. 역순이어도 디렉토리는 항상 앞에 온다.
+
+    크기 정렬 시 디렉토리는 계산된 재귀 크기순 (모르는 폴더는 가장 작게, 그 안에서 이름순).
+    """
+    dirs = [i for i in items if i.is_dir]
+    files = [i for i in items if not i.is_dir]
+    dirs.sort(key=_group_key(sort_by, True), reverse=sort_reverse)
+    files.sort(key=_group_key(sort_by, False), reverse=sort_reverse)
+    return dirs + files
+
+
+def _dir_size_key(item: FileItem) -> tuple[int, str]:
+    return (-1 if item.tree_size is None else item.tree_size), item.name_key
+
+
+def _group_key(sort_by: SortKey, is_dir: bool) -> Callable[[FileItem], object]:
+    """디렉토리/파일 그룹별 정렬 키 함수 (크기 정렬 시 디렉토리는 재귀 크기, 이름순)."""
+    if is_dir and sort_by == "size":
+        return _dir_size_key
+    return _SORT_KEYS.get(sort_by, _SORT_KEYS["name"])
+
 
 def load_directory(
     path: Path,
@@ -90,34 +272,23 @@ def load_directory(
     sort_by: "name" | "size" | "modified"
     """
     items: list[FileItem] = []
+    for batch in iter_directory(path, show_hidden):
+        items.extend(batch)
+    return sort_items(items, sort_by, sort_reverse)
 
-    try:
-        entries = list(path.iterdir())
-    except PermissionError:
-        return []
 
-    for entry in entries:
-        item = FileItem.from_path(entry)
-        if not show_hidden and item.is_hidden:
-            continue
-        items.append(item)
+@dataclass(frozen=True)
+class LoadProbe:
+    """PanelState.probe_load 결과: 정규화된 경로와 스캔 직전의 캐시 서명."""
 
-    # 정렬 키 선택
-    if sort_by == "size":
-        key_fn = lambda x: (not x.is_dir, x.size if not x.is_dir else -1)  # noqa: E731
-    elif sort_by == "modified":
-        key_fn = lambda x: (not x.is_dir, x.modified)  # noqa: E731
-    else:  # "name" (기본)
-        key_fn = lambda x: (not x.is_dir, x.name.lower())  # noqa: E731
-
-    items.sort(key=key_fn, reverse=sort_reverse)
-    # 단, 역순이어도 디렉토리는 항상 앞에 오도록 재정렬
-    if sort_reverse:
-        dirs = [i for i in items if i.is_dir]
-        files = [i for i in items if not i.is_dir]
-        items = dirs + files
+    path: Path
+    signature: DirSignature | None = None
+    started_ns: int = 0
 
-    return items
+    @property
+    def device(self) -> int | None:
+        """디렉토리가 있는 장치 번호 (st_dev). 서명이 없으면 None."""
+        return self.signature[0] if self.signature is not None else None
 
 
 @dataclass
@@ -127,10 +298,20 @@ class PanelState:
     current_path: Path
     items: list[FileItem] = field(default_factory=list)
     cursor_index: int = 0
-    selected_paths: set[Path] = field(default_factory=set)
+    selection: Selection = field(default_factory=Selection, repr=False, compare=False)
     sort_by: str = "name"  # "name" | "size" | "modified"
     sort_reverse: bool = False
     show_hidden: bool = False
+    loading: bool = False  # 스트리밍 로드 진행 중 여부
+    loaded_count: int = 0  # 현재 로드에서 지금까지 읽은 항목 수
+    cache: ListingCache | None = field(default=None, repr=False, compare=False)
+    disk_usage: DiskUsageCache | None = field(default=None, repr=False, compare=False)
+    _load_signature: DirSignature | None = field(default=None, init=False, repr=False)
+    _load_started_ns: int = field(default=0, init=False, repr=False)
+    _load_from_cache: bool = field(default=False, init=False, repr=False)
+    _device: int | None = field(default=None, init=False, repr=False)
+    # 이름 → 행 인덱스 색인 (폴더 크기 반영용, 맞지 않으면 _row_of 가 다시 만든다)
+    _rows: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @property
     def active_item(self) -> FileItem | None:
@@ -140,92 +321,415 @@ class PanelState:
         return None
 
     def get_selected_items(self) -> list[FileItem]:
-        """다중 선택 항목 반환. 선택 없으면 커서 항목 반환."""
-        if self.selected_paths:
-            return [item for item in self.items if item.path in self.selected_paths]
+        """다중 선택 항목 반환 (O(선택 수)). 선택 없으면 커서 항목 반환."""
+        if self.selection:
+            return self.selection.items()
         if self.active_item and self.active_item.name != "..":
             return [self.active_item]
         return []
 
     def toggle_selection(self, item: FileItem) -> None:
         """항목 선택 토글 (.. 항목 제외)."""
-        if item.name == "..":
-            return
-        if item.path in self.selected_paths:
-            self.selected_paths.discard(item.path)
-            item.is_selected = False
-        else:
-            self.selected_paths.add(item.path)
-            item.is_selected = True
+        self.selection.toggle(item)
 
     def clear_selection(self) -> None:
         """전체 선택 해제."""
-        for item in self.items:
-            item.is_selected = False
-        self.selected_paths.clear()
-
-    # 전체선택 최대 항목 수 (VULN-10: 과도한 선택으로 인한 UI 동결 방지)
-    MAX_SELECT_ALL = 10_000
+        self.selection.clear()
 
     def select_all(self) -> None:
-        """전체 선택 (.. 항목 제외, 최대 MAX_SELECT_ALL 개)."""
-        self.selected_paths.clear()
-        count = 0
+        """전체 선택 (.. 항목 제외)."""
+        self.selection.update(self.items)
+
+    def invert_selection(self) -> None:
+        """선택 반전 (.. 항목 제외)."""
         for item in self.items:
-            if item.name != ".." and count < self.MAX_SELECT_ALL:
-                item.is_selected = True
-                self.selected_paths.add(item.path)
-                count += 1
+            self.selection.toggle(item)
+
+    def set_tree_size(self, name: str, size: int) -> int | None:
+        """폴더의 재귀 크기 반영. 크기 정렬이면 위치를 옮긴다 (커서 항목 유지).
+
+        Returns: 제자리에서 갱신된 행 인덱스. 항목이 없으면 -1, 위치가 바뀌었으면 None.
+        """
+        index = self._row_of(name)
+        if index < 0 or name == ".." or not self.items[index].is_dir:
+            return -1
+        item = self.items[index]
+        if item.tree_size == size:
+            return index
+        if self.sort_by != "size":
+            item.tree_size = size
+            return index
+        del self.items[index]
+        item.tree_size = size
+        pos = self._insert_sorted(item)
+        # 사이에 있던 행은 한 칸씩 밀린다
+        lo, hi = min(index, pos), max(index, pos)
+        for row in range(lo, hi + 1):
+            self._rows[self.items[row].name] = row
+        if self.cursor_index == index:
+            self.cursor_index = pos
+        elif lo <= self.cursor_index <= hi:
+            self.cursor_index += 1 if pos < index else -1
+        return None
 
-    def refresh(self) -> None:
-        """현재 디렉토리 재로드."""
+    def _row_of(self, name: str) -> int:
+        """이름 → 행 인덱스. 목록이 바뀌어 색인이 맞지 않으면 다시 만든다. 없으면 -1."""
+        row = self._rows.get(name, -1)
+        if not (0 <= row < len(self.items) and self.items[row].name == name):
+            self._rows = {item.name: i for i, item in enumerate(self.items)}
+            row = self._rows.get(name, -1)
+        return row
+
+    def select_names(self, names: set[str]) -> int:
+        """선택을 names 에 있는 항목으로 바꿈 (폴더 비교 결과 표시). 선택된 항목 수 반환."""
+        self.selection.clear()
+        self.selection.update(item for item in self.items if item.name in names)
+        return len(self.selection)
+
+    def select_pattern(self, pattern: str, select: bool = True) -> int:
+        """glob 패턴(대소문자 무시)에 맞는 항목 선택/해제. 바뀐 항목 수 반환."""
+        regex = compile_pattern(pattern)
+        changed = 0
+        for item in self.items:
+            if item.name == ".." or item.is_selected == select:
+                continue
+            if regex.match(item.name_key):
+                if select:
+                    self.selection.add(item)
+                else:
+                    self.selection.discard(item)
+                changed += 1
+        return changed
+
+    def select_range(self, start: int, end: int, previous: int | None = None) -> None:
+        """start~end 인덱스(양끝 포함, 순서 무관) 항목을 선택에 추가.
+
+        previous: 직전 범위의 끝 (start~previous). 새 범위를 벗어난 항목은 선택 해제
+        """
+        lo, hi = sorted((start, end))
+        if previous is not None:
+            old_lo, old_hi = sorted((start, previous))
+            for item in self.items[max(old_lo, 0) : lo] + self.items[hi + 1 : old_hi + 1]:
+                self.selection.discard(item)
+        self.selection.update(self.items[max(lo, 0) : hi + 1])
+
+    def refresh(self, use_cache: bool = False) -> None:
+        """현재 디렉토리 재로드 (기본: 캐시를 거치지 않고 다시 스캔)."""
         old_name = self.active_item.name if self.active_item else None
-        self.items = []
-        if self.current_path.parent != self.current_path:
-            self.items.append(FileItem.parent_entry(self.current_path))
-        self.items.extend(
-            load_directory(self.current_path, self.show_hidden, self.sort_by, self.sort_reverse)
-        )
-        self.selected_paths.clear()
-
-        # 이전 커서 위치 복원 시도
-        if old_name:
-            for i, item in enumerate(self.items):
-                if item.name == old_name:
-                    self.cursor_index = i
-                    return
-        self.cursor_index = min(self.cursor_index, max(0, len(self.items) - 1))
+        cursor_index = self.cursor_index
+        self.begin_load(self.current_path)
+        if not (use_cache and self.take_cached()):
+            for batch in iter_directory(self.current_path, self.show_hidden):
+                self.add_batch(batch)
+        self.cursor_index = cursor_index
+        self.finish_load(focus_name=old_name)
 
     def enter_directory(self, path: Path) -> None:
-        """디렉토리 진입."""
-        self.current_path = path.resolve()
+        """디렉토리 진입 (캐시에 유효한 목록이 있으면 재사용)."""
+        self.begin_load(path)
+        if not self.take_cached():
+            for batch in iter_directory(self.current_path, self.show_hidden):
+                self.add_batch(batch)
+        self.finish_load()
+
+    # ── 스트리밍 로드 ─────────────────────────
+    # begin_load → add_batch (여러 번) → finish_load 순서로 호출한다.
+    # 로드 중에는 첫 배치만 정렬되어 표시되고, 이후 배치는 뒤에 덧붙인 뒤
+    # finish_load 에서 전체 정렬이 확정된다.
+
+    def probe_load(self, path: Path) -> LoadProbe:
+        """로드 준비 중 파일시스템에 접근하는 부분 (경로 정규화, 캐시 서명).
+
+        상태를 바꾸지 않으므로 워커 스레드에서 호출해도 된다.
+        """
+        resolved = path.resolve()
+        if self.cache is None and self.disk_usage is None:
+            return LoadProbe(resolved)
+        # 스캔 시작 전에 디렉토리 서명을 얻어야 스캔 중 변경을 놓치지 않는다
+        started_ns = time.time_ns()
+        probe = LoadProbe(resolved, dir_signature(resolved), started_ns)
+        if self.disk_usage is not None and probe.device is not None:
+            self.disk_usage.refresh(resolved, probe.device)
+        return probe
+
+    def begin_load(self, path: Path, probe: LoadProbe | None = None) -> None:
+        """새 로드 시작: 목록을 '..' 항목만 남기고 비움.
+
+        probe 를 주면 파일시스템에 접근하지 않는다 (UI 스레드용).
+        """
+        if probe is None:
+            probe = self.probe_load(path)
+        self.current_path = probe.path
         self.cursor_index = 0
-        self.selected_paths.clear()
+        self.selection.clear()
         self.items = []
         if self.current_path.parent != self.current_path:
             self.items.append(FileItem.parent_entry(self.current_path))
-        self.items.extend(
-            load_directory(self.current_path, self.show_hidden, self.sort_by, self.sort_reverse)
-        )
+        self.loading = True
+        self.loaded_count = 0
+        self._load_from_cache = False
+        self._load_started_ns = probe.started_ns
+        self._load_signature = probe.signature
+        if probe.device is not None:
+            self._device = probe.device
+
+    def cached_listing(self, probe: LoadProbe) -> list[FileItem] | None:
+        """probe 의 서명으로 캐시 조회 (상태를 바꾸지 않으므로 워커 스레드에서 호출 가능)."""
+        if self.cache is None:
+            return None
+        return self.cache.get(probe.path, self.show_hidden, probe.signature)
+
+    def take_cached(self, cached: list[FileItem] | None = None) -> bool:
+        """begin_load 직후 호출: 캐시 적중 시 목록을 채우고 True 반환.
+
+        cached: 워커에서 cached_listing 으로 미리 얻은 목록 (없으면 여기서 조회).
+        """
+        if cached is None:
+            cached = self.cached_listing(
+                LoadProbe(self.current_path, self._load_signature, self._load_started_ns)
+            )
+        if cached is None:
+            return False
+        self.items.extend(cached)
+        self.loaded_count = len(cached)
+        self._load_from_cache = True
+        return True
+
+    def add_batch(self, batch: list[FileItem]) -> None:
+        """읽어온 배치를 목록 끝에 추가 (첫 배치는 정렬해서 추가)."""
+        if self.loaded_count == 0:
+            batch = sort_items(batch, self.sort_by, self.sort_reverse)
+        self.items.extend(batch)
+        self.loaded_count += len(batch)
+
+    def finish_load(self, focus_name: str | None = None) -> None:
+        """로드 완료: 전체 정렬 확정 후 커서 위치 복원.
+
+        focus_name 이 주어지면 해당 이름의 항목으로, 아니면 로드 중
+        커서가 가리키던 항목으로 커서를 옮긴다.
+        """
+        current = self.active_item
+        start = self._body_start()
+        self.items[start:] = sort_items(self.items[start:], self.sort_by, self.sort_reverse)
+        self.loading = False
+        if self.cache is not None and not self._load_from_cache:
+            self.cache.put(
+                self.current_path,
+                self.show_hidden,
+                self._load_signature,
+                self.items[start:],
+                self._load_started_ns,
+            )
+
+        for i, item in enumerate(self.items):
+            if (focus_name is not None and item.name == focus_name) or (
+                focus_name is None and item is current
+            ):
+                self.cursor_index = i
+                return
+        self.cursor_index = min(self.cursor_index, max(0, len(self.items) - 1))
+
+    def _body_start(self) -> int:
+        """'..' 항목을 제외한 실제 항목이 시작하는 인덱스."""
+        return 1 if self.items and self.items[0].name == ".." else 0
 
     def set_sort(self, sort_by: str, sort_reverse: bool = False) -> None:
-        """정렬 기준 변경 후 목록 재로드."""
+        """정렬 기준 변경 (메모리 안에서만 재정렬, 디렉토리 재로드 없음).
+
+        기준은 같고 방향만 바뀌면 디렉토리/파일 그룹을 각각 뒤집는다 (O(n)).
+        커서는 같은 항목을 계속 가리킨다.
+        """
+        current = self.active_item
+        start = self._body_start()
+        if sort_by == self.sort_by and sort_reverse != self.sort_reverse:
+            split = self._dir_count_end(start)
+            dirs = self.items[start:split]
+            files = self.items[split:]
+            dirs.reverse()
+            files.reverse()
+            self.items[start:] = dirs + files
+        elif sort_by != self.sort_by or sort_reverse != self.sort_reverse:
+            self.items[start:] = sort_items(self.items[start:], sort_by, sort_reverse)
         self.sort_by = sort_by
         self.sort_reverse = sort_reverse
-        self.refresh()
+
+        if current is not None:
+            for i, item in enumerate(self.items):
+                if item is current:
+                    self.cursor_index = i
+                    break
+
+    # ── 증분 갱신 ─────────────────────────────
+
+    def apply_changes(self, changes: ChangeSet) -> list[int] | None:
+        """변경 집합을 디렉토리 재스캔 없이 목록에 반영.
+
+        현재 디렉토리의 직접 자식 경로만 반영하며, 경로마다 lstat 1회로
+        지금 상태를 확인한다 (있으면 추가/갱신, 없으면 삭제).
+        선택 상태와 커서 항목은 유지된다.
+        Returns: 제자리에서 갱신된 행 인덱스 목록.
+                 행이 추가/삭제되거나 위치가 바뀌었으면 None.
+        """
+        names = {p.name for p in changes.touched() if p.parent == self.current_path}
+        if not names:
+            return []
+
+        index = {item.name: i for i, item in enumerate(self.items) if item.name != ".."}
+        current = self.active_item
+        # 커서 항목의 이름이 바뀌었으면 새 이름을 따라간다
+        follow_name = None
+        if current is not None and current.name != ".." and changes.renamed:
+            new_path = changes.renamed.get(current.path)
+            if new_path is not None and new_path.parent == self.current_path:
+                follow_name = new_path.name
+        updated: list[int] = []
+        removed: list[FileItem] = []
+        inserted: list[FileItem] = []
+
+        for name in names:
+            old_index = index.get(name)
+            old = self.items[old_index] if old_index is not None else None
+            new = None
+            if self.show_hidden or not name.startswith("."):
+                try:
+                    new = FileItem.from_stat(self.current_path, name, os.lstat(self.current_path / name))
+                except OSError:
+                    new = None
+            if old is None and new is None:
+                continue
+            if old is not None and old.is_selected:
+                self.selection.discard(old)
+                if new is not None:
+                    self.selection.add(new)
+            if old is not None and current is old:
+                current = new
+            if old is not None and new is not None and self._same_position(old, new):
+                self.items[old_index] = new
+                updated.append(old_index)
+                continue
+            if old is not None:
+                removed.append(old)
+            if new is not None:
+                inserted.append(new)
+
+        if not removed and not inserted:
+            return updated
+
+        if removed:
+            removed_ids = {id(item) for item in removed}
+            self.items = [item for item in self.items if id(item) not in removed_ids]
+        for item in inserted:
+            self._insert_sorted(item)
+
+        for i, item in enumerate(self.items):
+            if (follow_name is not None and item.name == follow_name) or (
+                follow_name is None and current is not None and item is current
+            ):
+                self.cursor_index = i
+                break
+        self.cursor_index = min(self.cursor_index, max(0, len(self.items) - 1))
+        return None
+
+    def apply_renames(self, renamed: dict[Path, Path]) -> dict[Path, Path]:
+        """현재 디렉토리 안의 이름 변경을 lstat 없이 목록에 반영하고 한 번만 재정렬.
+
+        선택 상태와 커서 항목은 새 이름을 따라간다.
+        Returns: 반영하지 못한 이름 변경 (다른 디렉토리, 목록에 없던 숨김 항목 등).
+        """
+        moves: dict[str, str] = {}
+        left: dict[Path, Path] = {}
+        for old, new in renamed.items():
+            if old.parent == self.current_path and new.parent == self.current_path:
+                moves[old.name] = new.name
+            else:
+                left[old] = new
+        if not moves:
+            return left
+
+        start = self._body_start()
+        current = self.active_item
+        body: list[FileItem] = []
+        reselect: list[FileItem] = []
+        for item in self.items[start:]:
+            new_name = moves.pop(item.name, None)
+            if new_name is None:
+                body.append(item)
+                continue
+            # 선택은 이름이 키이므로 a↔b 처럼 맞바꾼 경우를 위해 모두 뺀 뒤 다시 넣는다
+            selected = item.is_selected
+            self.selection.discard(item)
+            if not self.show_hidden and new_name.startswith("."):
+                if current is item:
+                    current = None
+                continue
+            new = item.renamed(new_name)
+            if selected:
+                reselect.append(new)
+            if current is item:
+                current = new
+            body.append(new)
+        self.selection.update(reselect)
+        self.items[start:] = sort_items(body, self.sort_by, self.sort_reverse)
+        for old_name, new_name in moves.items():
+            left[self.current_path / old_name] = self.current_path / new_name
+
+        if current is not None:
+            self.cursor_index = next(i for i, item in enumerate(self.items) if item is current)
+        self.cursor_index = min(self.cursor_index, max(0, len(self.items) - 1))
+        return left
+
+    def _same_position(self, old: FileItem, new: FileItem) -> bool:
+        """교체해도 정렬 위치가 그대로인지 (같은 그룹, 같은 정렬 키)."""
+        if old.is_dir != new.is_dir:
+            return False
+        key_fn = _group_key(self.sort_by, old.is_dir)
+        return key_fn(old) == key_fn(new)
+
+    def _insert_sorted(self, item: FileItem) -> int:
+        """정렬 순서를 유지하며 항목 삽입 (그룹 안에서 이진 탐색). 삽입한 인덱스 반환."""
+        start = self._body_start()
+        split = self._dir_count_end(start)
+        lo, hi = (start, split) if item.is_dir else (split, len(self.items))
+        key_fn = _group_key(self.sort_by, item.is_dir)
+        key = key_fn(item)
+        if self.sort_reverse:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if key_fn(self.items[mid]) >= key:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            pos = lo
+        else:
+            pos = bisect_right(self.items, key, lo, hi, key=key_fn)
+        self.items.insert(pos, item)
+        return pos
+
+    def _dir_count_end(self, start: int) -> int:
+        """정렬된 목록에서 디렉토리 그룹이 끝나는 인덱스 (이진 탐색)."""
+        return bisect_left(self.items, True, lo=start, key=lambda i: not i.is_dir)
+
+    @property
+    def entry_count(self) -> int:
+        """'..' 를 제외한 항목 수 (O(1))."""
+        return len(self.items) - self._body_start()
 
     def disk_info(self) -> tuple[int, int]:
-        """(free_bytes, total_bytes) 반환."""
-        try:
-            stat = os.statvfs(str(self.current_path)) if os.name != "nt" else None
-            if stat:
-                return stat.f_bavail * stat.f_frsize, stat.f_blocks * stat.f_frsize
-            # Windows
-            import shutil
-            usage = shutil.disk_usage(str(self.current_path))
-            return usage.free, usage.total
-        except Exception:
+        """(free_bytes, total_bytes) 반환.
+
+        disk_usage 캐시가 있으면 현재 마운트의 캐시 값만 읽는다 (시스템 호출 없음,
+        아직 읽지 않았으면 (0, 0)). 캐시가 없으면 직접 읽는다.
+        """
+        if self.disk_usage is None:
+            return read_disk_usage(self.current_path)
+        if self._device is None:
             return 0, 0
+        return self.disk_usage.get(self._device) or (0, 0)
+
+    def refresh_disk_info(self, force: bool = False) -> None:
+        """현재 마운트의 디스크 용량 캐시 갱신 (시스템 호출 — 워커 스레드에서 호출)."""
+        if self.disk_usage is not None and self._device is not None:
+            self.disk_usage.refresh(self.current_path, self._device, force)
 
 
 def format_size(size: int) -> str:
@@ -0,0 +1,148 @@
+"""디렉토리 목록 캐시 (두 패널 공용).
+
+키: (해석된 경로, 숨김 표시 여부)
+검증: 디렉토리의 (st_dev, st_ino, st_mtime_ns) 가 저장 시점과 같아야 적중.
+디렉토리 mtime 은 항목 추가/삭제/이름변경 시 바뀌므로, 같은 디렉토리로
+돌아왔을 때 변경이 없으면 전체 재스캔 없이 목록을 재사용한다.
+(파일 내용만 바뀐 경우 디렉토리 mtime 이 바뀌지 않는 점은 감수한다.)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mdir.models.file_item import FileItem
+
+DirSignature = tuple[int, int, int]  # (st_dev, st_ino, st_mtime_ns)
+
+# 항목당 메모리 사용량 추정치 (바이트) — 이름 길이는 별도로 더함
+_ITEM_BYTES_ESTIMATE = 600
+
+# 스캔 시점과 디렉토리 mtime 이 이 간격 안이면 "racy" 로 간주한다.
+# 같은 타임스탬프 틱 안에서 스캔 직후 일어난 변경은 mtime 으로 구분할 수 없으므로
+# racy 항목은 _RACY_TTL 동안만 사용하고 이후에는 다시 스캔한다.
+_RACY_WINDOW_NS = 2_000_000_000
+_RACY_TTL = 1.0
+
+
+def dir_signature(path: Path) -> DirSignature | None:
+    """디렉토리의 캐시 검증 서명 반환. stat 실패 시 None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino, st.st_mtime_ns
+
+
+@dataclass
+class _CacheEntry:
+    signature: DirSignature
+    items: list[FileItem]
+    nbytes: int
+    racy_until: float | None = None  # racy 항목의 유효 기한 (time.monotonic 기준)
+
+
+class ListingCache:
+    """LRU 방식 디렉토리 목록 캐시.
+
+    max_entries / max_bytes 중 하나라도 넘으면 가장 오래 사용하지 않은
+    목록부터 제거한다. 반환되는 FileItem 은 매번 복제본이므로
+    한 패널의 선택 상태가 다른 패널로 새지 않는다.
+    패널 로드 워커 스레드에서도 조회하므로 모든 접근은 잠금 안에서 한다.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[Path, bool], _CacheEntry] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """현재 캐시된 목록의 추정 메모리 사용량."""
+        return self._nbytes
+
+    def get(
+        self, path: Path, show_hidden: bool, signature: DirSignature | None
+    ) -> list[FileItem] | None:
+        """서명이 일치하는 캐시 목록의 복제본 반환. 없거나 무효면 None."""
+        key = (path, show_hidden)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or signature is None:
+                self.misses += 1
+                return None
+            expired = entry.racy_until is not None and time.monotonic() > entry.racy_until
+            if entry.signature != signature or expired:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            items = entry.items
+        return [item.clone() for item in items]
+
+    def put(
+        self,
+        path: Path,
+        show_hidden: bool,
+        signature: DirSignature | None,
+        items: list[FileItem],
+        scan_started_ns: int | None = None,
+    ) -> None:
+        """목록 저장. signature 는 스캔 시작 전에 얻은 값이어야 한다.
+
+        scan_started_ns: 스캔 시작 시각 (time.time_ns). racy 판정에 사용.
+        """
+        if signature is None:
+            return
+        key = (path, show_hidden)
+        nbytes = sum(_ITEM_BYTES_ESTIMATE + len(item.name) for item in items)
+        racy_until = None
+        started = scan_started_ns if scan_started_ns is not None else time.time_ns()
+        if started - signature[2] < _RACY_WINDOW_NS:
+            racy_until = time.monotonic() + _RACY_TTL
+
+        with self._lock:
+            self._remove(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = _CacheEntry(signature, list(items), nbytes, racy_until)
+            self._nbytes += nbytes
+            self._evict()
+
+    def invalidate(self, path: Path) -> None:
+        """경로의 캐시 목록 제거 (숨김 표시 여부와 무관하게)."""
+        with self._lock:
+            for show_hidden in (False, True):
+                self._remove((path, show_hidden))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _remove(self, key: tuple[Path, bool]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry.nbytes
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._nbytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._nbytes -= entry.nbytes
@@ -0,0 +1,83 @@
+"""패널 다중 선택 모델."""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mdir.models.file_item import FileItem
+
+
+class Selection:
+    """선택된 항목 집합.
+
+    한 디렉토리 안에서 유일한 항목 이름(인터닝된 str)을 키로 쓰므로
+    Path 해시 없이 토글/포함 검사가 O(1), 선택 항목 조회가 O(k) 이다.
+    항목의 is_selected 플래그(화면 표시용)도 함께 갱신하며,
+    선택 개수와 선택 항목의 총 크기를 누적해 둔다.
+    """
+
+    def __init__(self) -> None:
+        self._items: dict[str, FileItem] = {}
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __contains__(self, item: FileItem) -> bool:
+        return item.name in self._items
+
+    def __iter__(self) -> Iterator[FileItem]:
+        return iter(self._items.values())
+
+    def items(self) -> list[FileItem]:
+        """선택된 항목 목록 (선택한 순서)."""
+        return list(self._items.values())
+
+    def add(self, item: FileItem) -> None:
+        if item.name == ".." or item.name in self._items:
+            return
+        self._items[item.name] = item
+        item.is_selected = True
+        if not item.is_dir:
+            self.total_bytes += item.size
+
+    def discard(self, item: FileItem) -> None:
+        selected = self._items.pop(item.name, None)
+        if selected is None:
+            return
+        selected.is_selected = False
+        item.is_selected = False
+        if not selected.is_dir:
+            self.total_bytes -= selected.size
+
+    def toggle(self, item: FileItem) -> bool:
+        """선택 토글. 토글 후 선택 여부 반환."""
+        if item in self:
+            self.discard(item)
+            return False
+        self.add(item)
+        return item.name in self._items
+
+    def update(self, items: Iterable[FileItem]) -> None:
+        for item in items:
+            self.add(item)
+
+    def clear(self) -> None:
+        for item in self._items.values():
+            item.is_selected = False
+        self._items.clear()
+        self.total_bytes = 0
+
+
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    """glob 패턴 (대소문자 무시) → 정규식. 여러 패턴은 ';' 로 구분."""
+    parts = [p.strip() for p in pattern.split(";") if p.strip()]
+    regex = "|".join(f"(?:{fnmatch.translate(p.casefold())})" for p in parts) or "(?!)"
+    return re.compile(regex)
@@ -0,0 +1,52 @@
+"""파일 작업 취소·일시정지 토큰.
+
+UI 가 cancel() 을 부르면 작업 스레드가 항목 사이사이(큰 파일은 덩어리 사이)에
+cancelled 를 보고 멈춘다. 작업 함수는 멈춘 뒤 OperationCancelledError 를 일으킨다.
+pause() 하면 check() / wait_if_paused() 를 부른 스레드가 resume() 이나 cancel()
+때까지 그 자리에서 기다린다.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from mdir.operations.exceptions import OperationCancelledError
+
+
+class CancelToken:
+    """작업 하나의 취소·일시정지 요청 (여러 스레드에서 읽어도 안전)."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+        # 일시정지 중에 기다리던 스레드도 깨워 취소를 보게 한다
+        self._running.set()
+
+    def pause(self) -> None:
+        if not self.cancelled:
+            self._running.clear()
+
+    def resume(self) -> None:
+        self._running.set()
+
+    def wait_if_paused(self) -> None:
+        """일시정지 중이면 재개되거나 취소될 때까지 기다림."""
+        self._running.wait()
+
+    def check(self) -> None:
+        """일시정지 중이면 기다린 뒤, 취소됐으면 OperationCancelledError."""
+        self._running.wait()
+        if self._event.is_set():
+            raise OperationCancelledError()
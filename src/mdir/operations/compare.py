@@ -0,0 +1,259 @@
+"""두 폴더 비교 (패널 목록 또는 하위 트리 전체).
+
+항목은 상대 경로로 짝을 짓는다. 파일은 크기가 다르면 다름, 크기와 mtime_ns 가
+모두 같으면 같음으로 메타데이터만 보고 정한다. 크기는 같은데 mtime 만 다른
+파일(복사 후 시각이 바뀐 경우 등)만 내용을 읽어 비교하며, 두 파일을 덩어리로
+나란히 읽다가 처음 다른 곳에서 멈춘다. 심링크는 대상 문자열로 비교한다.
+
+결과는 최상위 이름(패널에 보이는 항목) 기준으로 양쪽에 표시할 항목을 돌려준다.
+하위 트리 비교에서는 안쪽 어디든 다르면 그 최상위 폴더가 표시된다.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from mdir.models.file_item import FileItem
+from mdir.operations.cancel import CancelToken
+from mdir.operations.device import default_workers
+from mdir.operations.exceptions import FileOperationError
+from mdir.operations.fastcopy import USERSPACE_BUFFER_SIZE
+from mdir.operations.progress import OperationProgress
+from mdir.operations.walk import KIND_DIR, KIND_FILE, KIND_OTHER, KIND_SYMLINK
+
+
+@dataclass
+class CompareResult:
+    """비교 결과. 목록은 루트 기준 상대 경로.
+
+    different: 양쪽에 있지만 내용·종류가 다른 항목
+    content_checked: 메타데이터로 정하지 못해 내용을 읽어 비교한 파일 수
+    """
+
+    left_only: list[str] = field(default_factory=list)
+    right_only: list[str] = field(default_factory=list)
+    different: list[str] = field(default_factory=list)
+    same: int = 0
+    content_checked: int = 0
+
+    @property
+    def identical(self) -> bool:
+        return not (self.left_only or self.right_only or self.different)
+
+    def left_marks(self) -> set[str]:
+        """왼쪽 패널에서 표시할 최상위 이름."""
+        return {_top(rel) for rel in [*self.left_only, *self.different]}
+
+    def right_marks(self) -> set[str]:
+        """오른쪽 패널에서 표시할 최상위 이름."""
+        return {_top(rel) for rel in [*self.right_only, *self.different]}
+
+    def summary(self) -> str:
+        """예: '다름 3개, 왼쪽에만 2개, 오른쪽에만 0개, 같음 120개 (내용 비교 4개)'."""
+        text = (
+            f"다름 {len(self.different)}개, 왼쪽에만 {len(self.left_only)}개, "
+            f"오른쪽에만 {len(self.right_only)}개, 같음 {self.same}개"
+        )
+        if self.content_checked:
+            text += f" (내용 비교 {self.content_checked}개)"
+        return text
+
+    def sort(self) -> None:
+        self.left_only.sort()
+        self.right_only.sort()
+        self.different.sort()
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    """비교에 필요한 항목 정보 (FileItem / DirEntry 공통)."""
+
+    path: str
+    kind: str  # walk.KIND_*
+    size: int = 0
+    mtime_ns: int = 0
+
+
+def compare_listings(
+    left: list[FileItem],
+    right: list[FileItem],
+    cancel: CancelToken | None = None,
+    workers: int = 4,
+) -> CompareResult:
+    """두 패널의 현재 목록 비교 (폴더는 양쪽에 있으면 같음 — 안으로 들어가지 않음).
+
+    목록에 이미 있는 크기/시각을 쓰므로 내용 비교가 필요한 파일 말고는 시스템 콜이 없다.
+    """
+    result = CompareResult()
+    candidates: list[tuple[str, str, str]] = []
+    _match(
+        "",
+        {i.name: _from_item(i) for i in left if i.name != ".."},
+        {i.name: _from_item(i) for i in right if i.name != ".."},
+        result,
+        candidates,
+    )
+    _check_contents(candidates, result, workers, cancel)
+    result.sort()
+    return result
+
+
+def compare_trees(
+    left_root: Path,
+    right_root: Path,
+    names: set[str] | None = None,
+    progress: OperationProgress | None = None,
+    cancel: CancelToken | None = None,
+    workers: int | None = None,
+) -> CompareResult:
+    """두 폴더의 하위 트리 전체 비교. 디렉토리 한 쌍씩 작업 스레드에서 읽는다.
+
+    - names: 주어지면 루트 바로 아래의 그 이름들만 비교 (패널에 보이는 항목)
+    - progress: 비교한 항목 수 기록 (준비 단계로 표시)
+    - cancel: 취소되면 OperationCancelledError
+    Raises: FileOperationError, OperationCancelledError
+    """
+    if workers is None:
+        workers = default_workers(left_root, right_root)
+    result = CompareResult()
+    candidates: list[tuple[str, str, str]] = []
+
+    def scan(rel: str, top_names: set[str] | None = None):
+        if cancel is not None and cancel.cancelled:
+            return {}, {}
+        left = _scan_dir(os.path.join(left_root, rel), top_names)
+        right = _scan_dir(os.path.join(right_root, rel), top_names)
+        if progress is not None:
+            progress.add_total(len(left) + len(right), 0)
+        return left, right
+
+    try:
+        with ThreadPoolExecutor(max(1, workers), thread_name_prefix="mdir-compare") as pool:
+            pending = {pool.submit(scan, "", names): ""}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rel = pending.pop(future)
+                    left, right = future.result()
+                    for sub in _match(rel, left, right, result, candidates):
+                        pending[pool.submit(scan, sub)] = sub
+            _check_contents(candidates, result, workers, cancel, pool)
+    except OSError as e:
+        path = Path(e.filename) if e.filename else left_root
+        raise FileOperationError(f"비교 실패: {path.name} — {e}", path) from e
+    result.sort()
+    return result
+
+
+def same_content(a: str, b: str, chunk: int = USERSPACE_BUFFER_SIZE) -> bool:
+    """두 파일의 내용이 같은지 (덩어리씩 나란히 읽다가 다르면 바로 멈춤)."""
+    with open(a, "rb", buffering=0) as fa, open(b, "rb", buffering=0) as fb:
+        while True:
+            da = fa.read(chunk)
+            db = fb.read(chunk)
+            if da != db:
+                return False
+            if not da:
+                return True
+
+
+def _match(
+    rel: str,
+    left: dict[str, _Entry],
+    right: dict[str, _Entry],
+    result: CompareResult,
+    candidates: list[tuple[str, str, str]],
+) -> list[str]:
+    """한 디렉토리 쌍의 항목 짝짓기. 양쪽에 다 있는 하위 디렉토리 목록 반환."""
+    subdirs: list[str] = []
+    for name, a in left.items():
+        child = os.path.join(rel, name) if rel else name
+        b = right.get(name)
+        if b is None:
+            result.left_only.append(child)
+        elif a.kind != b.kind:
+            result.different.append(child)
+        elif a.kind == KIND_DIR:
+            subdirs.append(child)
+            result.same += 1
+        elif a.kind == KIND_SYMLINK:
+            if os.readlink(a.path) == os.readlink(b.path):
+                result.same += 1
+            else:
+                result.different.append(child)
+        elif a.size != b.size:
+            result.different.append(child)
+        elif a.mtime_ns == b.mtime_ns or a.kind != KIND_FILE:
+            result.same += 1
+        else:
+            # 크기는 같고 시각만 다름 — 내용을 읽어야 알 수 있다
+            candidates.append((child, a.path, b.path))
+    result.right_only.extend(
+        os.path.join(rel, name) if rel else name for name in right if name not in left
+    )
+    return subdirs
+
+
+def _check_contents(
+    candidates: list[tuple[str, str, str]],
+    result: CompareResult,
+    workers: int,
+    cancel: CancelToken | None,
+    pool: ThreadPoolExecutor | None = None,
+) -> None:
+    """메타데이터로 정하지 못한 파일들만 내용 비교 (병렬)."""
+    if cancel is not None:
+        cancel.check()
+    if not candidates:
+        return
+    if pool is None:
+        with ThreadPoolExecutor(max(1, workers), thread_name_prefix="mdir-compare") as own:
+            _check_contents(candidates, result, workers, cancel, own)
+        return
+
+    def check(a: str, b: str) -> bool:
+        if cancel is not None and cancel.cancelled:
+            return True
+        return same_content(a, b)
+
+    futures = [pool.submit(check, a, b) for _, a, b in candidates]
+    for (rel, _, _), future in zip(candidates, futures, strict=True):
+        if future.result():
+            result.same += 1
+        else:
+            result.different.append(rel)
+    result.content_checked += len(candidates)
+    if cancel is not None:
+        cancel.check()
+
+
+def _scan_dir(path: str, names: set[str] | None) -> dict[str, _Entry]:
+    entries: dict[str, _Entry] = {}
+    with os.scandir(path) as it:
+        for entry in it:
+            if names is not None and entry.name not in names:
+                continue
+            if entry.is_symlink():
+                entries[entry.name] = _Entry(entry.path, KIND_SYMLINK)
+            elif entry.is_dir(follow_symlinks=False):
+                entries[entry.name] = _Entry(entry.path, KIND_DIR)
+            else:
+                st = entry.stat(follow_symlinks=False)
+                kind = KIND_FILE if entry.is_file(follow_symlinks=False) else KIND_OTHER
+                entries[entry.name] = _Entry(entry.path, kind, st.st_size, st.st_mtime_ns)
+    return entries
+
+
+def _from_item(item: FileItem) -> _Entry:
+    if item.is_symlink:
+        return _Entry(str(item.path), KIND_SYMLINK)
+    if item.is_dir:
+        return _Entry(str(item.path), KIND_DIR)
+    return _Entry(str(item.path), KIND_FILE, item.size, item.mtime_ns)
+
+
+def _top(rel: str) -> str:
+    return rel.split(os.sep, 1)[0]
@@ -1,15 +1,42 @@
 """파일/폴더 복사 작업."""
 
+import contextlib
+import errno
+import os
 import shutil
-from collections.abc import Callable
+import sys
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from mdir.models.changes import ChangeSet
 from mdir.models.file_item import FileItem
-from mdir.operations.exceptions import DiskFullError, FileOperationError, PermissionDeniedError
+from mdir.operations.cancel import CancelToken
+from mdir.operations.device import default_workers
+from mdir.operations.exceptions import (
+    DiskFullError,
+    FileOperationError,
+    OperationCancelledError,
+    PermissionDeniedError,
+)
+from mdir.operations.fastcopy import copy_file
+from mdir.operations.journal import CHECKPOINT_BYTES, CopyJournal
+from mdir.operations.progress import OperationProgress
+from mdir.operations.verify import VERIFY_MISMATCH, VerifyOptions, VerifyReport, copy_verified
+from mdir.operations.walk import KIND_DIR, KIND_SYMLINK, tree_totals, walk_tree
 
 # 충돌 해결 최대 시도 횟수 (VULN-05)
 _MAX_CONFLICT_RETRIES = 999
 
+# 작업 스레드당 대기열에 미리 넣어 둘 수 있는 파일 수 (메모리 사용량 상한)
+_QUEUE_PER_WORKER = 4
+
+# 대소문자를 구분하지 않는 파일시스템이 기본인 OS
+_CASE_INSENSITIVE = sys.platform in ("darwin", "win32")
+
 
 def resolve_conflict(dest: Path) -> Path:
     """이름 충돌 시 새 이름을 자동 생성.
@@ -38,37 +65,548 @@ def resolve_conflict(dest: Path) -> Path:
     return candidate
 
 
+class ConflictResolver:
+    """작업 하나의 이름 충돌 해결기 (resolve_conflict 와 같은 이름 규칙).
+
+    대상 폴더의 이름을 처음 한 번만 읽어 집합으로 두고 후보 이름을 메모리에서
+    고른다. 고른 이름은 예약되어 같은 작업의 다른 항목과 겹치지 않는다.
+    읽은 뒤에 다른 프로그램이 만든 이름은 모르므로, 실제 생성은 create_unique()
+    로 배타적으로 하고 이미 있으면 다음 후보로 넘어간다 (VULN-03).
+    """
+
+    def __init__(self, dest_dir: Path) -> None:
+        self.dest_dir = dest_dir
+        self._names: set[str] | None = None
+
+    def resolve(self, name: str) -> Path:
+        """쓰이지 않은 이름을 골라 예약. 후보 _MAX_CONFLICT_RETRIES 개를 넘으면 실패 (VULN-05)."""
+        names = self._load()
+        for candidate in _candidate_names(name):
+            key = _name_key(candidate)
+            if key not in names:
+                names.add(key)
+                return self.dest_dir / candidate
+        raise FileOperationError(f"충돌 해결 실패: {name} — 대체 이름을 찾을 수 없습니다.")
+
+    def release(self, path: Path) -> None:
+        """예약 취소 (그 이름을 결국 만들지 않은 경우)."""
+        if self._names is not None:
+            self._names.discard(_name_key(path.name))
+
+    def create_unique(self, name: str, create: Callable[[Path], None]) -> Path:
+        """resolve() 로 고른 경로에 create(path) 실행. 그 사이 생긴 이름이면 다음 후보로.
+
+        create 는 대상이 이미 있으면 FileExistsError 를 내야 한다
+        (os.mkdir, os.symlink, O_EXCL 열기).
+        """
+        while True:
+            dest = self.resolve(name)
+            try:
+                create(dest)
+            except FileExistsError:
+                continue
+            return dest
+
+    def _load(self) -> set[str]:
+        if self._names is None:
+            with os.scandir(self.dest_dir) as it:
+                self._names = {_name_key(entry.name) for entry in it}
+        return self._names
+
+
+def _name_key(name: str) -> str:
+    return name.casefold() if _CASE_INSENSITIVE else name
+
+
+def _candidate_names(name: str) -> Iterator[str]:
+    """name, stem_copy.ext, stem_copy2.ext, … (resolve_conflict 와 같은 순서)."""
+    path = Path(name)
+    stem = path.stem
+    suffix = path.suffix
+    base = f"{stem}_copy" if not stem.endswith("_copy") else stem
+    yield name
+    yield f"{base}{suffix}"
+    for counter in range(2, _MAX_CONFLICT_RETRIES + 1):
+        yield f"{base}{counter}{suffix}"
+
+
+def create_empty_file(path: Path) -> None:
+    """빈 파일을 배타적으로 만들어 이름을 선점 (이미 있으면 FileExistsError)."""
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC, 0o666))
+
+
+@dataclass
+class CopyReport:
+    """복사 작업 결과 요약: 복사한 파일 수와 데이터 복사 방법별 파일 수.
+
+    skipped: 이어하기에서 이미 복사된 것으로 확인돼 건너뛴 파일 수
+    discarded: 실패·취소로 복사가 중간에 멈춰 지운 파일 수
+    """
+
+    files: int = 0
+    methods: Counter[str] = field(default_factory=Counter)
+    skipped: int = 0
+    discarded: int = 0
+
+    def summary(self) -> str:
+        """예: 'reflink 120, copy_file_range 3, 건너뜀 40'."""
+        parts = [f"{method} {count}" for method, count in self.methods.most_common()]
+        if self.skipped:
+            parts.append(f"건너뜀 {self.skipped}")
+        if self.discarded:
+            parts.append(f"덜 복사된 파일 {self.discarded}개 삭제")
+        return ", ".join(parts)
+
+
+class CopyTaskError(Exception):
+    """작업 스레드에서 실패한 파일 복사 (원래 예외와 경로 보관).
+
+    CopyEngine.finish() 가 일으킨다. 호출한 쪽은 map_copy_error 로 사용자에게 보여줄
+    예외로 바꾼다.
+    """
+
+    def __init__(self, error: OSError, src: str, dest: str) -> None:
+        super().__init__(str(error))
+        self.error = error
+        self.src = src
+        self.dest = dest
+
+
+class CopyEngine:
+    """트리를 한 번 순회하며 파일 복사를 제한된 스레드 풀로 보내는 복사 엔진.
+
+    - 디렉토리는 순회하는 스레드가 자식보다 먼저 만든다
+    - 파일 내용/메타데이터: fastcopy.copy_file (reflink → copy_file_range →
+      sendfile → 사용자 공간 순으로 시도, copy2 와 같은 결과). 작업 스레드에서 실행
+    - 심링크: 따라가지 않고 링크 자체를 다시 만든다 (VULN-02)
+    - 디렉토리 메타데이터는 내용 복사가 모두 끝난 뒤 적용 (copytree 와 같음)
+    - 대기열 크기를 제한해 파일이 수십만 개여도 메모리가 늘지 않는다
+    첫 오류가 나면 새 작업을 보내지 않고, finish() 에서 그 오류를 다시 일으킨다.
+    progress 가 주어지면 복사한 바이트와 파일 수를 더한다.
+    journal 이 주어지면 끝난 파일과 큰 파일의 중간 지점을 기록하고,
+    이미 끝난 파일은 건너뛰며 중간까지 복사된 파일은 그 위치부터 잇는다.
+    remove_source 이면 이동: 파일은 복사 후 크기를 확인한 즉시 원본을 지우고
+    (추가로 필요한 공간은 복사 중인 파일만큼), 원본 디렉토리는 finish() 에서 지운다.
+    verify 가 주어지면 파일마다 복사하며 해시하고 대상과 비교해 verify_report 에
+    기록한다 (verify.copy_verified). 저널과 함께 쓰면 중간 지점에서 잇지 않고
+    파일을 처음부터 다시 복사한다 (해시는 원본 전체를 읽어야 하므로).
+    cancel 이 주어지면 파일을 시작하기 전과 데이터 덩어리마다 확인한다. 일시정지 중이면
+    그 자리에서 기다리고, 취소되면 새 파일을 시작하지 않으며 복사하던 파일은 지운다
+    (원본은 그대로 — 이동에서도 복사가 끝난 파일만 원본을 지운다). 저널이 있으면
+    복사하던 파일을 남겨 두어 다음 실행이 마지막 중간 지점부터 잇는다. finish() 는
+    OperationCancelledError 를 일으킨다. 오류로 실패한 파일도 취소와 같이 지우고,
+    실패·취소되면 close() 가 복사를 시작하지 못한 선점 파일과 빈 디렉토리를 지운다.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        report: CopyReport | None = None,
+        progress: OperationProgress | None = None,
+        journal: CopyJournal | None = None,
+        remove_source: bool = False,
+        verify: VerifyOptions | None = None,
+        verify_report: VerifyReport | None = None,
+        cancel: CancelToken | None = None,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.cancel = cancel
+        self.remove_source = remove_source
+        self.verify = verify
+        if verify is not None and verify_report is None:
+            verify_report = VerifyReport(verify.algorithm)
+        self.verify_report = verify_report
+        self.report = report if report is not None else CopyReport()
+        self.progress = progress
+        self.journal = journal
+        self._on_bytes = progress.advance if progress is not None else None
+        if cancel is not None:
+            self._on_bytes = self._checking(self._on_bytes, cancel)
+        # 스레드가 1개면 풀을 거치지 않고 순회하는 스레드에서 바로 복사 (전환 비용 없음)
+        self._pool = (
+            ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="mdir-copy")
+            if self.workers > 1
+            else None
+        )
+        self._slots = threading.BoundedSemaphore(self.workers * _QUEUE_PER_WORKER)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._error: CopyTaskError | None = None
+        self._dirs: list[tuple[str, str]] = []
+        # 이름을 선점하려고 미리 만든 빈 파일/디렉토리 중 아직 채우기 시작하지 않은 것
+        # (경로 → 디렉토리 여부)
+        self._placeholders: dict[str, bool] = {}
+        self._finished = False
+
+    @property
+    def failed(self) -> bool:
+        return (
+            self._error is not None
+            or self._stopped.is_set()
+            or (self.cancel is not None and self.cancel.cancelled)
+        )
+
+    @property
+    def _resumable(self) -> bool:
+        """취소된 파일을 저널에 기록한 지점부터 이을 수 있는지 (검증·이동은 처음부터 다시)."""
+        return self.journal is not None and self.verify is None and not self.remove_source
+
+    def add_placeholder(self, path: str, is_dir: bool = False) -> None:
+        """이름 선점용으로 방금 만든 빈 파일/디렉토리 등록.
+
+        복사를 시작하기 전에 작업이 실패하거나 취소되면 close() 가 지운다.
+        """
+        with self._lock:
+            self._placeholders[path] = is_dir
+
+    def copy_file(
+        self,
+        src: str,
+        dest: str,
+        src_stat: os.stat_result | None = None,
+        replace: str | None = None,
+    ) -> bool:
+        """파일 하나를 작업 스레드로 보냄 (대기열이 차 있으면 빌 때까지 기다림).
+
+        replace: dest 는 임시 이름. 복사가 끝나면 os.replace 로 이 경로의 파일과
+          바꾸고, 실패·취소되면 임시 파일만 지운다 (기존 파일은 그대로)
+        Returns: 작업을 받았으면 True. 이미 실패·취소되어 받지 않았으면 False
+        """
+        self._slots.acquire()
+        if self.failed:
+            self._slots.release()
+            return False
+        if self._pool is None:
+            self._run(src, dest, src_stat, replace)
+        else:
+            self._pool.submit(self._run, src, dest, src_stat, replace)
+        return True
+
+    def copy_tree(
+        self, src: str, dest: str, resume: bool = False, create_root: bool = True
+    ) -> None:
+        """디렉토리 트리 복사. 순회와 디렉토리 생성은 호출한 스레드에서 한다.
+
+        resume: 이전 실행이 만든 대상 트리에 이어서 복사 (있는 디렉토리/링크는 그대로 둠)
+        create_root: False 면 dest 는 이미 만들어 둔 빈 디렉토리 (이름 선점)
+        """
+        for entry in walk_tree(src, should_stop=lambda: self.failed):
+            if self.cancel is not None:
+                self.cancel.wait_if_paused()
+            target = os.path.join(dest, entry.rel) if entry.rel else dest
+            if entry.kind == KIND_DIR:
+                try:
+                    if entry.rel or create_root:
+                        os.mkdir(target)
+                except FileExistsError:
+                    if not (resume and os.path.isdir(target) and not os.path.islink(target)):
+                        raise
+                self._dirs.append((entry.path, target))
+            elif entry.kind == KIND_SYMLINK:
+                if resume and os.path.lexists(target):
+                    continue
+                os.symlink(os.readlink(entry.path), target)
+                shutil.copystat(entry.path, target, follow_symlinks=False)
+                if self.remove_source:
+                    os.unlink(entry.path)
+            else:
+                self.copy_file(entry.path, target, entry.stat)
+        if not self.failed:
+            with self._lock:
+                self._placeholders.pop(dest, None)
+
+    def finish(self) -> None:
+        """남은 작업을 모두 기다린 뒤 디렉토리 메타데이터 적용. 실패했으면 예외."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+        if self._error is not None:
+            raise self._error
+        if self.cancel is not None and self.cancel.cancelled:
+            raise OperationCancelledError()
+        for src, dest in reversed(self._dirs):
+            shutil.copystat(src, dest)
+            if self.remove_source:
+                # 자식이 모두 옮겨진 뒤이므로 비어 있다 (아래에서 위로)
+                os.rmdir(src)
+        self._dirs.clear()
+        self._finished = True
+
+    def close(self) -> None:
+        """정리: 대기 중인 작업을 버리고 실행 중인 작업만 기다림 (finish 뒤에 호출해도 됨).
+
+        finish() 까지 끝내지 못했으면 (실패·취소) 채우지 못한 선점 파일과 빈 디렉토리를
+        지운다. 복사를 마친 파일과 그 파일이 든 디렉토리는 남는다.
+        """
+        self._stopped.set()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        if not self._finished:
+            # 하위 디렉토리부터 (비어 있지 않으면 rmdir 이 실패하므로 그대로 남는다)
+            for _src, dest in reversed(self._dirs):
+                _rmdir_quietly(dest)
+            for dest, is_dir in self._placeholders.items():
+                if is_dir:
+                    _rmdir_quietly(dest)
+                else:
+                    _unlink_quietly(dest)
+        self._dirs.clear()
+        self._placeholders.clear()
+
+    def _run(
+        self,
+        src: str,
+        dest: str,
+        src_stat: os.stat_result | None = None,
+        replace: str | None = None,
+    ) -> None:
+        started = False
+        try:
+            if not self.failed:
+                if self.cancel is not None:
+                    self.cancel.check()
+                started = True
+                with self._lock:
+                    self._placeholders.pop(dest, None)
+                if self.remove_source:
+                    method = self._move_file(src, dest, src_stat or os.stat(src))
+                elif self.verify is not None:
+                    method = self._run_verified(src, dest, src_stat)
+                elif self.journal is None:
+                    method = copy_file(src, dest, on_bytes=self._on_bytes)
+                else:
+                    method = self._run_journaled(src, dest, src_stat or os.stat(src))
+                if replace is not None:
+                    os.replace(dest, replace)
+                with self._lock:
+                    if method is None:
+                        self.report.skipped += 1
+                    else:
+                        self.report.files += 1
+                        self.report.methods[method] += 1
+                if self.progress is not None:
+                    self.progress.file_done()
+        except OperationCancelledError:
+            self._discard(dest, started, replace)
+        except OSError as e:
+            self._discard(dest, started, replace)
+            with self._lock:
+                if self._error is None:
+                    self._error = CopyTaskError(e, src, replace or dest)
+        finally:
+            self._slots.release()
+
+    def _discard(self, dest: str, started: bool, replace: str | None) -> None:
+        """실패·취소된 파일의 중간까지 쓴 대상 파일을 지움 (저널로 이을 수 있으면 남김)."""
+        if started and (replace is not None or not self._resumable):
+            _unlink_quietly(dest)
+            with self._lock:
+                self.report.discarded += 1
+
+    @staticmethod
+    def _checking(
+        on_bytes: Callable[[int], None] | None, cancel: CancelToken
+    ) -> Callable[[int], None]:
+        """on_bytes 를 감싸 데이터 덩어리마다 일시정지·취소 확인."""
+
+        def checked(n: int) -> None:
+            if on_bytes is not None:
+                on_bytes(n)
+            cancel.check()
+
+        return checked
+
+    def _move_file(self, src: str, dest: str, src_stat: os.stat_result) -> str:
+        """복사 후 대상 크기가 원본과 같을 때만 원본 삭제."""
+        method = copy_file(src, dest, on_bytes=self._on_bytes)
+        if os.stat(dest).st_size != src_stat.st_size:
+            raise OSError(errno.EIO, "복사한 파일의 크기가 원본과 다릅니다", dest)
+        os.unlink(src)
+        return method
+
+    def _run_journaled(self, src: str, dest: str, src_stat: os.stat_result) -> str | None:
+        """저널을 보고 건너뛰거나 이어서 복사. 건너뛰었으면 None."""
+        journal = self.journal
+        if journal.is_done(dest, src_stat):
+            if self.progress is not None:
+                self.progress.advance(src_stat.st_size)
+            return None
+        offset = journal.resume_offset(dest, src_stat)
+        if offset and self.progress is not None:
+            self.progress.advance(offset)
+        method = copy_file(
+            src,
+            dest,
+            on_bytes=self._on_bytes,
+            resume_from=offset,
+            checkpoint=lambda done: journal.checkpoint(dest, src_stat, done),
+            checkpoint_every=CHECKPOINT_BYTES,
+        )
+        journal.file_done(dest, src_stat)
+        return method
+
+    def _run_verified(self, src: str, dest: str, src_stat: os.stat_result | None) -> str | None:
+        """복사하며 검증하고 결과를 verify_report 에 기록. 저널에서 건너뛰었으면 None."""
+        journal = self.journal
+        if journal is not None:
+            src_stat = src_stat or os.stat(src)
+            if journal.is_done(dest, src_stat):
+                if self.progress is not None:
+                    self.progress.advance(src_stat.st_size)
+                return None
+        result = copy_verified(src, dest, self.verify, on_bytes=self._on_bytes)
+        with self._lock:
+            self.verify_report.results.append(result)
+        # 불일치한 파일은 끝난 것으로 기록하지 않는다 (다시 실행하면 또 복사)
+        if journal is not None and result.status != VERIFY_MISMATCH:
+            journal.file_done(dest, src_stat)
+        return result.method
+
+
 def copy_items(
     items: list[FileItem],
     dest_dir: Path,
     on_progress: Callable[[str], None] | None = None,
+    changes: ChangeSet | None = None,
+    workers: int | None = None,
+    report: CopyReport | None = None,
+    progress: OperationProgress | None = None,
+    journal: CopyJournal | None = None,
+    verify: VerifyOptions | None = None,
+    verify_report: VerifyReport | None = None,
+    cancel: CancelToken | None = None,
 ) -> list[Path]:
     """파일/폴더를 dest_dir 로 복사.
 
-    - 파일: shutil.copy2 (메타데이터 보존)
-    - 폴더: shutil.copytree (symlinks=True 로 심링크 원본 유지, VULN-02)
-    - 이름 충돌: 자동 이름 해결
+    - 파일: fastcopy.copy_file (커널 내 복사 우선, 메타데이터 보존)
+    - 폴더: 트리를 한 번 순회하며 파일 복사를 스레드 풀로 병렬 처리 (CopyEngine).
+      심링크는 원본 링크 그대로 복사 (VULN-02)
+    - 이름 충돌: 자동 이름 해결. 대상 폴더는 작업당 한 번만 읽고(ConflictResolver)
+      최상위 항목은 고른 이름으로 배타적으로 먼저 만들어 선점한다 (VULN-03)
+    - changes: 주어지면 생성된 경로를 기록. 도중 실패 시 trusted=False
+    - workers: 동시 복사 스레드 수. 없으면 원본/대상 장치에 맞춰 결정
+      (device.default_workers, 환경 변수 MDIR_COPY_WORKERS 로 지정 가능)
+    - report: 주어지면 복사한 파일 수와 사용한 복사 방법을 기록
+    - progress: 주어지면 먼저 전체 파일 수/크기를 조사한 뒤 바이트 단위로 진행 상황 기록
+    - journal: 주어지면 진행 상황을 저널에 기록. 같은 작업을 다시 실행하면 이전에
+      정한 대상 경로를 그대로 쓰고(_copy 중복 없음) 끝난 파일은 건너뛴다.
+      성공하면 저널을 지우고, 실패하면 남겨 둔다
+    - verify: 주어지면 파일마다 복사하며 해시해 대상과 비교 (원본은 한 번만 읽음).
+      결과는 verify_report 에 모이고, 불일치가 있으면 모두 복사한 뒤
+      FileOperationError (저널은 남겨 두어 다시 실행하면 불일치한 파일만 복사)
+    - cancel: 항목·파일·데이터 덩어리 사이에서 확인. 일시정지 중이면 기다리고, 취소되면
+      복사하던 파일을 지운 뒤 OperationCancelledError (끝난 파일은 남고 저널도 남는다.
+      저널이 있으면 복사하던 파일도 남겨 다시 실행할 때 중간 지점부터 잇는다)
     Returns: 복사된 경로 목록
+    Raises: FileOperationError, PermissionDeniedError, DiskFullError, OperationCancelledError
     """
     copied: list[Path] = []
+    if changes is None:
+        changes = ChangeSet()
+    if workers is None:
+        workers = default_workers(dest_dir, *{item.parent for item in items})
 
-    for item in items:
-        # TOCTOU 완화: resolve_conflict 결과를 즉시 사용하고 OS 예외로 처리 (VULN-03)
-        dest = resolve_conflict(dest_dir / item.name)
-        if on_progress:
-            on_progress(item.name)
-        try:
-            if item.is_dir:
-                # symlinks=True: 심링크를 따라가지 않고 심링크 자체를 복사 (VULN-02)
-                shutil.copytree(item.path, dest, symlinks=True)
+    engine = CopyEngine(
+        workers,
+        report,
+        progress,
+        journal,
+        verify=verify,
+        verify_report=verify_report,
+        cancel=cancel,
+    )
+    resolver = ConflictResolver(dest_dir)
+    current: FileItem | None = None
+    try:
+        if progress is not None:
+            add_totals(items, progress, cancel)
+            progress.finish_scan()
+        for item in items:
+            if cancel is not None:
+                cancel.check()
+            current = item
+            if progress is not None:
+                progress.set_current(item.name)
+            resumed = journal.dest_for(item.path) if journal is not None else None
+            if engine.failed:
+                break  # 앞의 파일이 실패함 — 더 선점하지 않고 finish() 에서 오류를 낸다
+            if resumed is not None:
+                dest = resumed
             else:
-                shutil.copy2(item.path, dest)
+                # TOCTOU 완화: 고른 이름을 배타적 생성으로 바로 선점 (VULN-03)
+                dest = resolver.create_unique(item.name, os.mkdir if item.is_dir else create_empty_file)
+                engine.add_placeholder(str(dest), item.is_dir)
+            if journal is not None:
+                journal.record_item(item.path, dest)
+            if on_progress:
+                on_progress(item.name)
+            if item.is_dir:
+                engine.copy_tree(
+                    str(item.path), str(dest), resume=resumed is not None, create_root=resumed is not None
+                )
+            elif not engine.copy_file(str(item.path), str(dest)):
+                break
             copied.append(dest)
-        except PermissionError as e:
-            raise PermissionDeniedError(item.path) from e
-        except OSError as e:
-            if e.errno == 28:  # ENOSPC: No space left on device
-                raise DiskFullError(dest) from e
-            raise FileOperationError(f"복사 실패: {item.name}", item.path) from e
+            changes.added.add(dest)
+        engine.finish()
+        if verify is not None and engine.verify_report.mismatches:
+            bad = engine.verify_report.mismatches
+            name = Path(bad[0].dest).name
+            if len(bad) > 1:
+                name += f" 외 {len(bad) - 1}개"
+            raise FileOperationError(
+                f"검증 실패: {name} — 복사본이 원본과 다릅니다", Path(bad[0].dest)
+            )
+        if journal is not None:
+            journal.complete()
+    except CopyTaskError as e:
+        changes.trusted = False
+        raise map_copy_error(e.error, Path(e.src), Path(e.dest)) from e.error
+    except OSError as e:
+        changes.trusted = False
+        src = current.path if current is not None else dest_dir
+        raise map_copy_error(e, src, dest_dir) from e
+    except (FileOperationError, OperationCancelledError):
+        changes.trusted = False
+        raise
+    finally:
+        engine.close()
+        if journal is not None:
+            journal.close()
 
     return copied
+
+
+def add_totals(
+    items: list[FileItem], progress: OperationProgress, cancel: CancelToken | None = None
+) -> None:
+    """items 전체의 파일 수와 크기를 progress 에 더함 (폴더는 트리를 순회).
+
+    cancel: 취소되면 순회를 멈추고 OperationCancelledError
+    """
+    should_stop = (lambda: cancel.cancelled) if cancel is not None else None
+    for item in items:
+        if item.is_dir:
+            progress.add_total(*tree_totals(item.path, should_stop=should_stop))
+        else:
+            progress.add_total(1, item.size)
+        if cancel is not None:
+            cancel.check()
+
+
+def _unlink_quietly(path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.unlink(path)
+
+
+def _rmdir_quietly(path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.rmdir(path)
+
+
+def map_copy_error(error: OSError, src: Path, dest: Path) -> Exception:
+    """OSError → 사용자에게 보여줄 파일 작업 예외."""
+    if isinstance(error, PermissionError):
+        return PermissionDeniedError(Path(error.filename) if error.filename else src)
+    if error.errno == errno.ENOSPC:
+        return DiskFullError(dest)
+    return FileOperationError(f"복사 실패: {src.name}", src)
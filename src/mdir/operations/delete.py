@@ -1,12 +1,17 @@
-"""파일/폴더 삭제 작업 (휴지통 경유)."""
+"""파일/폴더 삭제 작업 (휴지통 경유, 또는 명시적으로 요청한 영구 삭제)."""
 
 import re
 from pathlib import Path
 
 from send2trash import send2trash
 
+from mdir.models.changes import ChangeSet
 from mdir.models.file_item import FileItem
-from mdir.operations.exceptions import FileOperationError
+from mdir.operations.cancel import CancelToken
+from mdir.operations.device import default_workers
+from mdir.operations.exceptions import FileOperationError, OperationCancelledError
+from mdir.operations.progress import OperationProgress
+from mdir.operations.remove import TreeRemover, count_entries
 
 # Windows 예약 문자 및 예약 이름 (VULN-07)
 _INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
@@ -33,22 +38,94 @@ def _validate_filename(name: str) -> None:
         raise FileOperationError("'..' 또는 '.'은 이름으로 사용할 수 없습니다.")
 
 
-def delete_items(items: list[FileItem]) -> None:
+def delete_items(
+    items: list[FileItem],
+    changes: ChangeSet | None = None,
+    progress: OperationProgress | None = None,
+    cancel: CancelToken | None = None,
+) -> None:
     """파일/폴더를 시스템 휴지통으로 이동 (send2trash).
 
-    직접 삭제(os.remove/shutil.rmtree)는 사용하지 않음.
-    Raises: FileOperationError
+    직접 삭제는 하지 않음 (영구 삭제는 purge_items — 별도 확인을 거친 경우만).
+    - changes: 주어지면 삭제된 경로를 기록. 도중 실패·취소 시 trusted=False
+    - progress: 주어지면 옮긴 항목 수를 기록 (폴더도 하나로 센다)
+    - cancel: 항목 사이에서 확인. 일시정지 중이면 기다리고, 취소되면 남은 항목을 두고
+      OperationCancelledError (휴지통으로 옮기는 것은 항목 단위라 반쯤 옮겨진 항목은 없다)
+    Raises: FileOperationError, OperationCancelledError
     """
+    if changes is None:
+        changes = ChangeSet()
+    if progress is not None:
+        progress.add_total(len(items), 0)
+        progress.finish_scan()
     for item in items:
+        if cancel is not None:
+            try:
+                cancel.check()
+            except OperationCancelledError:
+                changes.trusted = False
+                raise
         try:
+            if progress is not None:
+                progress.set_current(item.name)
             send2trash(str(item.path))
+            changes.removed.add(item.path)
+            if progress is not None:
+                progress.file_done()
         except Exception as e:
+            changes.trusted = False
             raise FileOperationError(f"삭제 실패: {item.name}", item.path) from e
 
 
-def rename_item(item: FileItem, new_name: str) -> Path:
+def purge_items(
+    items: list[FileItem],
+    changes: ChangeSet | None = None,
+    progress: OperationProgress | None = None,
+    cancel: CancelToken | None = None,
+    workers: int | None = None,
+) -> None:
+    """파일/폴더를 휴지통을 거치지 않고 영구 삭제 (되돌릴 수 없음).
+
+    폴더는 TreeRemover 로 병렬 삭제 (디렉토리 fd 기준, 심링크는 따라가지 않음 — VULN-02).
+    - changes: 주어지면 삭제된 경로를 기록. 도중 실패·취소 시 trusted=False
+    - progress: 주어지면 먼저 항목 수를 세고(stat 없음) 지운 항목 수를 기록
+    - cancel: 취소되면 남은 항목을 두고 OperationCancelledError
+    - workers: 동시 삭제 스레드 수 (없으면 장치에 맞춰 결정)
+    Raises: FileOperationError, OperationCancelledError
+    """
+    if changes is None:
+        changes = ChangeSet()
+    if not items:
+        return
+    if workers is None:
+        workers = default_workers(*{item.parent for item in items})
+    if progress is not None:
+        for item in items:
+            progress.add_total(count_entries(item.path, cancel) if item.is_dir else 1, 0)
+        progress.finish_scan()
+
+    remover = TreeRemover(workers, progress, cancel)
+    for item in items:
+        try:
+            if cancel is not None:
+                cancel.check()
+            remover.remove(item.path)
+            changes.removed.add(item.path)
+        except OperationCancelledError:
+            changes.trusted = False
+            raise
+        except PermissionError as e:
+            changes.trusted = False
+            raise FileOperationError(f"권한 없음: {e.filename or item.name}", item.path) from e
+        except OSError as e:
+            changes.trusted = False
+            raise FileOperationError(f"삭제 실패: {item.name} — {e}", item.path) from e
+
+
+def rename_item(item: FileItem, new_name: str, changes: ChangeSet | None = None) -> Path:
     """파일/폴더 이름 변경.
 
+    changes: 주어지면 이전 경로 → 새 경로를 기록
     Returns: 변경된 새 경로
     Raises: FileOperationError
     """
@@ -67,6 +144,8 @@ def rename_item(item: FileItem, new_name: str) -> Path:
     # TOCTOU 방지: 존재 여부를 사전 검사하지 않고 OS 오류로 처리 (VULN-04)
     try:
         item.path.rename(new_path)
+        if changes is not None:
+            changes.renamed[item.path] = new_path
         return new_path
     except FileExistsError:
         raise FileOperationError(f"이미 존재하는 이름: {new_name}")
@@ -76,9 +155,10 @@ def rename_item(item: FileItem, new_name: str) -> Path:
         raise FileOperationError(f"이름 변경 실패: {e}", item.path) from e
 
 
-def make_directory(parent: Path, name: str) -> Path:
+def make_directory(parent: Path, name: str, changes: ChangeSet | None = None) -> Path:
     """새 디렉토리 생성.
 
+    changes: 주어지면 생성된 경로를 기록
     Returns: 생성된 디렉토리 경로
     Raises: FileOperationError
     """
@@ -99,6 +179,8 @@ def make_directory(parent: Path, name: str) -> Path:
     # TOCTOU 방지: 사전 존재 검사 없이 mkdir 예외로 처리 (VULN-04)
     try:
         new_dir.mkdir(parents=False)
+        if changes is not None:
+            changes.added.add(new_dir)
         return new_dir
     except FileExistsError:
         raise FileOperationError(f"이미 존재합니다: {name}")
@@ -0,0 +1,136 @@
+"""장치/파일시스템 정보 (병렬 작업 수 결정용).
+
+장치 번호(st_dev)마다 파일시스템 종류와 회전 디스크 여부를 한 번만 조사해 보관한다.
+Linux 에서는 /proc/self/mounts 와 /sys/dev/block 을 읽고, 그 밖의 OS 에서는
+알 수 없음(기본값)으로 취급한다.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+# 작업 스레드 수를 직접 지정하는 환경 변수 (모든 장치에 적용)
+WORKERS_ENV = "MDIR_COPY_WORKERS"
+
+# 지연 시간이 긴 네트워크 파일시스템 — 동시에 많이 보내야 대역폭을 채운다
+_NETWORK_FS = frozenset(
+    {"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "ceph", "glusterfs", "fuse.sshfs", "afs"}
+)
+_MEMORY_FS = frozenset({"tmpfs", "ramfs"})
+
+# /proc/self/mounts 의 8진수 이스케이프 (공백 \040, 탭 \011, 역슬래시 \134 등)
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+_HDD_WORKERS = 2
+_NETWORK_WORKERS = 16
+_MAX_LOCAL_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class DeviceInfo:
+    """장치 번호 하나에 대한 정보."""
+
+    device: int
+    fs_type: str = ""
+    mount_point: str = ""
+    rotational: bool = False
+
+    @property
+    def is_network(self) -> bool:
+        return self.fs_type in _NETWORK_FS
+
+    @property
+    def is_memory(self) -> bool:
+        return self.fs_type in _MEMORY_FS
+
+    @property
+    def default_workers(self) -> int:
+        """이 장치에 맞는 기본 병렬 작업 수."""
+        if self.is_network:
+            return _NETWORK_WORKERS
+        if self.rotational:
+            return _HDD_WORKERS
+        return max(2, min(_MAX_LOCAL_WORKERS, os.cpu_count() or 4))
+
+
+_cache: dict[int, DeviceInfo] = {}
+_lock = threading.Lock()
+
+
+def device_info(path: Path) -> DeviceInfo:
+    """path 가 있는 장치의 정보 (장치 번호별로 캐시). path 가 없으면 상위 폴더 기준."""
+    while not path.exists() and path.parent != path:
+        path = path.parent
+    try:
+        device = os.stat(path).st_dev
+    except OSError:
+        return DeviceInfo(device=-1)
+    with _lock:
+        info = _cache.get(device)
+    if info is None:
+        info = _probe(path, device)
+        with _lock:
+            _cache[device] = info
+    return info
+
+
+def same_device(a: Path, b: Path) -> bool:
+    """두 경로가 같은 장치(파일시스템)에 있는지."""
+    return device_info(a).device == device_info(b).device
+
+
+def default_workers(*paths: Path) -> int:
+    """paths 의 장치 중 가장 느린 쪽에 맞춘 기본 병렬 작업 수.
+
+    환경 변수 MDIR_COPY_WORKERS 가 있으면 그 값을 쓴다.
+    """
+    override = os.environ.get(WORKERS_ENV, "")
+    if override.isdigit() and int(override) > 0:
+        return int(override)
+    return min((device_info(p).default_workers for p in paths), default=4)
+
+
+def _probe(path: Path, device: int) -> DeviceInfo:
+    fs_type, mount_point = _find_mount(path.resolve())
+    return DeviceInfo(
+        device=device,
+        fs_type=fs_type,
+        mount_point=mount_point,
+        rotational=_is_rotational(device),
+    )
+
+
+def _find_mount(path: Path) -> tuple[str, str]:
+    """/proc/self/mounts 에서 path 를 포함하는 가장 긴 마운트 지점 찾기."""
+    best = ("", "")
+    try:
+        with open("/proc/self/mounts", encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+    except OSError:
+        return best
+    target = str(path)
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # 공백 등은 8진수 이스케이프로 기록된다 (\040). 한글 등 다른 문자는 그대로
+        mount_point = _OCTAL_ESCAPE.sub(lambda m: chr(int(m[1], 8)), fields[1])
+        prefix = mount_point.rstrip("/") + "/"
+        if (target == mount_point or target.startswith(prefix)) and len(mount_point) >= len(best[1]):
+            best = (fields[2], mount_point)
+    return best
+
+
+def _is_rotational(device: int) -> bool:
+    """/sys/dev/block 의 queue/rotational 값 (파티션이면 상위 디스크의 값)."""
+    block = Path(f"/sys/dev/block/{os.major(device)}:{os.minor(device)}")
+    for candidate in (block / "queue" / "rotational", block / ".." / "queue" / "rotational"):
+        try:
+            return candidate.read_text().strip() == "1"
+        except OSError:
+            continue
+    return False
@@ -0,0 +1,185 @@
+"""폴더 재귀 크기 계산 (du) 과 디렉토리별 크기 캐시 (두 패널 공용).
+
+트리를 디렉토리 단위로 작업 스레드 여러 개가 나눠 읽는다. 크기는 파일의
+st_size 합(목록의 파일 크기와 같은 기준)이고, 하드 링크(링크 수 > 1)는
+(st_dev, st_ino) 로 한 번만 센다. 다른 파일시스템(마운트 지점) 안으로는
+들어가지 않는다.
+
+캐시는 디렉토리 (st_dev, st_ino) 마다 그 디렉토리 바로 아래 파일들의 합과
+하위 디렉토리 이름을 mtime_ns 와 함께 보관한다. 다시 계산할 때는 디렉토리마다
+lstat 한 번으로 mtime 을 확인하고, 바뀐 디렉토리만 다시 읽는다.
+(파일 내용만 바뀌어 디렉토리 mtime 이 그대로인 경우는 목록 캐시와 마찬가지로 감수한다.)
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+from mdir.operations.exceptions import OperationCancelledError
+
+# 폴더를 읽을 때마다 크기를 자동으로 계산할지 (auto 이면 계산)
+AUTO_ENV = "MDIR_DIR_SIZES"
+
+# 캐시에 보관할 최대 디렉토리 수 (넘으면 가장 오래 쓰지 않은 것부터 버림)
+_MAX_ENTRIES = 500_000
+
+# 계산 시점과 디렉토리 mtime 이 이 간격 안이면 캐시하지 않는다 (listing_cache 와 같은 이유)
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class _DirRecord:
+    """디렉토리 하나의 직접 항목 요약.
+
+    nbytes: 링크 수 1 인 파일(심링크 포함) 크기 합
+    links: 링크 수 > 1 인 파일의 (st_dev, st_ino, 크기) — 트리 전체에서 한 번만 센다
+    """
+
+    mtime_ns: int
+    nbytes: int
+    files: int
+    links: tuple[tuple[int, int, int], ...]
+    subdirs: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class DirSize:
+    """measure_tree 결과."""
+
+    nbytes: int
+    files: int
+    dirs: int
+    cached_dirs: int = 0  # 캐시로 다시 읽지 않은 디렉토리 수
+    errors: int = 0  # 읽지 못한 디렉토리 수
+
+
+class DirSizeCache:
+    """디렉토리 (st_dev, st_ino) → _DirRecord LRU 캐시 (작업 스레드에서 동시에 사용)."""
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, int], _DirRecord] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[int, int], mtime_ns: int) -> _DirRecord | None:
+        """mtime 이 같을 때만 반환."""
+        with self._lock:
+            record = self._entries.get(key)
+            if record is None or record.mtime_ns != mtime_ns:
+                return None
+            self._entries.move_to_end(key)
+            return record
+
+    def put(self, key: tuple[int, int], record: _DirRecord) -> None:
+        with self._lock:
+            self._entries[key] = record
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def measure_tree(
+    root: Path,
+    cache: DirSizeCache | None = None,
+    workers: int = 4,
+    should_stop: Callable[[], bool] | None = None,
+) -> DirSize:
+    """root 아래 파일 크기 합 (하드 링크는 한 번만, 같은 파일시스템 안에서만).
+
+    읽을 수 없는 하위 디렉토리는 건너뛰고 errors 로 센다.
+    should_stop: True 를 반환하면 멈추고 OperationCancelledError
+    Raises: OSError (root 를 읽을 수 없을 때), OperationCancelledError
+    """
+    root_dev = os.lstat(root).st_dev
+    nbytes = files = dirs = cached = errors = 0
+    links: dict[tuple[int, int], int] = {}
+
+    def visit(path: str) -> tuple[_DirRecord | None, bool]:
+        if should_stop is not None and should_stop():
+            return None, False
+        try:
+            return _read_dir(path, root_dev, cache)
+        except OSError:
+            return None, False
+
+    root_record, root_hit = _read_dir(str(root), root_dev, cache)
+    with ThreadPoolExecutor(max(1, workers), thread_name_prefix="mdir-du") as pool:
+        pending: dict = {}
+        ready = [(str(root), root_record, root_hit)]
+        while ready or pending:
+            for path, record, hit in ready:
+                if record is None:
+                    errors += 1
+                    continue
+                dirs += 1
+                cached += hit
+                nbytes += record.nbytes
+                files += record.files
+                for dev, ino, size in record.links:
+                    links[dev, ino] = size
+                for name in record.subdirs:
+                    sub = os.path.join(path, name)
+                    pending[pool.submit(visit, sub)] = sub
+            ready = []
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                record, hit = future.result()
+                if record is None and should_stop is not None and should_stop():
+                    continue
+                ready.append((path, record, hit))
+    if should_stop is not None and should_stop():
+        raise OperationCancelledError()
+    return DirSize(nbytes + sum(links.values()), files, dirs, cached, errors)
+
+
+def _read_dir(path: str, root_dev: int, cache: DirSizeCache | None) -> tuple[_DirRecord, bool]:
+    """(요약, 캐시 적중 여부). 다른 장치(마운트 지점)면 빈 요약."""
+    st = os.lstat(path)
+    if st.st_dev != root_dev:
+        return _DirRecord(st.st_mtime_ns, 0, 0, (), ()), False
+    key = (st.st_dev, st.st_ino)
+    if cache is not None:
+        record = cache.get(key, st.st_mtime_ns)
+        if record is not None:
+            return record, True
+
+    started_ns = time.time_ns()
+    nbytes = files = 0
+    links: list[tuple[int, int, int]] = []
+    subdirs: list[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(sys.intern(entry.name))
+                    continue
+                est = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            files += 1
+            if est.st_nlink > 1 and not entry.is_symlink():
+                links.append((est.st_dev, est.st_ino, est.st_size))
+            else:
+                nbytes += est.st_size
+    record = _DirRecord(st.st_mtime_ns, nbytes, files, tuple(links), tuple(subdirs))
+    if cache is not None and started_ns - st.st_mtime_ns > _RACY_WINDOW_NS:
+        cache.put(key, record)
+    return record, False
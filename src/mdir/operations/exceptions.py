@@ -37,3 +37,14 @@ class DiskFullError(MdirError):
     def __init__(self, path: Path | None = None) -> None:
         super().__init__("디스크 공간이 부족합니다.")
         self.path = path
+
+
+class OperationCancelledError(MdirError):
+    """사용자가 작업을 취소함.
+
+    completed: 취소 전까지 끝낸 분량 요약 (작업 큐가 진행 상황으로 채움)
+    """
+
+    def __init__(self, completed: str = "") -> None:
+        super().__init__("작업이 취소되었습니다.")
+        self.completed = completed
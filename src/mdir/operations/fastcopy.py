@@ -0,0 +1,330 @@
+"""커널 내 파일 데이터 복사 (reflink / copy_file_range / sendfile).
+
+Linux 에서는 다음 순서로 시도하고, 원본·대상 장치 쌍마다 실제로 동작한
+방법을 기억해 다음 파일부터는 안 되는 방법을 건너뛴다.
+
+    1. FICLONE ioctl — reflink (btrfs/XFS 등, 데이터 복사 없이 즉시)
+    2. os.copy_file_range — 커널 안에서 복사 (NFS 서버 측 복사 포함)
+    3. os.sendfile — 커널 안에서 복사 (구형 커널)
+    4. 큰 버퍼 사용자 공간 루프
+
+그 밖의 OS 에서는 shutil.copy2 (macOS 는 fcopyfile) 를 그대로 쓴다.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import stat as stat_mod
+import sys
+import threading
+from collections.abc import Callable, Collection
+from typing import Protocol
+
+METHOD_REFLINK = "reflink"
+METHOD_COPY_FILE_RANGE = "copy_file_range"
+METHOD_SENDFILE = "sendfile"
+METHOD_USERSPACE = "userspace"
+METHOD_SHUTIL = "shutil"  # Linux 가 아닌 OS, 또는 일반 파일이 아닌 경우
+
+METHODS = (METHOD_REFLINK, METHOD_COPY_FILE_RANGE, METHOD_SENDFILE, METHOD_USERSPACE)
+
+# linux/fs.h: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+# 사용자 공간 루프 버퍼 크기
+USERSPACE_BUFFER_SIZE = 1024 * 1024
+# copy_file_range / sendfile 한 번에 요청할 최대 크기 (진행 상황 보고 단위)
+_KERNEL_CHUNK = 16 * 1024 * 1024
+
+# 이 오류들은 "이 파일시스템 조합에서는 안 되는 방법" 이므로 다음 방법으로 넘어간다
+_UNSUPPORTED_ERRNOS = frozenset(
+    {
+        errno.EXDEV,
+        errno.ENOSYS,
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.ENOTTY,
+        errno.EINVAL,
+        errno.ENOTSOCK,
+        errno.EBADF,
+    }
+)
+
+_IS_LINUX = sys.platform.startswith("linux")
+
+
+_OnBytes = Callable[[int], None] | None
+
+
+class Hasher(Protocol):
+    """hashlib 객체처럼 update() 를 가진 해시 (검증 복사용)."""
+
+    def update(self, data: bytes, /) -> None: ...
+
+
+class MethodUnsupportedError(OSError):
+    """지정한 복사 방법을 이 파일시스템 조합에서 쓸 수 없음."""
+
+
+class _MethodCache:
+    """(원본 장치, 대상 장치) → 동작하지 않는 것으로 확인된 방법 집합."""
+
+    def __init__(self) -> None:
+        self._unsupported: dict[tuple[int, int], set[str]] = {}
+        self._lock = threading.Lock()
+
+    def candidates(self, key: tuple[int, int]) -> list[str]:
+        with self._lock:
+            skip = self._unsupported.get(key, set())
+            return [m for m in METHODS if m not in skip]
+
+    def mark_unsupported(self, key: tuple[int, int], method: str) -> None:
+        with self._lock:
+            self._unsupported.setdefault(key, set()).add(method)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._unsupported.clear()
+
+
+method_cache = _MethodCache()
+
+
+def copy_file(
+    src: str,
+    dest: str,
+    method: str | None = None,
+    on_bytes: Callable[[int], None] | None = None,
+    resume_from: int = 0,
+    checkpoint: Callable[[int], None] | None = None,
+    checkpoint_every: int = 0,
+    methods: Collection[str] | None = None,
+    hasher: Hasher | None = None,
+) -> str:
+    """파일 내용과 메타데이터 복사 (shutil.copy2 와 같은 결과). 사용한 방법 이름 반환.
+
+    method: 지정하면 그 방법만 시도하고, 쓸 수 없으면 MethodUnsupportedError.
+    methods: 주어지면 이 방법들 중 되는 것만 차례로 시도 (모두 안 되면 MethodUnsupportedError)
+    hasher: 주어지면 데이터가 사용자 공간을 지나도록 복사하며 원본 내용을 해시에
+        넣는다 (검증 복사용 — 원본을 다시 읽지 않음). resume_from 은 무시된다.
+    on_bytes: 데이터를 한 덩어리 복사할 때마다 그 크기로 호출 (진행 표시용)
+    resume_from: 대상 파일의 이 위치부터 이어서 복사 (앞부분은 이미 복사된 것으로 봄)
+    checkpoint: checkpoint_every 바이트마다 대상 파일을 fdatasync 한 뒤 복사한
+        위치로 호출 (이어하기 저널용, Linux 에서만)
+    """
+    if not _is_regular(src):
+        return _copy_shutil(src, dest, on_bytes)
+    if hasher is not None:
+        return _copy_hashing(src, dest, hasher, on_bytes)
+    if not _IS_LINUX:
+        return _copy_shutil(src, dest, on_bytes)
+    with open(src, "rb") as fsrc:
+        src_stat = os.fstat(fsrc.fileno())
+        if not stat_mod.S_ISREG(src_stat.st_mode):
+            # 확인한 뒤 다른 종류의 파일로 바뀐 경우
+            fsrc.close()
+            return _copy_shutil(src, dest, on_bytes)
+        # O_TRUNC 대신 같은 파일인지 확인한 뒤 비운다 (원본을 잘라 버리는 사고 방지)
+        dst_fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o666)
+        try:
+            dst_stat = os.fstat(dst_fd)
+            if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+                raise shutil.SameFileError(f"{src!r} and {dest!r} are the same file")
+            if not 0 < resume_from <= min(src_stat.st_size, dst_stat.st_size):
+                resume_from = 0
+            # 이어하기: 기록된 위치 뒤에 쓰다 만 데이터는 버린다
+            os.ftruncate(dst_fd, resume_from)
+            if resume_from:
+                os.lseek(fsrc.fileno(), resume_from, os.SEEK_SET)
+                os.lseek(dst_fd, resume_from, os.SEEK_SET)
+            if checkpoint is not None and checkpoint_every > 0:
+                on_bytes = _checkpointing(dst_fd, resume_from, on_bytes, checkpoint, checkpoint_every)
+            used = copy_data(
+                fsrc.fileno(),
+                dst_fd,
+                src_stat,
+                method,
+                dst_stat.st_dev,
+                on_bytes,
+                resume_from,
+                methods,
+            )
+        finally:
+            os.close(dst_fd)
+    shutil.copystat(src, dest)
+    return used
+
+
+def _is_regular(src: str) -> bool:
+    """일반 파일인지 (열기 전에 확인).
+
+    FIFO 는 읽기로 열면 쓰는 쪽이 나타날 때까지 멈추므로, 일반 파일이 아니면 열지 않고
+    shutil 의 처리(SpecialFileError 등)를 따른다.
+    """
+    return stat_mod.S_ISREG(os.stat(src).st_mode)
+
+
+def copy_data(
+    src_fd: int,
+    dst_fd: int,
+    src_stat: os.stat_result,
+    method: str | None = None,
+    dst_dev: int | None = None,
+    on_bytes: Callable[[int], None] | None = None,
+    start: int = 0,
+    methods: Collection[str] | None = None,
+) -> str:
+    """열린 파일 사이의 데이터 복사. 사용한 방법 이름 반환.
+
+    파일 위치는 둘 다 start 여야 한다. 도중에 방법을 바꾸면 이미 복사한
+    위치부터 이어서 한다. 사용자 공간 루프의 오류는 그대로 전파된다.
+    """
+    size = src_stat.st_size
+    if dst_dev is None:
+        dst_dev = os.fstat(dst_fd).st_dev
+    key = (src_stat.st_dev, dst_dev)
+    candidates = [method] if method is not None else method_cache.candidates(key)
+    if methods is not None and method is None:
+        candidates = [m for m in candidates if m in methods]
+    if start and method is None:
+        # reflink 는 파일 전체만 가능 — 이어하기에서는 건너뛴다 (미지원으로 기록하지 않음)
+        candidates = [m for m in candidates if m != METHOD_REFLINK]
+    done = start
+    for candidate in candidates:
+        try:
+            done = _COPIERS[candidate](src_fd, dst_fd, size, done, on_bytes)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS or candidate == METHOD_USERSPACE:
+                raise
+            method_cache.mark_unsupported(key, candidate)
+            if method is not None:
+                raise MethodUnsupportedError(e.errno, f"{candidate}: {e.strerror}") from e
+            os.lseek(src_fd, done, os.SEEK_SET)
+            os.lseek(dst_fd, done, os.SEEK_SET)
+            continue
+        return candidate
+    raise MethodUnsupportedError(errno.ENOTSUP, "사용할 수 있는 복사 방법이 없습니다")
+
+
+def _checkpointing(
+    dst_fd: int,
+    start: int,
+    on_bytes: _OnBytes,
+    checkpoint: Callable[[int], None],
+    every: int,
+) -> Callable[[int], None]:
+    """on_bytes 를 감싸 every 바이트마다 데이터를 디스크에 내린 뒤 checkpoint 호출."""
+    offset = start
+    last = start
+
+    def tracked(n: int) -> None:
+        nonlocal offset, last
+        if on_bytes is not None:
+            on_bytes(n)
+        offset += n
+        if offset - last >= every:
+            os.fdatasync(dst_fd)
+            checkpoint(offset)
+            last = offset
+
+    return tracked
+
+
+def _copy_hashing(
+    src: str, dest: str, hasher: Hasher, on_bytes: Callable[[int], None] | None
+) -> str:
+    """사용자 공간 루프로 복사하며 원본 데이터를 hasher 에 넣음 (모든 OS)."""
+    with open(src, "rb") as fsrc:
+        src_stat = os.fstat(fsrc.fileno())
+        dst_fd = os.open(dest, os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o666)
+        try:
+            dst_stat = os.fstat(dst_fd)
+            if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+                raise shutil.SameFileError(f"{src!r} and {dest!r} are the same file")
+            os.ftruncate(dst_fd, 0)
+            buf = bytearray(USERSPACE_BUFFER_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+                written = 0
+                while written < n:
+                    written += os.write(dst_fd, view[written:n])
+                if on_bytes is not None:
+                    on_bytes(n)
+        finally:
+            os.close(dst_fd)
+    shutil.copystat(src, dest)
+    return METHOD_USERSPACE
+
+
+def _copy_shutil(src: str, dest: str, on_bytes: Callable[[int], None] | None) -> str:
+    shutil.copy2(src, dest)
+    if on_bytes is not None:
+        on_bytes(os.lstat(dest).st_size)
+    return METHOD_SHUTIL
+
+
+def _reflink(src_fd: int, dst_fd: int, size: int, done: int, on_bytes: _OnBytes) -> int:
+    import fcntl
+
+    if done:
+        raise OSError(errno.EINVAL, "reflink 는 처음부터만 가능")
+    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    if on_bytes is not None:
+        on_bytes(size)
+    return size
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int, done: int, on_bytes: _OnBytes) -> int:
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "copy_file_range 없음")
+    while True:
+        n = os.copy_file_range(src_fd, dst_fd, _KERNEL_CHUNK)
+        if n == 0:
+            if done == 0 and size > 0:
+                # 일부 가상 파일시스템은 오류 없이 0 을 돌려준다
+                raise OSError(errno.EINVAL, "copy_file_range 가 데이터를 옮기지 않음")
+            return done
+        done += n
+        if on_bytes is not None:
+            on_bytes(n)
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int, done: int, on_bytes: _OnBytes) -> int:
+    while True:
+        n = os.sendfile(dst_fd, src_fd, None, _KERNEL_CHUNK)
+        if n == 0:
+            if done == 0 and size > 0:
+                raise OSError(errno.EINVAL, "sendfile 이 데이터를 옮기지 않음")
+            return done
+        done += n
+        if on_bytes is not None:
+            on_bytes(n)
+
+
+def _userspace(src_fd: int, dst_fd: int, size: int, done: int, on_bytes: _OnBytes) -> int:
+    buf = bytearray(USERSPACE_BUFFER_SIZE)
+    view = memoryview(buf)
+    while True:
+        n = os.readv(src_fd, [buf])
+        if n == 0:
+            return done
+        written = 0
+        while written < n:
+            written += os.write(dst_fd, view[written:n])
+        done += n
+        if on_bytes is not None:
+            on_bytes(n)
+
+
+_COPIERS = {
+    METHOD_REFLINK: _reflink,
+    METHOD_COPY_FILE_RANGE: _copy_file_range,
+    METHOD_SENDFILE: _sendfile,
+    METHOD_USERSPACE: _userspace,
+}
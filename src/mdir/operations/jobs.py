@@ -0,0 +1,247 @@
+"""백그라운드 작업 큐 (복사·이동·삭제처럼 오래 걸리는 파일 작업).
+
+작업은 제출한 순서대로 대기열에 들어가고, 작업이 쓰는 장치(원본·대상의 st_dev)마다
+동시에 실행할 수 있는 작업 수를 넘지 않는 범위에서 시작된다. 같은 장치를 쓰는
+작업끼리는 제출 순서를 지키고(뒤에 온 작업이 앞지르지 않음), 겹치는 장치가 없는
+작업은 앞 작업이 기다리는 중이어도 바로 시작한다.
+
+작업마다 스레드 하나에서 실행되고, 진행 상황은 OperationProgress 카운터로만 남는다.
+화면(상태바, 작업 목록)은 타이머로 snapshot() 을 읽고, 결과는 Job.future 로 받는다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from mdir.operations.cancel import CancelToken
+from mdir.operations.device import device_info
+from mdir.operations.exceptions import OperationCancelledError
+from mdir.operations.progress import OperationProgress
+
+# 장치마다 동시에 실행할 작업 수를 직접 지정하는 환경 변수 (모든 장치에 적용)
+JOBS_ENV = "MDIR_JOBS_PER_DEVICE"
+
+# 장치 종류별 기본 동시 작업 수 — 작업 하나가 이미 여러 스레드로 복사하므로 작게 둔다
+_HDD_JOBS = 1  # 회전 디스크는 작업이 겹치면 탐색 시간만 늘어난다
+_LOCAL_JOBS = 2
+_NETWORK_JOBS = 4
+
+# 작업 목록에 남겨 둘 끝난 작업 수
+_MAX_FINISHED = 20
+
+# 작업 상태
+QUEUED = "대기"
+RUNNING = "실행 중"
+DONE = "완료"
+FAILED = "실패"
+CANCELLED = "취소됨"
+
+
+def job_devices(paths: Iterable[Path]) -> dict[int, int]:
+    """paths 가 있는 장치 번호 → 그 장치의 동시 작업 수 (장치 정보는 캐시됨)."""
+    override = os.environ.get(JOBS_ENV, "")
+    devices: dict[int, int] = {}
+    for path in paths:
+        info = device_info(path)
+        if override.isdigit() and int(override) > 0:
+            limit = int(override)
+        elif info.is_network:
+            limit = _NETWORK_JOBS
+        elif info.rotational:
+            limit = _HDD_JOBS
+        else:
+            limit = _LOCAL_JOBS
+        devices[info.device] = limit
+    return devices
+
+
+@dataclass(eq=False)
+class Job:
+    """큐에 넣은 작업 하나.
+
+    devices: 장치 번호 → 동시 작업 수 (비어 있으면 제한 없이 바로 실행)
+    cancel: 실행 중에도 취소·일시정지할 수 있는 작업이면 그 토큰
+        (없으면 대기 중일 때만 취소 가능하고 일시정지는 안 됨)
+    """
+
+    id: int
+    label: str
+    description: str
+    devices: dict[int, int]
+    progress: OperationProgress
+    cancel: CancelToken | None = None
+    state: str = QUEUED
+    error: BaseException | None = None
+    submitted: float = field(default_factory=time.monotonic)
+    future: Future = field(default_factory=Future, repr=False)
+    _call: Callable[[], object] | None = field(default=None, repr=False)
+
+    @property
+    def active(self) -> bool:
+        return self.state in (QUEUED, RUNNING)
+
+    @property
+    def paused(self) -> bool:
+        return self.state == RUNNING and self.cancel is not None and self.cancel.paused
+
+    @property
+    def cancellable(self) -> bool:
+        if self.state == QUEUED:
+            return True
+        return self.state == RUNNING and self.cancel is not None and not self.cancel.cancelled
+
+    def describe(self) -> str:
+        """작업 목록 한 줄. 예: '[실행 중] 복사 1.2G/4.0G (30%) · ... — a.txt 외 3개'."""
+        state = self.state
+        if self.state == RUNNING:
+            text = self.progress.snapshot().describe()
+            if self.cancel is not None and self.cancel.cancelled:
+                text += " · 취소하는 중…"
+            elif self.paused:
+                state = "일시정지"
+        elif self.state == FAILED and self.error is not None:
+            text = f"{self.label}: {self.error}"
+        else:
+            text = self.label
+        if self.description:
+            text += f" — {self.description}"
+        return f"[{state}] {text}"
+
+
+class JobQueue:
+    """장치별 동시 실행 수를 지키는 작업 큐 (어느 스레드에서 불러도 안전)."""
+
+    def __init__(self, max_finished: int = _MAX_FINISHED) -> None:
+        self._lock = threading.Lock()
+        self._queued: list[Job] = []
+        self._running: list[Job] = []
+        self._finished: deque[Job] = deque(maxlen=max_finished)
+        self._busy: dict[int, int] = {}  # 장치 번호 → 실행 중인 작업 수
+        self._next_id = 1
+
+    def submit(
+        self,
+        label: str,
+        fn: Callable,
+        *args,
+        devices: dict[int, int] | None = None,
+        description: str = "",
+        cancel: CancelToken | None = None,
+        **kwargs,
+    ) -> Job:
+        """fn(*args, progress=, [cancel=,] **kwargs) 를 큐에 넣음. 자리가 있으면 바로 시작.
+
+        결과나 예외는 Job.future 로 전달된다 (대기 중 취소되면 OperationCancelledError).
+        """
+        progress = OperationProgress(label)
+        if cancel is not None:
+            kwargs["cancel"] = cancel
+        with self._lock:
+            job = Job(self._next_id, label, description, dict(devices or {}), progress, cancel)
+            self._next_id += 1
+            job._call = lambda: fn(*args, progress=progress, **kwargs)
+            self._queued.append(job)
+            self._dispatch()
+        return job
+
+    def cancel(self, job: Job) -> bool:
+        """대기 중이면 큐에서 빼고, 실행 중이면 취소 요청. 취소할 수 없으면 False."""
+        with self._lock:
+            if job.state == QUEUED:
+                self._queued.remove(job)
+                job.state = CANCELLED
+                job._call = None
+                self._finished.append(job)
+                self._dispatch()
+            elif job.cancellable:
+                job.cancel.cancel()
+                return True
+            else:
+                return False
+        job.future.set_exception(OperationCancelledError("시작하기 전에 취소 — 바뀐 것 없음"))
+        return True
+
+    def toggle_pause(self, job: Job) -> bool:
+        """실행 중인 작업 일시정지/재개. 일시정지할 수 없는 작업이면 False.
+
+        일시정지한 작업도 장치 자리는 그대로 차지한다.
+        """
+        with self._lock:
+            if job.state != RUNNING or job.cancel is None or job.cancel.cancelled:
+                return False
+            if job.cancel.paused:
+                job.cancel.resume()
+            else:
+                job.cancel.pause()
+            return True
+
+    def jobs(self) -> list[Job]:
+        """실행 중 → 대기 → 최근에 끝난 순 (끝난 것은 최근 것부터)."""
+        with self._lock:
+            return [*self._running, *self._queued, *reversed(self._finished)]
+
+    def active(self) -> list[Job]:
+        """실행 중이거나 대기 중인 작업 (제출 순)."""
+        with self._lock:
+            return sorted([*self._running, *self._queued], key=lambda j: j.id)
+
+    @property
+    def running_count(self) -> int:
+        return len(self._running)
+
+    @property
+    def queued_count(self) -> int:
+        return len(self._queued)
+
+    def _dispatch(self) -> None:
+        """자리가 난 작업 시작 (lock 안에서 호출)."""
+        blocked: set[int] = set()
+        for job in list(self._queued):
+            if not blocked.isdisjoint(job.devices) or any(
+                self._busy.get(dev, 0) >= limit for dev, limit in job.devices.items()
+            ):
+                # 같은 장치를 쓰는 뒤 작업이 이 작업을 앞지르지 않도록 막는다
+                blocked.update(job.devices)
+                continue
+            self._queued.remove(job)
+            self._running.append(job)
+            for dev in job.devices:
+                self._busy[dev] = self._busy.get(dev, 0) + 1
+            job.state = RUNNING
+            threading.Thread(
+                target=self._run, args=(job,), name=f"mdir-job-{job.id}", daemon=True
+            ).start()
+
+    def _run(self, job: Job) -> None:
+        call, job._call = job._call, None
+        result = error = None
+        try:
+            result = call()
+        except BaseException as e:  # noqa: BLE001 — Future 로 그대로 전달
+            error = e
+        with self._lock:
+            self._running.remove(job)
+            for dev in job.devices:
+                self._busy[dev] -= 1
+            if error is None:
+                job.state = DONE
+            elif isinstance(error, OperationCancelledError):
+                job.state = CANCELLED
+                if not error.completed:
+                    error.completed = job.progress.snapshot().completed()
+            else:
+                job.state = FAILED
+            job.error = error
+            self._finished.append(job)
+            self._dispatch()
+        if error is None:
+            job.future.set_result(result)
+        else:
+            job.future.set_exception(error)
@@ -0,0 +1,220 @@
+"""복사 작업 이어하기용 체크포인트 저널.
+
+작업(원본 목록 + 대상 폴더)마다 상태 디렉토리에 JSON Lines 파일 하나를 둔다.
+
+    {"v": 1, "sources": [...], "dest": "..."}               머리말
+    {"item": "<원본>", "dest": "<대상>"}                      최상위 항목의 대상 경로
+    {"done": "<대상 파일>", "size": n, "mtime": ns}           복사를 마친 파일
+    {"part": "<대상 파일>", "size": n, "mtime": ns, "offset": k}   큰 파일의 중간 지점
+
+size/mtime 은 원본 파일의 값으로, 다시 실행할 때 원본이 바뀌었으면 기록을
+무시하고 처음부터 복사한다. 중간 지점은 대상 파일을 fdatasync 한 뒤에만
+기록하므로 전원이 꺼져도 그 위치까지의 데이터는 남아 있다.
+작업이 성공하면 저널은 지운다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+JOURNAL_VERSION = 1
+
+# 저널 위치를 직접 지정하는 환경 변수 (기본: $XDG_STATE_HOME/mdir/jobs)
+STATE_DIR_ENV = "MDIR_STATE_DIR"
+
+# 이만큼 복사할 때마다 중간 지점을 기록한다 (이보다 작은 파일은 기록 없음)
+CHECKPOINT_BYTES = 256 * 1024 * 1024
+
+# 완료 기록은 모아서 쓴다 (작은 파일마다 write 하지 않도록)
+_FLUSH_RECORDS = 64
+_FLUSH_INTERVAL = 1.0
+
+
+def journal_dir() -> Path:
+    """저널 파일을 두는 디렉토리."""
+    override = os.environ.get(STATE_DIR_ENV)
+    if override:
+        return Path(override)
+    state = os.environ.get("XDG_STATE_HOME") or str(Path.home() / ".local" / "state")
+    return Path(state) / "mdir" / "jobs"
+
+
+def job_key(sources: list[Path], dest_dir: Path) -> str:
+    """같은 원본 목록 → 같은 대상 폴더 작업이면 같은 키."""
+    raw = json.dumps([sorted(str(p) for p in sources), str(dest_dir)])
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+class CopyJournal:
+    """복사 작업 하나의 저널 (작업 스레드 여러 개에서 동시에 기록 가능)."""
+
+    def __init__(self, path: Path, sources: list[Path], dest_dir: Path) -> None:
+        self.path = path
+        self.sources = sources
+        self.dest_dir = dest_dir
+        self._items: dict[str, str] = {}
+        self._done: dict[str, tuple[int, int]] = {}
+        self._parts: dict[str, tuple[int, int, int]] = {}
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._last_flush = time.monotonic()
+        self._file = None
+
+    @classmethod
+    def open(
+        cls, sources: list[Path], dest_dir: Path, directory: Path | None = None
+    ) -> CopyJournal:
+        """작업 저널 열기. 같은 작업의 저널이 남아 있으면 그 기록을 읽어 온다."""
+        directory = directory if directory is not None else journal_dir()
+        journal = cls(directory / f"{job_key(sources, dest_dir)}.jsonl", sources, dest_dir)
+        journal._load()
+        return journal
+
+    @property
+    def resumable(self) -> bool:
+        """이어서 할 기록이 있는지."""
+        return bool(self._items)
+
+    def discard(self) -> None:
+        """남은 기록을 버리고 처음부터 시작."""
+        self.close()
+        self._items.clear()
+        self._done.clear()
+        self._parts.clear()
+        self.path.unlink(missing_ok=True)
+
+    # ── 조회 ──────────────────────────────
+
+    def dest_for(self, src: Path) -> Path | None:
+        """이전 실행에서 정한 최상위 항목의 대상 경로 (이름 충돌 해결을 다시 하지 않음)."""
+        dest = self._items.get(str(src))
+        return Path(dest) if dest is not None else None
+
+    def is_done(self, dest: str, src_stat: os.stat_result) -> bool:
+        """이미 복사를 마친 파일인지 (원본이 그대로이고 대상 크기/시각이 맞아야 함)."""
+        identity = (src_stat.st_size, src_stat.st_mtime_ns)
+        if self._done.get(dest) != identity:
+            return False
+        try:
+            st = os.lstat(dest)
+        except OSError:
+            return False
+        return (st.st_size, st.st_mtime_ns) == identity
+
+    def resume_offset(self, dest: str, src_stat: os.stat_result) -> int:
+        """이어서 복사할 위치. 기록이 없거나 원본이 바뀌었으면 0."""
+        part = self._parts.get(dest)
+        if part is None or part[:2] != (src_stat.st_size, src_stat.st_mtime_ns):
+            return 0
+        try:
+            if os.lstat(dest).st_size < part[2]:
+                return 0
+        except OSError:
+            return 0
+        return part[2]
+
+    # ── 기록 ──────────────────────────────
+
+    def record_item(self, src: Path, dest: Path) -> None:
+        if self._items.get(str(src)) == str(dest):
+            return
+        self._items[str(src)] = str(dest)
+        self._write({"item": str(src), "dest": str(dest)}, flush=True)
+
+    def file_done(self, dest: str, src_stat: os.stat_result) -> None:
+        identity = (src_stat.st_size, src_stat.st_mtime_ns)
+        with self._lock:
+            self._done[dest] = identity
+            self._parts.pop(dest, None)
+        self._write({"done": dest, "size": identity[0], "mtime": identity[1]})
+
+    def checkpoint(self, dest: str, src_stat: os.stat_result, offset: int) -> None:
+        """큰 파일의 중간 지점 (호출 전에 대상 데이터를 디스크에 내려 두어야 함)."""
+        record = {
+            "part": dest,
+            "size": src_stat.st_size,
+            "mtime": src_stat.st_mtime_ns,
+            "offset": offset,
+        }
+        with self._lock:
+            self._parts[dest] = (src_stat.st_size, src_stat.st_mtime_ns, offset)
+        self._write(record, flush=True)
+
+    def complete(self) -> None:
+        """작업 성공 — 저널 삭제."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """남은 기록을 쓰고 파일을 닫음 (실패·중단 시 — 저널은 남는다)."""
+        with self._lock:
+            if self._file is not None:
+                self._flush_locked()
+                self._file.close()
+                self._file = None
+
+    # ── 내부 ──────────────────────────────
+
+    def _write(self, record: dict, flush: bool = False) -> None:
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                self._open_locked()
+            self._pending.append(line)
+            if (
+                flush
+                or len(self._pending) >= _FLUSH_RECORDS
+                or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL
+            ):
+                self._flush_locked()
+
+    def _open_locked(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        new = not self.path.exists()
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        if new:
+            header = {
+                "v": JOURNAL_VERSION,
+                "sources": [str(p) for p in self.sources],
+                "dest": str(self.dest_dir),
+            }
+            self._pending.append(json.dumps(header, ensure_ascii=False))
+
+    def _flush_locked(self) -> None:
+        if self._pending and self._file is not None:
+            self._file.write("\n".join(self._pending) + "\n")
+            self._file.flush()
+            self._pending.clear()
+        self._last_flush = time.monotonic()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 쓰다가 끊긴 마지막 줄
+                continue
+            if "v" in record and record["v"] != JOURNAL_VERSION:
+                # 다른 형식의 저널은 쓰지 않는다
+                self._items.clear()
+                self._done.clear()
+                self._parts.clear()
+                self.path.unlink(missing_ok=True)
+                return
+            if "item" in record:
+                self._items[record["item"]] = record["dest"]
+            elif "done" in record:
+                self._done[record["done"]] = (record["size"], record["mtime"])
+                self._parts.pop(record["done"], None)
+            elif "part" in record:
+                self._parts[record["part"]] = (record["size"], record["mtime"], record["offset"])
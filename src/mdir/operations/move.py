@@ -1,33 +1,249 @@
 """파일/폴더 이동 작업."""
 
-import shutil
+import ctypes
+import errno
+import os
+import stat as stat_mod
+import sys
+from functools import partial
 from pathlib import Path
 
+from mdir.models.changes import ChangeSet
 from mdir.models.file_item import FileItem
-from mdir.operations.copy import resolve_conflict
-from mdir.operations.exceptions import FileOperationError
+from mdir.operations.cancel import CancelToken
+from mdir.operations.copy import (
+    ConflictResolver,
+    CopyEngine,
+    CopyTaskError,
+    add_totals,
+    create_empty_file,
+)
+from mdir.operations.device import default_workers
+from mdir.operations.exceptions import FileOperationError, OperationCancelledError
+from mdir.operations.progress import OperationProgress
+
+# renameat2(2) — RENAME_NOREPLACE 면 대상이 있을 때 EEXIST (Linux 3.15+, glibc 2.28+)
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+# 커널·파일 시스템이 플래그를 지원하지 않을 때의 errno
+_NOREPLACE_UNSUPPORTED = frozenset({errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP})
+
+
+def _load_renameat2():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        func = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    func.restype = ctypes.c_int
+    return func
+
+
+_renameat2 = _load_renameat2()
 
 
 def move_items(
     items: list[FileItem],
     dest_dir: Path,
+    changes: ChangeSet | None = None,
+    progress: OperationProgress | None = None,
+    workers: int | None = None,
+    cancel: CancelToken | None = None,
 ) -> list[Path]:
     """파일/폴더를 dest_dir 로 이동.
 
-    - shutil.move 사용 (같은 FS: rename / 다른 FS: copy+delete)
-    - 이름 충돌: 자동 이름 해결
+    작업 시작 시 항목마다 장치(st_dev)를 대상 폴더와 한 번 비교해 나눈다.
+    - 같은 장치: 항목마다 덮어쓰지 않는 rename 한 번씩 (데이터 복사 없음). 고른 이름이
+      그 사이 생겼으면 다음 후보로 (VULN-03)
+    - 다른 장치: 복사 엔진(병렬, 커널 내 복사)으로 옮기며 파일마다 복사와
+      크기 확인이 끝나는 즉시 원본을 지운다 → 추가 공간은 복사 중인 파일만큼
+    - 이름 충돌: 자동 이름 해결 (대상 폴더는 작업당 한 번만 읽음, ConflictResolver)
+    - changes: 주어지면 원본 경로 → 새 경로를 기록. 도중 실패 시 trusted=False
+    - progress: 주어지면 진행 상황 기록. 같은 장치 안의 이동은 항목당 1개로 센다
+    - workers: 다른 장치로 옮길 때의 동시 복사 스레드 수 (없으면 장치에 맞춰 결정)
+    - cancel: 항목·파일·데이터 덩어리 사이에서 확인. 일시정지 중이면 기다리고, 취소되면
+      OperationCancelledError — 옮기던 파일은 대상 쪽을 지우고 원본을 남긴다
     Returns: 이동된 경로 목록
+    Raises: FileOperationError, OperationCancelledError
     """
     moved: list[Path] = []
+    if changes is None:
+        changes = ChangeSet()
 
-    for item in items:
-        dest = resolve_conflict(dest_dir / item.name)
-        try:
-            shutil.move(str(item.path), dest)
+    current: FileItem | None = None
+    resolver = ConflictResolver(dest_dir)
+    try:
+        dest_dev = os.stat(dest_dir).st_dev
+        renames: list[FileItem] = []
+        transfers: list[FileItem] = []
+        for item in items:
+            current = item
+            if item.is_dir and _is_inside(dest_dir, item.path):
+                raise FileOperationError(f"이동 실패: {item.name} — 자기 자신 안으로 옮길 수 없습니다", item.path)
+            same = os.lstat(item.path).st_dev == dest_dev
+            (renames if same else transfers).append(item)
+
+        if progress is not None:
+            progress.add_total(len(renames), 0)
+            add_totals(transfers, progress, cancel)
+            progress.finish_scan()
+
+        for item in renames:
+            if cancel is not None:
+                cancel.check()
+            current = item
+            if progress is not None:
+                progress.set_current(item.name)
+            try:
+                dest = _rename_unique(item.path, resolver)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # 같은 st_dev 라도 바인드 마운트 사이는 rename 이 안 된다
+                if progress is not None:
+                    progress.add_total(*_totals(item))
+                transfers.append(item)
+                continue
             moved.append(dest)
-        except PermissionError as e:
-            raise FileOperationError(f"권한 없음: {item.name}", item.path) from e
-        except OSError as e:
-            raise FileOperationError(f"이동 실패: {item.name} — {e}", item.path) from e
+            changes.renamed[item.path] = dest
+            if progress is not None:
+                progress.file_done()
+
+        if transfers:
+            moved.extend(
+                _transfer(transfers, dest_dir, resolver, changes, progress, workers, cancel)
+            )
+    except CopyTaskError as e:
+        changes.trusted = False
+        raise _move_error(e.error, Path(e.src).name, Path(e.src)) from e.error
+    except OSError as e:
+        changes.trusted = False
+        name = current.name if current is not None else dest_dir.name
+        raise _move_error(e, name, current.path if current is not None else dest_dir) from e
+    except (FileOperationError, OperationCancelledError):
+        changes.trusted = False
+        raise
 
     return moved
+
+
+def _transfer(
+    items: list[FileItem],
+    dest_dir: Path,
+    resolver: ConflictResolver,
+    changes: ChangeSet,
+    progress: OperationProgress | None,
+    workers: int | None,
+    cancel: CancelToken | None = None,
+) -> list[Path]:
+    """다른 장치로 이동: 복사하면서 파일 단위로 원본 삭제."""
+    if workers is None:
+        workers = default_workers(dest_dir, *{item.parent for item in items})
+    moved: list[Path] = []
+    engine = CopyEngine(workers, progress=progress, remove_source=True, cancel=cancel)
+    try:
+        for item in items:
+            if cancel is not None:
+                cancel.check()
+            if engine.failed:
+                break  # 앞의 파일이 실패함 — 더 선점하지 않고 finish() 에서 오류를 낸다
+            if progress is not None:
+                progress.set_current(item.name)
+            if item.is_symlink:
+                create = partial(os.symlink, os.readlink(item.path))
+            else:
+                create = os.mkdir if item.is_dir else create_empty_file
+            # 고른 이름을 배타적 생성으로 바로 선점 (VULN-03)
+            dest = resolver.create_unique(item.name, create)
+            if item.is_symlink:
+                # 링크는 만들면서 다 옮겨졌다
+                try:
+                    os.unlink(item.path)
+                except OSError:
+                    os.unlink(dest)
+                    raise
+                if progress is not None:
+                    progress.file_done()
+            elif item.is_dir:
+                engine.add_placeholder(str(dest), is_dir=True)
+                # 도중에 실패해도 일부는 옮겨지므로 순회하기 전에 기록해 둔다
+                changes.renamed[item.path] = dest
+                moved.append(dest)
+                engine.copy_tree(str(item.path), str(dest), create_root=False)
+                continue
+            else:
+                engine.add_placeholder(str(dest))
+                if not engine.copy_file(str(item.path), str(dest)):
+                    break  # 엔진이 받지 않은 파일은 원본 그대로 — 기록하지 않는다
+            changes.renamed[item.path] = dest
+            moved.append(dest)
+        engine.finish()
+    finally:
+        engine.close()
+    return moved
+
+
+def _rename_unique(src: Path, resolver: ConflictResolver) -> Path:
+    """resolver 가 고른 이름으로 덮어쓰지 않고 rename. 그 사이 생긴 이름이면 다음 후보로 (VULN-03)."""
+    while True:
+        dest = resolver.resolve(src.name)
+        try:
+            _rename_no_replace(src, dest)
+        except FileExistsError:
+            continue
+        except OSError:
+            resolver.release(dest)
+            raise
+        return dest
+
+
+def _rename_no_replace(src: Path, dest: Path) -> None:
+    """dest 가 이미 있으면 FileExistsError 를 내는 rename (다른 프로그램이 만든 항목을 덮어쓰지 않음).
+
+    Linux 는 renameat2(RENAME_NOREPLACE) 로 원자적으로 확인한다. 쓸 수 없으면 일반
+    파일은 link + unlink (link 는 대상이 있으면 실패), 그 밖에는 바로 앞에서 lstat 으로
+    한 번 더 확인한 뒤 rename 한다 (rename._rename_no_replace 와 같음).
+    """
+    if _renameat2 is not None:
+        result = _renameat2(
+            _AT_FDCWD, os.fsencode(src), _AT_FDCWD, os.fsencode(dest), _RENAME_NOREPLACE
+        )
+        if result == 0:
+            return
+        err = ctypes.get_errno()
+        if err not in _NOREPLACE_UNSUPPORTED:
+            raise OSError(err, os.strerror(err), str(src), None, str(dest))
+    if stat_mod.S_ISREG(os.lstat(src).st_mode):
+        try:
+            os.link(src, dest, follow_symlinks=False)
+        except OSError as e:
+            # 하드 링크를 지원하지 않는 파일 시스템 (vfat 등) 은 아래로
+            if e.errno in (errno.EEXIST, errno.EXDEV):
+                raise
+        else:
+            os.unlink(src)
+            return
+    if os.path.lexists(dest):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dest))
+    os.rename(src, dest)
+
+
+def _totals(item: FileItem) -> tuple[int, int]:
+    progress = OperationProgress()
+    add_totals([item], progress)
+    return progress.files_total, progress.bytes_total
+
+
+def _is_inside(path: Path, ancestor: Path) -> bool:
+    try:
+        return path.resolve().is_relative_to(ancestor.resolve())
+    except OSError:
+        return False
+
+
+def _move_error(error: OSError, name: str, path: Path) -> FileOperationError:
+    if isinstance(error, PermissionError):
+        return FileOperationError(f"권한 없음: {name}", path)
+    return FileOperationError(f"이동 실패: {name} — {error}", path)
@@ -0,0 +1,192 @@
+"""파일 작업 진행 상황 (바이트/파일 수, 처리량, 남은 시간).
+
+작업 스레드는 카운터만 더하고(advance / file_done), 화면은 타이머로
+PROGRESS_REFRESH_INTERVAL 마다 snapshot() 을 읽어 표시한다. 작업 쪽에서
+메시지를 보내지 않으므로 진행 표시가 빠른 복사의 병목이 되지 않는다.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from mdir.models.file_item import format_size
+
+# 화면 갱신 간격 (초)
+PROGRESS_REFRESH_INTERVAL = 0.25
+# 처리량 이동 평균의 시간 상수 (초) — 클수록 ETA 가 덜 흔들린다
+RATE_WINDOW = 3.0
+# 이보다 짧은 간격의 샘플은 처리량 계산에 쓰지 않는다
+_MIN_SAMPLE = 0.1
+
+
+@dataclass(frozen=True)
+class ProgressSnapshot:
+    """어느 한 시점의 진행 상황 (화면 표시용)."""
+
+    label: str
+    files_done: int
+    files_total: int
+    bytes_done: int
+    bytes_total: int
+    current: str
+    elapsed: float
+    rate: float  # 바이트/초 (이동 평균)
+    scanning: bool
+    file_rate: float = 0.0  # 파일/초 (이동 평균)
+
+    @property
+    def fraction(self) -> float:
+        """0.0 ~ 1.0. 바이트가 없으면 파일 수 기준."""
+        if self.bytes_total > 0:
+            return min(1.0, self.bytes_done / self.bytes_total)
+        if self.files_total > 0:
+            return min(1.0, self.files_done / self.files_total)
+        return 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """남은 시간(초). 바이트가 없는 작업(삭제 등)은 파일 수 기준. 처리량을 모르면 None."""
+        if self.scanning:
+            return None
+        if self.bytes_total > 0:
+            if self.rate <= 0:
+                return None
+            return max(0.0, (self.bytes_total - self.bytes_done) / self.rate)
+        if self.files_total > 0 and self.file_rate > 0:
+            return max(0.0, (self.files_total - self.files_done) / self.file_rate)
+        return None
+
+    def describe(self) -> str:
+        """예: '복사 1.2G/40.0G (3%) · 120/5000개 · 180.0M/s · 남은 시간 3:40'.
+
+        바이트가 없는 작업은 '삭제 1200/5000개 (24%) · 830개/s · 남은 시간 0:05'.
+        """
+        if self.scanning:
+            if self.bytes_total == 0:
+                return f"{self.label} 준비 중… {self.files_total}개"
+            return f"{self.label} 준비 중… {self.files_total}개 ({format_size(self.bytes_total)})"
+        percent = f"({int(self.fraction * 100)}%)"
+        if self.bytes_total == 0:
+            parts = [f"{self.label} {self.files_done}/{self.files_total}개 {percent}"]
+            if self.file_rate > 0:
+                parts.append(f"{self.file_rate:.0f}개/s")
+        else:
+            parts = [
+                f"{self.label} {format_size(self.bytes_done)}/{format_size(self.bytes_total)} {percent}",
+                f"{self.files_done}/{self.files_total}개",
+            ]
+            if self.rate > 0:
+                parts.append(f"{format_size(int(self.rate))}/s")
+        eta = self.eta
+        if eta is not None:
+            parts.append(f"남은 시간 {format_duration(eta)}")
+        return " · ".join(parts)
+
+    def completed(self) -> str:
+        """끝낸 분량. 예: '파일 120/5000개 · 1.2G/40.0G 완료' (바이트가 없으면 '항목 …')."""
+        if self.bytes_total == 0:
+            return f"항목 {self.files_done}/{self.files_total}개 완료"
+        return (
+            f"파일 {self.files_done}/{self.files_total}개 · "
+            f"{format_size(self.bytes_done)}/{format_size(self.bytes_total)} 완료"
+        )
+
+
+class OperationProgress:
+    """작업 하나의 진행 카운터 (여러 작업 스레드에서 동시에 갱신 가능)."""
+
+    def __init__(
+        self,
+        label: str = "",
+        rate_window: float = RATE_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.label = label
+        self.rate_window = rate_window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.files_total = 0
+        self.bytes_total = 0
+        self.files_done = 0
+        self.bytes_done = 0
+        self.current = ""
+        self.scanning = True
+        self._started = clock()
+        # 처리량 이동 평균 상태 (snapshot 에서만 갱신)
+        self._rate: float | None = None
+        self._file_rate = 0.0
+        self._sample_time = self._started
+        self._sample_bytes = 0
+        self._sample_files = 0
+
+    def add_total(self, files: int, nbytes: int) -> None:
+        """작업 전체 분량 추가 (사전 조사 단계)."""
+        with self._lock:
+            self.files_total += files
+            self.bytes_total += nbytes
+
+    def finish_scan(self) -> None:
+        """사전 조사를 마치고 실제 작업 시작. 처리량은 이때부터 잰다."""
+        with self._lock:
+            self.scanning = False
+            self._started = self._sample_time = self._clock()
+            self._sample_bytes = self.bytes_done
+            self._sample_files = self.files_done
+
+    def set_current(self, name: str) -> None:
+        self.current = name
+
+    def advance(self, nbytes: int) -> None:
+        """nbytes 만큼 데이터 처리 (파일 복사 중 덩어리마다 호출)."""
+        with self._lock:
+            self.bytes_done += nbytes
+
+    def file_done(self, count: int = 1) -> None:
+        with self._lock:
+            self.files_done += count
+
+    def snapshot(self) -> ProgressSnapshot:
+        """현재 상태. 호출할 때마다 처리량 이동 평균을 갱신한다 (UI 스레드에서 호출)."""
+        now = self._clock()
+        with self._lock:
+            dt = now - self._sample_time
+            if not self.scanning and dt >= _MIN_SAMPLE:
+                instant = (self.bytes_done - self._sample_bytes) / dt
+                instant_files = (self.files_done - self._sample_files) / dt
+                if self._rate is None:
+                    self._rate = instant
+                    self._file_rate = instant_files
+                else:
+                    # 시간 간격에 맞춘 지수 이동 평균
+                    alpha = 1.0 - math.exp(-dt / self.rate_window)
+                    self._rate += alpha * (instant - self._rate)
+                    self._file_rate += alpha * (instant_files - self._file_rate)
+                self._sample_time = now
+                self._sample_bytes = self.bytes_done
+                self._sample_files = self.files_done
+            return ProgressSnapshot(
+                label=self.label,
+                files_done=self.files_done,
+                files_total=self.files_total,
+                bytes_done=self.bytes_done,
+                bytes_total=self.bytes_total,
+                current=self.current,
+                elapsed=now - self._started,
+                rate=self._rate or 0.0,
+                scanning=self.scanning,
+                file_rate=self._file_rate,
+            )
+
+
+def format_duration(seconds: float) -> str:
+    """초 → 'm:ss' 또는 'h:mm:ss'."""
+    total = int(seconds + 0.5)
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
@@ -0,0 +1,214 @@
+"""디렉토리 트리 영구 삭제 (병렬, 디렉토리 fd 기준).
+
+각 디렉토리를 O_NOFOLLOW 로 열어 그 fd 를 기준으로 scandir / unlinkat /
+rmdir(dir_fd=) 만 사용한다. 경로 문자열을 다시 해석하지 않으므로 삭제 도중
+누군가 디렉토리를 심링크로 바꿔치기해도 트리 밖으로 따라가지 않는다.
+
+작업 스레드들이 공유 스택(LIFO)에서 디렉토리를 꺼내 파일을 지우고 하위
+디렉토리를 다시 스택에 넣는다. 디렉토리는 하위 디렉토리가 모두 지워진 뒤
+(아래에서 위로) 마지막으로 끝난 스레드가 지운다. 깊이 우선이라 동시에 열려
+있는 fd 는 대략 (깊이 × 스레드 수) 로 제한된다.
+
+dir_fd 를 지원하지 않는 OS 에서는 shutil.rmtree 로 대신한다.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from mdir.operations.cancel import CancelToken
+from mdir.operations.exceptions import OperationCancelledError
+from mdir.operations.progress import OperationProgress
+
+_HAS_DIR_FD = (
+    {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd and os.scandir in os.supports_fd
+)
+
+_DIR_FLAGS = (
+    os.O_RDONLY
+    | getattr(os, "O_DIRECTORY", 0)
+    | getattr(os, "O_NOFOLLOW", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+)
+
+
+class _Dir:
+    """삭제 중인 디렉토리 하나. pending: 자기 scan 1 + 아직 남은 하위 디렉토리 수."""
+
+    __slots__ = ("name", "parent", "fd", "pending")
+
+    def __init__(self, name: str | None, parent: _Dir | None, fd: int = -1) -> None:
+        self.name = name
+        self.parent = parent
+        self.fd = fd
+        self.pending = 1
+
+
+def count_entries(root: Path, cancel: CancelToken | None = None) -> int:
+    """root 아래 항목 수 (루트 포함). d_type 만 보고 stat 하지 않는다 (진행 표시용)."""
+    count = 1
+    stack = [str(root)]
+    while stack:
+        if cancel is not None and cancel.cancelled:
+            break
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    count += 1
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return count
+
+
+class TreeRemover:
+    """디렉토리 트리를 병렬로 영구 삭제.
+
+    progress: 지운 항목(파일·링크·디렉토리) 하나마다 file_done()
+    cancel: 취소되면 새 항목을 지우지 않고 OperationCancelledError (일부만 지워진 채로 남음).
+        일시정지 중이면 항목을 하나 지울 때마다 재개될 때까지 기다린다
+    첫 OSError 에서 멈추고 그 오류를 다시 일으킨다.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        progress: OperationProgress | None = None,
+        cancel: CancelToken | None = None,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.progress = progress
+        self.cancel = cancel
+        self._cond = threading.Condition()
+        self._stack: list[_Dir] = []
+        self._active = 0
+        self._error: OSError | None = None
+        self._open: set[_Dir] = set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._error is not None or (self.cancel is not None and self.cancel.cancelled)
+
+    def remove(self, path: Path) -> None:
+        """path(디렉토리 트리, 파일, 심링크)를 지움. 심링크는 링크만 지운다."""
+        if not path.is_dir() or path.is_symlink():
+            os.unlink(path)
+            self._done()
+            return
+        if not _HAS_DIR_FD:
+            shutil.rmtree(path)
+            return
+
+        parent_fd = os.open(path.parent, _DIR_FLAGS & ~getattr(os, "O_NOFOLLOW", 0))
+        anchor = _Dir(None, None, parent_fd)
+        self._stack = [_Dir(path.name, anchor)]
+        anchor.pending += 1
+        self._error = None
+        try:
+            if self.workers == 1:
+                self._work()
+            else:
+                threads = [
+                    threading.Thread(target=self._work, name=f"mdir-remove-{i}", daemon=True)
+                    for i in range(self.workers)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            # 멈춘 경우 끝내지 못한 디렉토리의 fd 정리
+            for node in self._open:
+                os.close(node.fd)
+            self._open.clear()
+            self._stack.clear()
+            os.close(parent_fd)
+        if self._error is not None:
+            raise self._error
+        if self.cancel is not None and self.cancel.cancelled:
+            raise OperationCancelledError()
+
+    # ── 작업 스레드 ──────────────────────────
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stack and self._active and not self.stopped:
+                    self._cond.wait()
+                if self.stopped or not self._stack:
+                    self._cond.notify_all()
+                    return
+                node = self._stack.pop()
+                self._active += 1
+            try:
+                self._scan(node)
+            except OSError as e:
+                with self._cond:
+                    if self._error is None:
+                        self._error = e
+            finally:
+                with self._cond:
+                    self._active -= 1
+                    self._cond.notify_all()
+
+    def _scan(self, node: _Dir) -> None:
+        parent_fd = node.parent.fd
+        try:
+            fd = os.open(node.name, _DIR_FLAGS, dir_fd=parent_fd)
+        except OSError as e:
+            if e.errno not in (errno.ELOOP, errno.ENOTDIR):
+                raise
+            # 그 사이 심링크·파일로 바뀜 — 따라가지 않고 항목 자체만 지운다
+            os.unlink(node.name, dir_fd=parent_fd)
+            self._done()
+            self._release(node.parent)
+            return
+        node.fd = fd
+        with self._cond:
+            self._open.add(node)
+        children: list[_Dir] = []
+        with os.scandir(fd) as it:
+            for entry in it:
+                if self.stopped:
+                    break
+                if entry.is_dir(follow_symlinks=False):
+                    children.append(_Dir(entry.name, node))
+                else:
+                    os.unlink(entry.name, dir_fd=fd)
+                    self._done()
+        if children:
+            with self._cond:
+                node.pending += len(children)
+                self._stack.extend(children)
+                self._cond.notify_all()
+        self._release(node)
+
+    def _release(self, node: _Dir) -> None:
+        """node 의 남은 일 하나 완료. 모두 끝났으면 지우고 부모로 올라간다."""
+        while node.name is not None:
+            with self._cond:
+                node.pending -= 1
+                if node.pending or self.stopped:
+                    return
+                self._open.discard(node)
+            os.close(node.fd)
+            os.rmdir(node.name, dir_fd=node.parent.fd)
+            self._done()
+            node = node.parent
+        # 맨 위(삭제 대상의 부모)는 지우지 않는다
+        with self._cond:
+            node.pending -= 1
+
+    def _done(self) -> None:
+        if self.progress is not None:
+            self.progress.file_done()
+        if self.cancel is not None:
+            self.cancel.wait_if_paused()
@@ -0,0 +1,317 @@
+"""여러 항목 이름 한꺼번에 바꾸기 (템플릿 · 정규식 치환 · 수정 시각).
+
+새 이름은 템플릿으로 만든 뒤 정규식 치환을 적용한다. 템플릿 항목:
+    {name}  확장자를 뺀 이름 (폴더는 전체 이름)
+    {ext}   점을 포함한 확장자 (없으면 빈 문자열)
+    {n}     순번 (목록 순서, start 부터). {n:03} 처럼 자릿수 지정
+    {mtime} 수정 시각. 기본 %Y%m%d_%H%M%S, {mtime:%Y-%m-%d} 처럼 strftime 형식 지정
+
+계획(RenamePlan)은 메모리 안에서만 만든다: 이름 검사, 배치 안 중복, 기존 항목과의
+충돌을 한 번에 확인하고, 실행할 때는 a→b→c 같은 사슬과 a→b, b→a 같은 순환을
+임시 이름을 거쳐 덮어쓰지 않는 순서로 바꾼다.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import string
+import sys
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from mdir.models.changes import ChangeSet
+from mdir.models.file_item import FileItem
+from mdir.operations.cancel import CancelToken
+from mdir.operations.delete import _validate_filename
+from mdir.operations.exceptions import FileOperationError, OperationCancelledError
+from mdir.operations.progress import OperationProgress
+
+DEFAULT_TEMPLATE = "{name}{ext}"
+
+_FIELDS = ("name", "ext", "n", "mtime")
+_MTIME_FORMAT = "%Y%m%d_%H%M%S"
+# 순환을 풀 때 쓰는 임시 이름 (숨김 파일로 만든다)
+_TEMP_PREFIX = ".mdir-rename-"
+
+
+class _TemplateFormatter(string.Formatter):
+    """정해진 항목만 허용하는 str.format (속성·인덱스 접근 차단)."""
+
+    def get_field(self, field_name, args, kwargs):
+        if field_name not in _FIELDS:
+            raise FileOperationError(f"알 수 없는 템플릿 항목: {{{field_name}}}")
+        return kwargs[field_name], field_name
+
+    def format_field(self, value, format_spec: str) -> str:
+        if isinstance(value, datetime):
+            return value.strftime(format_spec or _MTIME_FORMAT)
+        return format(value, format_spec)
+
+
+_FORMATTER = _TemplateFormatter()
+
+
+@dataclass
+class RenameRule:
+    """새 이름을 만드는 규칙.
+
+    find: 템플릿 결과에 적용할 정규식 (비어 있으면 치환하지 않음)
+    replace: 치환 문자열 (\\1 같은 그룹 참조 가능)
+    """
+
+    template: str = DEFAULT_TEMPLATE
+    find: str = ""
+    replace: str = ""
+    start: int = 1
+
+    def compile(self) -> re.Pattern[str] | None:
+        """템플릿과 정규식을 한 번만 검사. Raises: FileOperationError."""
+        try:
+            for _, field_name, _, _ in _FORMATTER.parse(self.template):
+                if field_name is not None and field_name not in _FIELDS:
+                    raise FileOperationError(f"알 수 없는 템플릿 항목: {{{field_name}}}")
+        except ValueError as e:
+            raise FileOperationError(f"템플릿 오류: {e}") from e
+        if not self.find:
+            return None
+        try:
+            return re.compile(self.find)
+        except re.error as e:
+            raise FileOperationError(f"정규식 오류: {e}") from e
+
+    def render(self, item: FileItem, n: int, pattern: re.Pattern[str] | None) -> str:
+        """항목 하나의 새 이름. Raises: FileOperationError (형식 지정 오류)."""
+        if item.is_dir:
+            stem, ext = item.name, ""
+        else:
+            dot = item.name.rfind(".")
+            stem, ext = (item.name[:dot], item.name[dot:]) if dot > 0 else (item.name, "")
+        try:
+            name = _FORMATTER.format(
+                self.template,
+                name=stem,
+                ext=ext,
+                n=n,
+                mtime=datetime.fromtimestamp(item.mtime_ns / 1_000_000_000),
+            )
+            if pattern is not None:
+                name = pattern.sub(self.replace, name)
+        except (ValueError, IndexError, re.error) as e:
+            raise FileOperationError(f"템플릿 오류: {e}") from e
+        return name.strip()
+
+
+@dataclass(slots=True)
+class RenameEntry:
+    """항목 하나의 계획. problem 이 있으면 바꾸지 않는다."""
+
+    item: FileItem
+    new_name: str
+    problem: str = ""
+
+    @property
+    def changed(self) -> bool:
+        return self.new_name != self.item.name
+
+
+@dataclass
+class RenamePlan:
+    """한 디렉토리 안의 이름 변경 계획 (plan_renames 결과)."""
+
+    parent: Path
+    entries: list[RenameEntry] = field(default_factory=list)
+    existing: set[str] = field(default_factory=set, repr=False)
+
+    @property
+    def renames(self) -> list[RenameEntry]:
+        """실제로 바꿀 항목 (이름이 달라지고 문제가 없는 것)."""
+        return [e for e in self.entries if e.changed and not e.problem]
+
+    @property
+    def problems(self) -> list[RenameEntry]:
+        return [e for e in self.entries if e.problem]
+
+    def summary(self) -> str:
+        renames = len(self.renames)
+        problems = len(self.problems)
+        text = f"이름 변경 {renames}개 · 그대로 {len(self.entries) - renames - problems}개"
+        if problems:
+            text += f" · 문제 {problems}개 (건너뜀)"
+        return text
+
+    def steps(self) -> list[tuple[str, str]]:
+        """덮어쓰지 않는 실행 순서 (이전 이름, 새 이름).
+
+        새 이름이 비어 있는 항목부터 시작해 그 항목이 비운 이름을 쓰는 항목을 거슬러
+        올라가고(사슬), 남은 순환은 한 항목을 임시 이름으로 옮겨 풀어 준다.
+        """
+        moves = {e.item.name: e.new_name for e in self.renames}
+        by_target = {dst: src for src, dst in moves.items()}
+        steps: list[tuple[str, str]] = []
+        done: set[str] = set()
+
+        def pull(freed: str, stop: str | None = None) -> None:
+            # freed 가 비었으므로 freed 를 새 이름으로 쓰는 항목을 차례로 옮긴다
+            while (src := by_target.get(freed)) is not None and src != stop:
+                steps.append((src, freed))
+                done.add(src)
+                freed = src
+
+        for src, dst in moves.items():
+            if dst not in moves:
+                steps.append((src, dst))
+                done.add(src)
+                pull(src)
+
+        temp_names = (f"{_TEMP_PREFIX}{i}" for i in range(sys.maxsize))
+        taken = self.existing | set(moves.values())
+        for src, dst in moves.items():
+            if src in done:
+                continue
+            temp = next(t for t in temp_names if t not in taken)
+            steps.append((src, temp))
+            done.add(src)
+            pull(src, stop=src)
+            steps.append((temp, dst))
+        return steps
+
+
+def directory_names(parent: Path) -> set[str]:
+    """디렉토리의 모든 이름 (숨김 포함, 충돌 검사용). Raises: FileOperationError."""
+    try:
+        return set(os.listdir(parent))
+    except OSError as e:
+        raise FileOperationError(f"폴더를 읽을 수 없습니다: {e}", parent) from e
+
+
+def plan_renames(
+    items: Iterable[FileItem], rule: RenameRule, existing: set[str] | None = None
+) -> RenamePlan:
+    """items(같은 디렉토리, 목록 순서) 의 새 이름 계획. 파일 시스템은 바꾸지 않는다.
+
+    existing: 디렉토리에 있는 모든 이름 (없으면 한 번 읽음, 숨김 포함)
+    Raises: FileOperationError (템플릿·정규식 자체가 잘못된 경우)
+    """
+    items = [item for item in items if item.name != ".."]
+    if not items:
+        return RenamePlan(Path("."))
+    parent = items[0].parent
+    pattern = rule.compile()
+    if existing is None:
+        existing = directory_names(parent)
+    plan = RenamePlan(parent, existing=existing)
+
+    # 배치 전체를 한 번에 검사 — 새 이름에 구분자·'..' 가 없으면 결과 경로는
+    # 항상 parent 바로 아래이므로 항목마다 resolve() 하지 않는다 (VULN-01)
+    for n, item in enumerate(items, rule.start):
+        entry = RenameEntry(item, rule.render(item, n, pattern))
+        if entry.changed:
+            try:
+                _validate_filename(entry.new_name)
+            except FileOperationError as e:
+                entry.problem = str(e)
+        plan.entries.append(entry)
+
+    counts = Counter(e.new_name for e in plan.entries if not e.problem)
+    for entry in plan.entries:
+        if entry.changed and not entry.problem and counts[entry.new_name] > 1:
+            entry.problem = f"이름 중복: {entry.new_name}"
+
+    # 새 이름이 이미 있고 그 항목이 비켜 주지 않으면 충돌. 막힌 항목은 제 이름을
+    # 비우지 못하므로, 그 이름을 쓰려던 항목도 차례로 막힌다.
+    moving = {e.item.name: e for e in plan.entries if e.changed and not e.problem}
+    by_target = {e.new_name: e for e in moving.values()}
+    blocked = [e for e in moving.values() if e.new_name in existing and e.new_name not in moving]
+    for entry in blocked:
+        entry.problem = f"이미 존재하는 이름: {entry.new_name}"
+    while blocked:
+        entry = blocked.pop()
+        waiting = by_target.get(entry.item.name)
+        if waiting is not None and not waiting.problem:
+            waiting.problem = f"'{entry.item.name}' 이(가) 바뀌지 않아 쓸 수 없음"
+            blocked.append(waiting)
+    return plan
+
+
+def rename_batch(
+    plan: RenamePlan,
+    changes: ChangeSet | None = None,
+    progress: OperationProgress | None = None,
+    cancel: CancelToken | None = None,
+) -> int:
+    """plan 의 이름 변경을 안전한 순서로 실행. 바꾼 항목 수 반환.
+
+    도중에 실패하거나 취소되면 이미 바꾼 이름을 되돌린다 (되돌리지 못하면
+    changes.trusted=False).
+    Raises: FileOperationError, OperationCancelledError
+    """
+    parent = plan.parent
+    renames = plan.renames
+    steps = plan.steps()
+    targets = {entry.new_name for entry in renames}
+    if progress is not None:
+        progress.add_total(len(renames), 0)
+        progress.finish_scan()
+    done: list[tuple[str, str]] = []
+    try:
+        for src, dst in steps:
+            if cancel is not None:
+                cancel.check()
+            _rename_no_replace(parent / src, parent / dst)
+            done.append((src, dst))
+            if progress is not None and dst in targets:  # 임시 이름으로 옮긴 단계는 세지 않음
+                progress.file_done()
+    except OperationCancelledError:
+        restored = _undo(parent, done, changes)
+        raise OperationCancelledError(
+            "바꾼 이름을 모두 되돌렸습니다" if restored else "일부 이름을 되돌리지 못했습니다"
+        ) from None
+    except FileOperationError as e:
+        restored = _undo(parent, done, changes)
+        note = "바꾼 이름은 모두 되돌렸습니다" if restored else "일부 이름을 되돌리지 못했습니다"
+        raise FileOperationError(f"{e} — {note}", e.path) from e
+
+    if changes is not None:
+        for entry in renames:
+            changes.renamed[entry.item.path] = parent / entry.new_name
+    return len(renames)
+
+
+def _rename_no_replace(src: Path, dest: Path) -> None:
+    """대상이 있으면 실패하는 rename.
+
+    POSIX rename 은 대상을 조용히 덮어쓰므로 바로 앞에서 lstat 으로 한 번 더 확인한다.
+    대소문자만 다른 이름(대소문자 무시 파일 시스템에서 같은 항목)은 허용한다.
+    """
+    try:
+        dest_stat = os.lstat(dest)
+    except FileNotFoundError:
+        dest_stat = None
+    except OSError as e:
+        raise FileOperationError(f"이름 변경 실패: {dest.name} — {e}", dest) from e
+    try:
+        if dest_stat is not None and not os.path.samestat(dest_stat, os.lstat(src)):
+            raise FileOperationError(f"이미 존재하는 이름: {dest.name}", dest)
+        os.rename(src, dest)
+    except FileNotFoundError as e:
+        raise FileOperationError(f"항목이 사라졌습니다: {src.name}", src) from e
+    except PermissionError as e:
+        raise FileOperationError(f"권한 없음: {src.name}", src) from e
+    except OSError as e:
+        raise FileOperationError(f"이름 변경 실패: {src.name} — {e}", src) from e
+
+
+def _undo(parent: Path, done: list[tuple[str, str]], changes: ChangeSet | None) -> bool:
+    """끝낸 단계를 거꾸로 되돌림. 모두 되돌렸으면 True."""
+    for src, dst in reversed(done):
+        try:
+            os.rename(parent / dst, parent / src)
+        except OSError:
+            if changes is not None:
+                changes.trusted = False
+            return False
+    return True
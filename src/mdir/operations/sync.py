@@ -0,0 +1,370 @@
+"""단방향 증분 동기화 (원본 폴더 → 대상 폴더).
+
+두 트리를 디렉토리 단위로 함께 내려가며(작업 스레드 여러 개) 같은 상대 경로의
+항목끼리 비교한다. 파일은 (크기, mtime_ns) 가 같으면 같은 것으로 보고,
+checksum 이면 크기가 같은 파일의 내용을 해시로 비교한다. 복사 엔진이 mtime 을
+보존하므로 한 번 동기화한 트리는 다음 실행에서 항목마다 lstat 한 번씩으로 끝난다.
+
+plan_sync() 로 계획(dry-run)을 만들어 보여 주고 run_sync() 로 실행한다.
+심링크는 따라가지 않고 링크 자체를 비교·복사한다 (VULN-02).
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from mdir.models.changes import ChangeSet
+from mdir.models.file_item import format_size
+from mdir.operations.cancel import CancelToken
+from mdir.operations.copy import CopyEngine, CopyTaskError, map_copy_error
+from mdir.operations.device import default_workers
+from mdir.operations.exceptions import FileOperationError, OperationCancelledError
+from mdir.operations.progress import OperationProgress
+from mdir.operations.remove import TreeRemover
+from mdir.operations.verify import DEFAULT_ALGORITHM, hash_file
+from mdir.operations.walk import KIND_FILE, KIND_SYMLINK
+
+# 복사 이유
+SYNC_NEW = "new"
+SYNC_CHANGED = "changed"
+
+# 바뀐 파일을 복사해 둘 임시 이름 (같은 폴더, 끝나면 기존 파일과 바꿈)
+_TEMP_PREFIX = ".mdir-sync-"
+
+# 계획 미리보기에 보여 줄 항목 수
+_PREVIEW_LINES = 8
+
+
+@dataclass(frozen=True)
+class SyncOptions:
+    """동기화 설정.
+
+    checksum: 크기가 같으면 mtime 대신 내용(해시)으로 비교 — 모든 후보를 양쪽에서 읽는다
+    delete: 원본에 없는 대상 항목을 지움 (종류가 다른 항목은 지우고 다시 복사)
+    """
+
+    checksum: bool = False
+    delete: bool = False
+    algorithm: str = DEFAULT_ALGORITHM
+
+
+@dataclass(frozen=True, slots=True)
+class SyncCopy:
+    """복사할 항목 하나. rel: 루트 기준 상대 경로."""
+
+    rel: str
+    kind: str  # KIND_FILE / KIND_SYMLINK
+    reason: str  # SYNC_NEW / SYNC_CHANGED
+    size: int = 0
+
+
+@dataclass
+class SyncPlan:
+    """동기화 계획 (아직 아무것도 바꾸지 않음).
+
+    mkdirs: 대상에 새로 만들 디렉토리 / deletes: 대상에서 지울 항목 (하위 트리째)
+    conflicts: 종류가 달라(파일 ↔ 폴더 등) 건너뛰는 항목 (delete 가 아닐 때)
+    """
+
+    src_root: Path
+    dest_root: Path
+    options: SyncOptions = field(default_factory=SyncOptions)
+    mkdirs: list[str] = field(default_factory=list)
+    copies: list[SyncCopy] = field(default_factory=list)
+    deletes: list[str] = field(default_factory=list)
+    conflicts: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    hashed: int = 0
+
+    @property
+    def empty(self) -> bool:
+        """할 일이 없는지."""
+        return not (self.mkdirs or self.copies or self.deletes)
+
+    @property
+    def bytes_total(self) -> int:
+        return sum(c.size for c in self.copies)
+
+    def summary(self) -> str:
+        """예: '새 파일 12개, 변경 3개 (1.2G), 새 폴더 2개, 삭제 4개, 같음 9800개'."""
+        new = sum(1 for c in self.copies if c.reason == SYNC_NEW)
+        parts = [f"새 파일 {new}개", f"변경 {len(self.copies) - new}개"]
+        if self.copies:
+            parts[-1] += f" ({format_size(self.bytes_total)})"
+        if self.mkdirs:
+            parts.append(f"새 폴더 {len(self.mkdirs)}개")
+        if self.deletes:
+            parts.append(f"삭제 {len(self.deletes)}개")
+        if self.conflicts:
+            parts.append(f"충돌 {len(self.conflicts)}개")
+        parts.append(f"같음 {self.unchanged}개")
+        return ", ".join(parts)
+
+    def preview(self, limit: int = _PREVIEW_LINES) -> list[str]:
+        """계획 앞부분 (+ 새 항목, ~ 변경, - 삭제, ! 충돌)."""
+        lines = [f"- {rel}" for rel in self.deletes]
+        lines += [f"+ {rel}{os.sep}" for rel in self.mkdirs]
+        lines += [f"{'+' if c.reason == SYNC_NEW else '~'} {c.rel}" for c in self.copies]
+        lines += [f"! {rel}" for rel in self.conflicts]
+        if len(lines) > limit:
+            lines = lines[:limit] + [f"… 외 {len(lines) - limit}개"]
+        return lines
+
+
+@dataclass
+class _DirResult:
+    """디렉토리 한 쌍을 비교한 결과 (작업 스레드 → 순회 스레드)."""
+
+    subdirs: list[tuple[str, bool]] = field(default_factory=list)  # (rel, 대상에 있음)
+    mkdirs: list[str] = field(default_factory=list)
+    copies: list[SyncCopy] = field(default_factory=list)
+    deletes: list[str] = field(default_factory=list)
+    conflicts: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    hashed: int = 0
+
+
+class _Planner:
+    def __init__(
+        self,
+        src_root: str,
+        dest_root: str,
+        options: SyncOptions,
+        progress: OperationProgress | None,
+        cancel: CancelToken | None,
+    ) -> None:
+        self.src_root = src_root
+        self.dest_root = dest_root
+        self.options = options
+        self.progress = progress
+        self.cancel = cancel
+
+    def compare_dir(self, rel: str, dest_exists: bool, names: set[str] | None = None) -> _DirResult:
+        result = _DirResult()
+        if self.cancel is not None and self.cancel.cancelled:
+            return result
+        src_dir = os.path.join(self.src_root, rel) if rel else self.src_root
+        dest_dir = os.path.join(self.dest_root, rel) if rel else self.dest_root
+        with os.scandir(src_dir) as it:
+            src_entries = [e for e in it if names is None or e.name in names]
+        dest_entries: dict[str, os.DirEntry] = {}
+        if dest_exists:
+            with os.scandir(dest_dir) as it:
+                dest_entries = {e.name: e for e in it if names is None or e.name in names}
+        if self.progress is not None:
+            self.progress.add_total(len(src_entries), 0)
+
+        for entry in src_entries:
+            child = os.path.join(rel, entry.name) if rel else entry.name
+            other = dest_entries.pop(entry.name, None)
+            if entry.is_dir(follow_symlinks=False):
+                if other is not None and other.is_dir(follow_symlinks=False):
+                    result.subdirs.append((child, True))
+                elif self._replace(other, child, result):
+                    result.mkdirs.append(child)
+                    result.subdirs.append((child, False))
+            elif entry.is_symlink():
+                if other is not None and other.is_symlink():
+                    if os.readlink(entry.path) == os.readlink(other.path):
+                        result.unchanged += 1
+                    else:
+                        result.copies.append(SyncCopy(child, KIND_SYMLINK, SYNC_CHANGED))
+                elif self._replace(other, child, result):
+                    result.copies.append(SyncCopy(child, KIND_SYMLINK, SYNC_NEW))
+            elif entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                if other is not None and other.is_file(follow_symlinks=False):
+                    if self._same_file(entry.path, st, other, result):
+                        result.unchanged += 1
+                    else:
+                        result.copies.append(SyncCopy(child, KIND_FILE, SYNC_CHANGED, st.st_size))
+                elif self._replace(other, child, result):
+                    result.copies.append(SyncCopy(child, KIND_FILE, SYNC_NEW, st.st_size))
+            # FIFO·소켓·장치 파일은 동기화하지 않는다
+
+        if self.options.delete:
+            for name in dest_entries:
+                result.deletes.append(os.path.join(rel, name) if rel else name)
+        return result
+
+    def _replace(self, other: os.DirEntry | None, rel: str, result: _DirResult) -> bool:
+        """대상에 종류가 다른 항목이 있으면 delete 일 때만 지우고 새로 만든다."""
+        if other is None:
+            return True
+        if self.options.delete:
+            result.deletes.append(rel)
+            return True
+        result.conflicts.append(rel)
+        return False
+
+    def _same_file(
+        self, src: str, st: os.stat_result, other: os.DirEntry, result: _DirResult
+    ) -> bool:
+        dst = other.stat(follow_symlinks=False)
+        if st.st_size != dst.st_size:
+            return False
+        if not self.options.checksum:
+            return st.st_mtime_ns == dst.st_mtime_ns
+        result.hashed += 1
+        algorithm = self.options.algorithm
+        return hash_file(src, algorithm) == hash_file(other.path, algorithm)
+
+
+def plan_sync(
+    src_root: Path,
+    dest_root: Path,
+    options: SyncOptions | None = None,
+    names: list[str] | None = None,
+    progress: OperationProgress | None = None,
+    cancel: CancelToken | None = None,
+    workers: int | None = None,
+) -> SyncPlan:
+    """src_root 의 내용을 dest_root 에 맞추기 위한 계획 (파일시스템은 바꾸지 않음).
+
+    - names: 주어지면 src_root 바로 아래의 그 이름들만 동기화 (선택 항목)
+    - progress: 비교한 원본 항목 수를 기록 (준비 단계로 표시)
+    - workers: 동시에 비교할 디렉토리 수 (없으면 장치에 맞춰 결정)
+    Raises: FileOperationError, OperationCancelledError
+    """
+    options = options or SyncOptions()
+    if _overlaps(src_root, dest_root):
+        raise FileOperationError(
+            f"동기화 실패: {src_root.name} — 원본과 대상이 같거나 서로의 안에 있습니다", dest_root
+        )
+    if workers is None:
+        workers = default_workers(src_root, dest_root)
+    plan = SyncPlan(src_root, dest_root, options)
+    planner = _Planner(str(src_root), str(dest_root), options, progress, cancel)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="mdir-sync") as pool:
+            pending = {pool.submit(planner.compare_dir, "", True, set(names) if names else None)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    plan.mkdirs += result.mkdirs
+                    plan.copies += result.copies
+                    plan.deletes += result.deletes
+                    plan.conflicts += result.conflicts
+                    plan.unchanged += result.unchanged
+                    plan.hashed += result.hashed
+                    for rel, exists in result.subdirs:
+                        pending.add(pool.submit(planner.compare_dir, rel, exists))
+    except OSError as e:
+        raise _sync_error(e, Path(e.filename) if e.filename else src_root) from e
+    if cancel is not None:
+        cancel.check()
+
+    # 작업 스레드가 끝나는 순서와 상관없이 같은 계획 (상위 폴더가 하위보다 먼저)
+    plan.mkdirs.sort()
+    plan.copies.sort(key=lambda c: c.rel)
+    plan.deletes.sort()
+    plan.conflicts.sort()
+    return plan
+
+
+def run_sync(
+    plan: SyncPlan,
+    changes: ChangeSet | None = None,
+    progress: OperationProgress | None = None,
+    cancel: CancelToken | None = None,
+    workers: int | None = None,
+) -> None:
+    """계획 실행: 삭제 → 새 폴더 → 파일/링크 복사 (복사 엔진, 병렬).
+
+    바뀐 파일은 같은 폴더의 임시 이름으로 복사한 뒤 os.replace 로 바꾸므로, 실패하거나
+    취소되어도 대상의 기존 파일은 그대로 남는다 (쓰던 임시 파일은 지운다). 새 파일은
+    제자리에 복사하고, 취소로 멈추면 쓰던 파일을 지워 다음 실행에서 다시 복사한다.
+    새로 만든 폴더의 메타데이터는 마지막에 맞춘다.
+    - changes: dest_root 바로 아래에서 추가/삭제/수정된 항목을 기록. 실패 시 trusted=False
+    - progress: 복사할 파일 수와 바이트 기준으로 기록
+    - cancel: 파일·데이터 덩어리 사이에서 확인. 일시정지 중이면 기다리고, 취소되면
+      새 파일을 보내지 않고 OperationCancelledError
+    Raises: FileOperationError, OperationCancelledError
+    """
+    if changes is None:
+        changes = ChangeSet()
+    src_root, dest_root = str(plan.src_root), str(plan.dest_root)
+    if workers is None:
+        workers = default_workers(plan.src_root, plan.dest_root)
+    if progress is not None:
+        progress.add_total(len(plan.copies), plan.bytes_total)
+        progress.finish_scan()
+
+    _record_changes(plan, changes)
+    engine = CopyEngine(workers, progress=progress, cancel=cancel)
+    current = plan.dest_root
+    try:
+        remover = TreeRemover(workers, cancel=cancel)
+        for rel in plan.deletes:
+            current = Path(dest_root, rel)
+            remover.remove(current)
+        for rel in plan.mkdirs:
+            current = Path(dest_root, rel)
+            os.mkdir(current)
+        for index, copy in enumerate(plan.copies):
+            if cancel is not None:
+                cancel.check()
+            src = os.path.join(src_root, copy.rel)
+            current = Path(dest_root, copy.rel)
+            if progress is not None:
+                progress.set_current(copy.rel)
+            if copy.kind == KIND_SYMLINK:
+                if copy.reason == SYNC_CHANGED:
+                    os.unlink(current)
+                os.symlink(os.readlink(src), current)
+                shutil.copystat(src, current, follow_symlinks=False)
+                if progress is not None:
+                    progress.file_done()
+            elif copy.reason == SYNC_CHANGED:
+                temp = os.path.join(os.path.dirname(current), f"{_TEMP_PREFIX}{index}")
+                engine.copy_file(src, temp, replace=str(current))
+            else:
+                engine.copy_file(src, str(current))
+        engine.finish()
+        for rel in reversed(plan.mkdirs):
+            current = Path(dest_root, rel)
+            shutil.copystat(os.path.join(src_root, rel), current)
+    except CopyTaskError as e:
+        changes.trusted = False
+        raise map_copy_error(e.error, Path(e.src), Path(e.dest)) from e.error
+    except OSError as e:
+        changes.trusted = False
+        raise _sync_error(e, current) from e
+    except OperationCancelledError:
+        changes.trusted = False
+        raise
+    finally:
+        engine.close()
+
+
+def _record_changes(plan: SyncPlan, changes: ChangeSet) -> None:
+    """대상 폴더 목록에 보이는 최상위 항목 기준으로 변경 기록."""
+    dest = plan.dest_root
+    removed = {rel for rel in plan.deletes if os.sep not in rel}
+    created = [(rel, SYNC_NEW) for rel in plan.mkdirs] + [(c.rel, c.reason) for c in plan.copies]
+    for rel, reason in created:
+        top, sep, _ = rel.partition(os.sep)
+        if sep or reason == SYNC_CHANGED or top in removed:
+            # 하위 항목이 바뀌었거나, 종류가 달라 지우고 다시 만드는 항목
+            changes.modified.add(dest / top)
+            removed.discard(top)
+        else:
+            changes.added.add(dest / top)
+    changes.removed.update(dest / rel for rel in removed)
+
+
+def _overlaps(a: Path, b: Path) -> bool:
+    a, b = a.resolve(), b.resolve()
+    return a == b or a.is_relative_to(b) or b.is_relative_to(a)
+
+
+def _sync_error(error: OSError, path: Path) -> FileOperationError:
+    if isinstance(error, PermissionError):
+        return FileOperationError(f"권한 없음: {path.name}", path)
+    return FileOperationError(f"동기화 실패: {path.name} — {error}", path)
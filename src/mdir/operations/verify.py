@@ -0,0 +1,173 @@
+"""복사 검증 (원본을 두 번 읽지 않는 해시 검증).
+
+검증 복사는 원본 데이터를 사용자 공간 루프로 흘리며 해시하고, 복사가 끝나면
+대상 파일을 한 번만 다시 읽어 비교한다. 대상은 디스크에 내린 뒤 페이지 캐시를
+비우고(가능한 OS 에서) 읽으므로 메모리가 아니라 실제로 기록된 내용을 확인한다.
+
+trust_kernel 이면 reflink / copy_file_range 로 복사된 파일은 커널(파일시스템)의
+복사를 믿고 다시 읽지 않는다 (결과: trusted).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from mdir.operations.fastcopy import (
+    METHOD_COPY_FILE_RANGE,
+    METHOD_REFLINK,
+    USERSPACE_BUFFER_SIZE,
+    Hasher,
+    MethodUnsupportedError,
+    copy_file,
+)
+from mdir.operations.journal import journal_dir
+
+# 기본 해시 알고리즘 (표준 라이브러리 중 빠른 것)
+DEFAULT_ALGORITHM = "blake2b"
+
+# 검증 설정 환경 변수
+ALGORITHM_ENV = "MDIR_VERIFY_ALGORITHM"
+TRUST_KERNEL_ENV = "MDIR_VERIFY_TRUST_KERNEL"
+
+# 다시 읽지 않아도 되는 것으로 볼 수 있는 커널 내 복사 방법
+TRUSTED_METHODS = (METHOD_REFLINK, METHOD_COPY_FILE_RANGE)
+
+# 파일별 검증 결과
+VERIFY_OK = "ok"
+VERIFY_TRUSTED = "trusted"
+VERIFY_MISMATCH = "mismatch"
+
+
+def new_hasher(algorithm: str) -> Hasher:
+    """알고리즘 이름 → 해시 객체. hashlib 이름 또는 xxhash 설치 시 xxh3_64/xxh3_128/xxh64."""
+    if algorithm.startswith("xxh"):
+        try:
+            import xxhash
+        except ImportError as e:
+            raise ValueError(f"{algorithm} 를 쓰려면 xxhash 패키지가 필요합니다") from e
+        factory = getattr(xxhash, algorithm, None)
+        if factory is None:
+            raise ValueError(f"지원하지 않는 해시 알고리즘: {algorithm}")
+        return factory()
+    try:
+        return hashlib.new(algorithm)
+    except ValueError as e:
+        raise ValueError(f"지원하지 않는 해시 알고리즘: {algorithm}") from e
+
+
+@dataclass(frozen=True)
+class VerifyOptions:
+    """검증 복사 설정."""
+
+    algorithm: str = DEFAULT_ALGORITHM
+    trust_kernel: bool = False
+
+    @classmethod
+    def from_env(cls) -> VerifyOptions:
+        """MDIR_VERIFY_ALGORITHM / MDIR_VERIFY_TRUST_KERNEL(1/true) 로 설정."""
+        algorithm = os.environ.get(ALGORITHM_ENV) or DEFAULT_ALGORITHM
+        trust = os.environ.get(TRUST_KERNEL_ENV, "").lower() in ("1", "true", "yes")
+        return cls(algorithm=algorithm, trust_kernel=trust)
+
+
+@dataclass(frozen=True)
+class FileVerification:
+    """파일 하나의 검증 결과. digest 는 원본 해시 (trusted 면 None)."""
+
+    src: str
+    dest: str
+    status: str
+    method: str
+    digest: str | None = None
+    dest_digest: str | None = None
+
+
+@dataclass
+class VerifyReport:
+    """검증 복사 작업 전체의 파일별 결과."""
+
+    algorithm: str = DEFAULT_ALGORITHM
+    results: list[FileVerification] = field(default_factory=list)
+    started: float = field(default_factory=time.time)
+
+    @property
+    def mismatches(self) -> list[FileVerification]:
+        return [r for r in self.results if r.status == VERIFY_MISMATCH]
+
+    def summary(self) -> str:
+        """예: '검증 120개 (신뢰 3), 불일치 0'."""
+        trusted = sum(1 for r in self.results if r.status == VERIFY_TRUSTED)
+        text = f"검증 {len(self.results)}개"
+        if trusted:
+            text += f" (신뢰 {trusted})"
+        return f"{text}, 불일치 {len(self.mismatches)}"
+
+    def write(self, path: Path) -> None:
+        """파일별 결과를 텍스트로 저장 (상태, 원본 해시, 대상 경로 — 한 줄에 하나)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started))
+        lines = [f"# mdir 복사 검증 — {self.algorithm} — {started}", f"# {self.summary()}"]
+        for r in self.results:
+            digest = r.digest or "-"
+            line = f"{r.status.upper():<8}  {digest}  {r.dest}"
+            if r.status == VERIFY_MISMATCH:
+                line += f"  (대상 {r.dest_digest}, 원본 {r.src})"
+            elif r.status == VERIFY_TRUSTED:
+                line += f"  ({r.method})"
+            lines.append(line)
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def report_path(report: VerifyReport) -> Path:
+    """검증 결과 파일 위치 (복사 저널과 같은 상태 디렉토리, 시작 시각으로 이름)."""
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(report.started))
+    return journal_dir() / f"verify-{stamp}.txt"
+
+
+def copy_verified(
+    src: str,
+    dest: str,
+    options: VerifyOptions,
+    on_bytes=None,
+) -> FileVerification:
+    """src → dest 복사 후 검증. 원본은 한 번만 읽는다."""
+    if options.trust_kernel:
+        try:
+            method = copy_file(src, dest, on_bytes=on_bytes, methods=TRUSTED_METHODS)
+            return FileVerification(src, dest, VERIFY_TRUSTED, method)
+        except MethodUnsupportedError:
+            pass
+    hasher = new_hasher(options.algorithm)
+    method = copy_file(src, dest, on_bytes=on_bytes, hasher=hasher)
+    digest = hasher.hexdigest()
+    dest_digest = hash_file(dest, options.algorithm, drop_cache=True)
+    status = VERIFY_OK if dest_digest == digest else VERIFY_MISMATCH
+    return FileVerification(src, dest, status, method, digest, dest_digest)
+
+
+def hash_file(path: str, algorithm: str = DEFAULT_ALGORITHM, drop_cache: bool = False) -> str:
+    """파일 내용의 해시 (hex).
+
+    drop_cache: 먼저 디스크에 내리고 페이지 캐시를 비워 실제 기록된 내용을 읽는다
+    (posix_fadvise 가 있는 OS 에서만).
+    """
+    hasher = new_hasher(algorithm)
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        if drop_cache and hasattr(os, "posix_fadvise"):
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        buf = bytearray(USERSPACE_BUFFER_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = os.readv(fd, [buf])
+            if not n:
+                break
+            hasher.update(view[:n])
+    finally:
+        os.close(fd)
+    return hasher.hexdigest()
@@ -0,0 +1,112 @@
+"""디렉토리 트리 순회 (복사/삭제/동기화 등 파일 작업 공용).
+
+os.scandir 로 한 번씩만 읽으며 심링크는 따라가지 않는다 (VULN-02).
+"""
+
+from __future__ import annotations
+
+import os
+import stat as stat_mod
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+# 항목 종류
+KIND_FILE = "file"
+KIND_DIR = "dir"
+KIND_SYMLINK = "symlink"
+KIND_OTHER = "other"  # FIFO, 소켓, 장치 파일 등
+
+
+@dataclass(slots=True)
+class TreeEntry:
+    """트리 안의 항목 하나.
+
+    rel: 루트 기준 상대 경로 (os.sep 구분). 루트 자신은 "".
+    stat: lstat 결과 (심링크는 링크 자체의 정보)
+    """
+
+    rel: str
+    path: str
+    kind: str
+    stat: os.stat_result
+
+    @property
+    def size(self) -> int:
+        return self.stat.st_size if self.kind == KIND_FILE else 0
+
+
+def _kind(st: os.stat_result) -> str:
+    mode = st.st_mode
+    if stat_mod.S_ISLNK(mode):
+        return KIND_SYMLINK
+    if stat_mod.S_ISDIR(mode):
+        return KIND_DIR
+    if stat_mod.S_ISREG(mode):
+        return KIND_FILE
+    return KIND_OTHER
+
+
+def walk_tree(
+    root: str | os.PathLike[str],
+    on_error: Callable[[OSError], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> Iterator[TreeEntry]:
+    """root 아래 모든 항목을 위에서 아래로(디렉토리가 자식보다 먼저) 생성.
+
+    루트 자신도 첫 항목(rel="")으로 생성한다. 항목마다 lstat 은 최대 1회.
+    on_error: 읽을 수 없는 디렉토리를 만났을 때 호출 (없으면 예외 전파)
+    should_stop: True 를 반환하면 순회를 멈춤 (취소용)
+    """
+    root = os.fspath(root)
+    root_stat = os.lstat(root)
+    yield TreeEntry("", root, _kind(root_stat), root_stat)
+    if not stat_mod.S_ISDIR(root_stat.st_mode):
+        return
+
+    # 깊이 우선 (스택) — 한 디렉토리의 항목은 한 번에 읽고 바로 닫는다
+    stack: list[tuple[str, str]] = [("", root)]
+    while stack:
+        if should_stop is not None and should_stop():
+            return
+        rel_dir, abs_dir = stack.pop()
+        try:
+            with os.scandir(abs_dir) as it:
+                entries = list(it)
+        except OSError as e:
+            if on_error is None:
+                raise
+            on_error(e)
+            continue
+        subdirs: list[tuple[str, str]] = []
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+                continue
+            rel = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+            kind = _kind(st)
+            yield TreeEntry(rel, entry.path, kind, st)
+            if kind == KIND_DIR:
+                subdirs.append((rel, entry.path))
+        # 스택이므로 역순으로 넣어야 읽은 순서대로 내려간다
+        stack.extend(reversed(subdirs))
+
+
+def tree_totals(
+    root: str | os.PathLike[str],
+    should_stop: Callable[[], bool] | None = None,
+) -> tuple[int, int]:
+    """root 아래 (파일 수, 파일 바이트 합). 디렉토리와 심링크는 세지 않는다.
+
+    읽을 수 없는 디렉토리는 건너뛴다 (진행 표시용 어림값).
+    """
+    files = 0
+    nbytes = 0
+    for entry in walk_tree(root, on_error=lambda e: None, should_stop=should_stop):
+        if entry.kind in (KIND_FILE, KIND_OTHER):
+            files += 1
+            nbytes += entry.size
+    return files, nbytes
@@ -1,11 +1,36 @@
-"""모달 다이얼로그: 확인, 입력, 미리보기."""
+"""모달 다이얼로그: 확인, 입력, 미리보기, 작업 목록, 일괄 이름 변경."""
 
 from pathlib import Path
 
+from rich.segment import Segment
+from rich.text import Text
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
+from textual.geometry import Size
 from textual.screen import ModalScreen
-from textual.widgets import Button, Input, Label, Static
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.timer import Timer
+from textual.widgets import Button, Input, Label, OptionList, Static
+from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
+
+from mdir.models.file_item import FileItem
+from mdir.operations.exceptions import FileOperationError
+from mdir.operations.jobs import Job, JobQueue
+from mdir.operations.progress import PROGRESS_REFRESH_INTERVAL
+from mdir.operations.rename import (
+    DEFAULT_TEMPLATE,
+    RenameEntry,
+    RenamePlan,
+    RenameRule,
+    directory_names,
+    plan_renames,
+)
+
+# 일괄 이름 변경: 입력이 멈춘 뒤 미리보기를 다시 계산할 때까지 기다리는 시간 (초)
+_RENAME_PREVIEW_DELAY = 0.15
 
 
 class ConfirmScreen(ModalScreen[bool]):
@@ -121,3 +146,236 @@ class PreviewScreen(ModalScreen):
 
     def action_dismiss(self) -> None:
         self.dismiss()
+
+
+class JobsScreen(ModalScreen):
+    """백그라운드 작업 목록 (실행 중 · 대기 · 최근에 끝난 작업). 열려 있는 동안 주기적으로 갱신."""
+
+    BINDINGS = [
+        Binding("escape", "dismiss", "닫기"),
+        Binding("q", "dismiss", "닫기"),
+        Binding("ctrl+j", "dismiss", "닫기"),
+        Binding("delete", "cancel_job", "작업 취소"),
+        Binding("c", "cancel_job", "작업 취소", show=False),
+        Binding("p", "pause_job", "일시정지/재개"),
+    ]
+
+    def __init__(self, queue: JobQueue, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._queue = queue
+        self._ids: list[str] = []
+
+    def compose(self) -> ComposeResult:
+        with Static(classes="jobs-box"):
+            yield Label(
+                " 작업 목록  [dim](P: 일시정지/재개 · Del: 작업 취소 · ESC: 닫기)[/]",
+                classes="preview-title",
+            )
+            yield OptionList(id="jobs-list", classes="jobs-list")
+
+    def on_mount(self) -> None:
+        self._refresh_jobs()
+        self.set_interval(PROGRESS_REFRESH_INTERVAL, self._refresh_jobs)
+        self.query_one(OptionList).focus()
+
+    def _refresh_jobs(self) -> None:
+        """작업이 바뀌었으면 목록을 다시 만들고, 아니면 각 줄의 진행 상황만 바꾼다."""
+        option_list = self.query_one(OptionList)
+        jobs = self._queue.jobs()
+        ids = [str(job.id) for job in jobs]
+        if ids == self._ids:
+            for job in jobs:
+                option_list.replace_option_prompt(str(job.id), Text(job.describe()))
+            return
+        highlighted = option_list.highlighted_option
+        self._ids = ids
+        option_list.clear_options()
+        if not jobs:
+            option_list.add_option(Option("작업이 없습니다", id="none", disabled=True))
+            return
+        option_list.add_options(Option(Text(job.describe()), id=str(job.id)) for job in jobs)
+        keep = highlighted.id if highlighted is not None else None
+        option_list.highlighted = ids.index(keep) if keep in ids else 0
+
+    def action_cancel_job(self) -> None:
+        job = self._highlighted_job()
+        if job is not None and not self._queue.cancel(job):
+            self.notify("취소할 수 없는 작업입니다", severity="warning", markup=False)
+        self._refresh_jobs()
+
+    def action_pause_job(self) -> None:
+        job = self._highlighted_job()
+        if job is not None and not self._queue.toggle_pause(job):
+            self.notify("일시정지할 수 없는 작업입니다", severity="warning", markup=False)
+        self._refresh_jobs()
+
+    def _highlighted_job(self) -> Job | None:
+        highlighted = self.query_one(OptionList).highlighted_option
+        if highlighted is None:
+            return None
+        return next((job for job in self._queue.jobs() if str(job.id) == highlighted.id), None)
+
+    def action_dismiss(self) -> None:
+        self.dismiss()
+
+
+class RenamePreview(ScrollView):
+    """이름 변경 계획 미리보기 (보이는 행만 그리는 가상 목록)."""
+
+    DEFAULT_CSS = """
+    RenamePreview {
+        height: 1fr;
+        overflow-x: hidden;
+        overflow-y: auto;
+    }
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._entries: list[RenameEntry] = []
+
+    def set_entries(self, entries: list[RenameEntry]) -> None:
+        self._entries = entries
+        self.virtual_size = Size(0, len(entries))
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        width = self.scrollable_content_region.width
+        index = self.scroll_offset.y + y
+        if index >= len(self._entries):
+            return Strip.blank(width, self.rich_style)
+        entry = self._entries[index]
+        old = Text(entry.item.name, no_wrap=True)
+        old.truncate(max(4, (width - 3) // 2), overflow="ellipsis", pad=True)
+        if entry.problem:
+            new = Text(f"{entry.new_name}  ({entry.problem})", style="bold red")
+        elif entry.changed:
+            new = Text(entry.new_name, style="green")
+        else:
+            new = Text(entry.new_name, style="dim")
+        line = Text.assemble(old, " → ", new, no_wrap=True)
+        line.truncate(width, overflow="ellipsis", pad=True)
+        segments = Segment.apply_style(line.render(self.app.console), self.rich_style)
+        return Strip(segments).adjust_cell_length(width, self.rich_style)
+
+
+class BatchRenameScreen(ModalScreen[RenamePlan | None]):
+    """여러 항목 이름 한꺼번에 바꾸기. 입력하는 대로 전체 결과를 미리 보여준다.
+
+    계획은 작업 스레드에서 만들고 (디렉토리 이름 목록은 처음 한 번만 읽음),
+    확인하면 지금 입력과 같은 규칙으로 만든 계획을 돌려준다.
+    """
+
+    BINDINGS = [
+        Binding("escape", "cancel", show=False),
+        Binding("pageup", "scroll_preview(-1)", show=False),
+        Binding("pagedown", "scroll_preview(1)", show=False),
+    ]
+
+    def __init__(self, items: list[FileItem], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._items = items
+        self._existing: set[str] | None = None
+        self._plan: RenamePlan | None = None
+        self._plan_rule: RenameRule | None = None
+        self._timer: Timer | None = None
+
+    def compose(self) -> ComposeResult:
+        with Static(classes="rename-box"):
+            yield Label(
+                f" 이름 일괄 변경 — {len(self._items):,}개  [dim](ESC: 취소)[/]",
+                classes="preview-title",
+            )
+            yield Label(
+                "{name} 이름 · {ext} 확장자 · {n} 순번 ({n:03}) · {mtime} 수정 시각 ({mtime:%Y-%m-%d})",
+                classes="rename-help",
+                markup=False,
+            )
+            yield Input(
+                value=DEFAULT_TEMPLATE,
+                id="rename-template",
+                classes="dialog-input",
+                placeholder="템플릿",
+            )
+            with Static(classes="rename-regex"):
+                yield Input(id="rename-find", classes="dialog-input", placeholder="찾기 (정규식)")
+                yield Input(
+                    id="rename-replace", classes="dialog-input", placeholder="바꾸기 (\\1 그룹 참조)"
+                )
+            yield Label("", id="rename-summary", classes="rename-summary")
+            yield RenamePreview(id="rename-preview")
+            with Static(classes="dialog-buttons"):
+                yield Button("확인", id="btn-ok", classes="btn-ok", variant="primary")
+                yield Button("취소", id="btn-cancel", classes="btn-cancel")
+
+    def on_mount(self) -> None:
+        self.query_one("#rename-template", Input).focus()
+        self._update_plan(self._rule())
+
+    def _rule(self) -> RenameRule:
+        return RenameRule(
+            template=self.query_one("#rename-template", Input).value,
+            find=self.query_one("#rename-find", Input).value,
+            replace=self.query_one("#rename-replace", Input).value,
+        )
+
+    def on_input_changed(self, _event: Input.Changed) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = self.set_timer(_RENAME_PREVIEW_DELAY, lambda: self._update_plan(self._rule()))
+
+    @work(thread=True, exclusive=True, group="rename-plan")
+    def _update_plan(self, rule: RenameRule) -> None:
+        """작업 스레드: 계획을 만들어 미리보기에 반영."""
+        try:
+            if self._existing is None:
+                self._existing = directory_names(self._items[0].parent)
+            plan, error = plan_renames(self._items, rule, self._existing), ""
+        except FileOperationError as e:
+            plan, error = None, str(e)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_plan, rule, plan, error)
+
+    def _show_plan(self, rule: RenameRule, plan: RenamePlan | None, error: str) -> None:
+        self._plan, self._plan_rule = plan, rule
+        summary = self.query_one("#rename-summary", Label)
+        summary.set_class(plan is None or bool(plan.problems), "rename-summary-error")
+        summary.update(Text(error or plan.summary()))
+        self.query_one(RenamePreview).set_entries(plan.entries if plan is not None else [])
+
+    def on_input_submitted(self, _event: Input.Submitted) -> None:
+        self._confirm()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "btn-ok":
+            self._confirm()
+        else:
+            self.dismiss(None)
+
+    def _confirm(self) -> None:
+        """지금 입력한 규칙의 계획으로 닫는다 (미리보기가 늦었으면 여기서 다시 만든다)."""
+        rule = self._rule()
+        if rule != self._plan_rule:
+            try:
+                if self._existing is None:
+                    self._existing = directory_names(self._items[0].parent)
+                self._show_plan(rule, plan_renames(self._items, rule, self._existing), "")
+            except FileOperationError as e:
+                self._show_plan(rule, None, str(e))
+        if self._plan is None:
+            return
+        if not self._plan.renames:
+            self.notify("바꿀 이름이 없습니다", severity="warning", markup=False)
+            return
+        self.dismiss(self._plan)
+
+    def action_scroll_preview(self, direction: int) -> None:
+        preview = self.query_one(RenamePreview)
+        if direction < 0:
+            preview.scroll_page_up(animate=False)
+        else:
+            preview.scroll_page_down(animate=False)
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
+
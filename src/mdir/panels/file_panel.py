@@ -1,15 +1,34 @@
 """파일 패널 위젯 (PathBar + FileTable)."""
 
+import asyncio
+import os
+from dataclasses import replace
 from pathlib import Path
 
 from rich.markup import escape as markup_escape
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.message import Message
 from textual.widget import Widget
-from textual.widgets import DataTable, Label
-
-from mdir.models.file_item import FileItem, PanelState, format_size
+from textual.widgets import Label
+from textual.worker import get_current_worker
+from watchfiles import awatch
+
+from mdir.models.changes import ChangeSet
+from mdir.models.disk_usage import DiskUsageCache
+from mdir.models.file_item import (
+    FileItem,
+    LoadProbe,
+    PanelState,
+    format_size,
+    iter_directory,
+)
+from mdir.models.listing_cache import ListingCache
+from mdir.operations.device import default_workers
+from mdir.operations.du import AUTO_ENV, DirSizeCache, measure_tree
+from mdir.operations.exceptions import OperationCancelledError
+from mdir.panels.file_table import FileColumn, FileTable
 
 # 컬럼 키 상수
 COL_NAME = "name"
@@ -27,6 +46,15 @@ _NORMAL_STYLE = ""
 _SORT_CYCLE = {"name": "size", "size": "modified", "modified": "name"}
 _SORT_LABELS = {"name": "이름", "size": "크기", "modified": "날짜"}
 
+# 파일 감시 (watchfiles)
+# 이벤트는 _WATCH_DEBOUNCE_MS 동안 모아서 받고, 반영 후 간격을 두어 그 사이 이벤트를 합친다.
+# 변경이 잦은 디렉토리는 간격을 _WATCH_MAX_INTERVAL 까지 늘려 UI 가 밀리지 않게 한다.
+_WATCH_DEBOUNCE_MS = 300
+_WATCH_MIN_INTERVAL = 0.25
+_WATCH_MAX_INTERVAL = 5.0
+_WATCH_BUSY_THRESHOLD = 50  # 한 번에 이 이상 바뀌면 바쁜 디렉토리로 보고 간격을 늘림
+_WATCH_INCREMENTAL_LIMIT = 1000  # 이보다 많이 바뀌면 증분 대신 전체 재로드
+
 
 def _item_markup(item: FileItem) -> tuple[str, str, str]:
     """FileItem → (name_markup, size_str, date_str) 반환."""
@@ -55,6 +83,19 @@ def _item_markup(item: FileItem) -> tuple[str, str, str]:
     return name_cell, size_cell, date_cell
 
 
+def _existing_dir(path_str: str) -> Path | None:
+    """입력한 경로를 정규화해 디렉토리면 반환 (파일시스템 접근 — 워커 스레드용)."""
+    path = Path(path_str).expanduser().resolve()
+    return path if path.is_dir() else None
+
+
+def _nearest_existing_dir(path: Path) -> Path:
+    """path 가 없으면 남아 있는 가장 가까운 상위 디렉토리 (파일시스템 접근 — 워커 스레드용)."""
+    while not path.is_dir() and path.parent != path:
+        path = path.parent
+    return path
+
+
 class FilePanelCursorMoved(Message):
     """커서 이동 알림 메시지."""
 
@@ -63,6 +104,23 @@ class FilePanelCursorMoved(Message):
         self.panel = panel
 
 
+class FilePanelLoadProgress(Message):
+    """디렉토리 스트리밍 로드 진행 알림 메시지 (배치 추가 / 완료)."""
+
+    def __init__(self, panel: "FilePanel") -> None:
+        super().__init__()
+        self.panel = panel
+
+
+class FilePanelPathRemoved(Message):
+    """현재 디렉토리가 삭제/이동되어 상위 폴더로 옮겨 갔다는 알림 메시지."""
+
+    def __init__(self, panel: "FilePanel", removed: Path) -> None:
+        super().__init__()
+        self.panel = panel
+        self.removed = removed
+
+
 class FilePanelFileSelected(Message):
     """Enter 키로 파일 선택 시 미리보기 요청 메시지."""
 
@@ -77,7 +135,7 @@ class FilePanel(Widget):
 
     구성:
         PathBar (Label) — 현재 경로 표시
-        FileTable (DataTable) — 파일 목록
+        FileTable — 파일 목록 (보이는 행만 그리는 가상 목록)
     """
 
     DEFAULT_CSS = """
@@ -91,35 +149,62 @@ class FilePanel(Widget):
         Binding("space", "toggle_select", "선택", show=False),
     ]
 
-    def __init__(self, start_path: Path | None = None, **kwargs) -> None:
+    def __init__(
+        self,
+        start_path: Path | None = None,
+        cache: ListingCache | None = None,
+        disk_usage: DiskUsageCache | None = None,
+        dir_sizes: DirSizeCache | None = None,
+        **kwargs,
+    ) -> None:
         super().__init__(**kwargs)
         self.state = PanelState(
-            current_path=(start_path or Path.cwd()).resolve()
+            current_path=(start_path or Path.cwd()).resolve(),
+            cache=cache,
+            disk_usage=disk_usage,
         )
         self._is_active: bool = False
+        # 로드 세대 번호: 이전 로드의 늦게 도착한 배치를 무시하기 위해 사용
+        self._load_generation: int = 0
+        # Shift+방향키 범위 선택의 시작 행과 직전 범위의 끝 행
+        self._range_anchor: int | None = None
+        self._range_end: int | None = None
+        # 파일 감시 대상 경로와 아직 반영하지 않은 변경
+        self._watched_path: Path | None = None
+        self._pending_changes = ChangeSet()
+        # 폴더 크기 계산 캐시 (두 패널 공용) 와 계산 중 여부
+        self._dir_sizes = dir_sizes if dir_sizes is not None else DirSizeCache()
+        self._measuring: bool = False
 
     def compose(self) -> ComposeResult:
         yield Label("", classes="path-bar", id=f"path-{self.id}")
-        table = DataTable(id=f"table-{self.id}", cursor_type="row", zebra_stripes=True)
-        table.add_column("이름 ↕", key=COL_NAME, width=28)
-        table.add_column("크기", key=COL_SIZE, width=9)
-        table.add_column("날짜", key=COL_DATE, width=14)
-        yield table
+        yield FileTable(
+            self.state,
+            columns=[
+                FileColumn(COL_NAME, "이름 ↕"),
+                FileColumn(COL_SIZE, "크기", width=9),
+                FileColumn(COL_DATE, "날짜", width=16),
+            ],
+            render_cells=_item_markup,
+            id=f"table-{self.id}",
+            zebra_stripes=True,
+        )
 
     def on_mount(self) -> None:
         # items는 빈 리스트로 초기화되므로 마운트 시 디렉토리 로드 필요
-        self.state.enter_directory(self.state.current_path)
-        self._refresh_table()
+        self._load(self.state.current_path)
 
     # ── 공개 API ──────────────────────────────
 
     def navigate_up(self) -> None:
+        self._range_anchor = None
         table = self._table
         if table.cursor_row > 0:
             table.move_cursor(row=table.cursor_row - 1)
             self.state.cursor_index = table.cursor_row
 
     def navigate_down(self) -> None:
+        self._range_anchor = None
         table = self._table
         if table.cursor_row < table.row_count - 1:
             table.move_cursor(row=table.cursor_row + 1)
@@ -128,25 +213,16 @@ class FilePanel(Widget):
     def enter_selected(self) -> None:
         item = self.state.active_item
         if item and item.is_dir:
-            self.state.enter_directory(item.path)
-            self._refresh_table()
+            self._load(item.path)
 
     def go_parent(self) -> None:
         parent = self.state.current_path.parent
         if parent != self.state.current_path:
-            prev_name = self.state.current_path.name
-            self.state.enter_directory(parent)
-            self._refresh_table()
-            for i, item in enumerate(self.state.items):
-                if item.name == prev_name:
-                    self._table.move_cursor(row=i)
-                    self.state.cursor_index = i
-                    break
+            self._load(parent, focus_name=self.state.current_path.name)
 
     def toggle_hidden(self) -> None:
         self.state.show_hidden = not self.state.show_hidden
-        self.state.refresh()
-        self._refresh_table()
+        self.refresh_current()
 
     def toggle_selection(self) -> None:
         item = self.state.active_item
@@ -156,11 +232,105 @@ class FilePanel(Widget):
             self.navigate_down()
 
     def select_all(self) -> None:
-        if self.state.selected_paths:
+        if self.state.selection:
             self.state.clear_selection()
         else:
             self.state.select_all()
-        self._refresh_table()
+        self._refresh_selection_marks()
+
+    def clear_selection(self) -> None:
+        if self.state.selection:
+            self.state.clear_selection()
+            self._refresh_selection_marks()
+
+    def invert_selection(self) -> None:
+        self.state.invert_selection()
+        self._refresh_selection_marks()
+
+    def select_pattern(self, pattern: str, select: bool = True) -> int:
+        """glob 패턴으로 선택/해제. 바뀐 항목 수 반환."""
+        changed = self.state.select_pattern(pattern, select)
+        if changed:
+            self._refresh_selection_marks()
+        return changed
+
+    def select_names(self, names: set[str]) -> int:
+        """선택을 names 에 있는 항목으로 바꿈. 선택된 항목 수 반환."""
+        count = self.state.select_names(names)
+        self._refresh_selection_marks()
+        return count
+
+    def compute_dir_sizes(self, names: set[str] | None = None) -> int:
+        """폴더 재귀 크기 계산 시작 (names 가 없으면 심링크를 뺀 모든 폴더).
+
+        결과는 폴더마다 끝나는 대로 크기 컬럼에 표시된다. 계산할 폴더 수 반환.
+        """
+        targets = [
+            item.name
+            for item in self.state.items
+            if item.is_dir
+            and not item.is_symlink
+            and item.name != ".."
+            and (names is None or item.name in names)
+        ]
+        if targets:
+            self._measuring = True
+            self._update_path_bar()
+            self._measure(self.state.current_path, self._load_generation, targets)
+        return len(targets)
+
+    @work(thread=True, exclusive=True, group="du")
+    def _measure(self, path: Path, generation: int, names: list[str]) -> None:
+        """백그라운드: 폴더별 재귀 크기를 계산해 하나씩 UI 스레드로 전달."""
+        worker = get_current_worker()
+        workers = default_workers(path)
+        for name in names:
+            try:
+                size = measure_tree(
+                    path / name, self._dir_sizes, workers, lambda: worker.is_cancelled
+                )
+            except OperationCancelledError:
+                return
+            except OSError:
+                continue  # 사라졌거나 읽을 수 없는 폴더 — <DIR> 그대로 둠
+            self.app.call_from_thread(self._set_dir_size, generation, name, size.nbytes)
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._finish_measure, generation)
+
+    def _set_dir_size(self, generation: int, name: str, nbytes: int) -> None:
+        """UI 스레드: 계산된 크기 반영 (크기 정렬이면 위치도 옮김)."""
+        if generation != self._load_generation:
+            return
+        row = self.state.set_tree_size(name, nbytes)
+        if row is None:
+            self._refresh_table()
+        elif row >= 0:
+            self._refresh_row(row)
+
+    def _finish_measure(self, generation: int) -> None:
+        if generation != self._load_generation:
+            return
+        self._measuring = False
+        self._update_path_bar()
+
+    def extend_selection(self, delta: int) -> None:
+        """Shift+방향키: 기준 행부터 커서가 이동한 행까지 범위 선택."""
+        table = self._table
+        previous = self._range_end
+        if self._range_anchor is None or table.cursor_row != previous:
+            # 다른 방법으로 커서를 옮겼으면 그 자리에서 새 범위를 시작한다
+            self._range_anchor = table.cursor_row
+            previous = None
+        row = max(0, min(table.cursor_row + delta, table.row_count - 1))
+        table.move_cursor(row=row)
+        self.state.cursor_index = row
+        self.state.select_range(self._range_anchor, row, previous)
+        self._range_end = row
+        # 해제된 행까지 다시 그림
+        rows = [self._range_anchor, row]
+        if previous is not None:
+            rows.append(previous)
+        table.refresh_row_range(min(rows), max(rows))
 
     def cycle_sort(self, col_key: str) -> None:
         """컬럼 헤더 클릭 시 해당 컬럼으로 정렬 (FR-13).
@@ -171,26 +341,33 @@ class FilePanel(Widget):
         sort_key = col_map.get(col_key, "name")
 
         if self.state.sort_by == sort_key:
-            self.state.sort_reverse = not self.state.sort_reverse
+            self.state.set_sort(sort_key, not self.state.sort_reverse)
         else:
-            self.state.sort_by = sort_key
-            self.state.sort_reverse = False
+            self.state.set_sort(sort_key, False)
 
-        self.state.refresh()
         self._refresh_table()
         self._update_column_headers()
 
-    def go_to(self, path_str: str) -> bool:
-        path = Path(path_str).expanduser().resolve()
-        if path.is_dir():
-            self.state.enter_directory(path)
-            self._refresh_table()
-            return True
-        return False
+    async def go_to(self, path_str: str) -> bool:
+        """입력한 경로로 이동. 경로 확인은 스레드에서 한다 (느린 마운트에서 UI 멈춤 방지)."""
+        path = await asyncio.to_thread(_existing_dir, path_str)
+        if path is None:
+            return False
+        self._load(path)
+        return True
 
-    def refresh_current(self) -> None:
-        self.state.refresh()
-        self._refresh_table()
+    def refresh_current(self, use_cache: bool = False) -> None:
+        """현재 디렉토리 재로드.
+
+        use_cache=False (기본): 파일 작업 직후처럼 디스크에서 다시 읽어야 할 때.
+        use_cache=True: 다른 패널이 방금 읽은 같은 경로의 목록을 재사용할 때.
+        """
+        active = self.state.active_item
+        self._load(
+            self.state.current_path,
+            focus_name=active.name if active else None,
+            use_cache=use_cache,
+        )
 
     def get_selected_items(self) -> list[FileItem]:
         return self.state.get_selected_items()
@@ -200,17 +377,25 @@ class FilePanel(Widget):
         return self.state.current_path
 
     def status_text(self) -> str:
-        sel_count = len(self.state.selected_paths)
-        total = len([i for i in self.state.items if i.name != ".."])
+        """상태바 오른쪽 문자열. 누적된 값만 읽으므로 O(1), 시스템 호출 없음."""
+        selection = self.state.selection
+        total = self.state.entry_count
         free, total_disk = self.state.disk_info()
         disk_str = f"여유: {format_size(free)} / {format_size(total_disk)}"
         sort_indicator = f"정렬: {_SORT_LABELS.get(self.state.sort_by, '이름')}"
-        if sel_count:
-            return f"{sel_count}개 선택 / 총 {total}개  |  {sort_indicator}  |  {disk_str}"
+        if self.state.loading:
+            return f"읽는 중: {self.state.loaded_count:,}개  |  {sort_indicator}  |  {disk_str}"
+        if selection:
+            return (
+                f"{len(selection)}개 선택 ({format_size(selection.total_bytes)}) / 총 {total}개"
+                f"  |  {sort_indicator}  |  {disk_str}"
+            )
         return f"총 {total}개  |  {sort_indicator}  |  {disk_str}"
 
     def set_active(self, active: bool) -> None:
         """활성/비활성 패널 상태 설정 (CSS 클래스 + 경로 바 표시기)."""
+        if active == self._is_active:
+            return
         self._is_active = active
         if active:
             self.add_class("active-panel")
@@ -225,15 +410,15 @@ class FilePanel(Widget):
 
     # ── 이벤트 핸들러 ─────────────────────────
 
-    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
+    def on_file_table_header_selected(self, event: FileTable.HeaderSelected) -> None:
         """컬럼 헤더 클릭 → 정렬 (FR-13)."""
-        self.cycle_sort(str(event.column_key))
+        self.cycle_sort(event.column_key)
 
-    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+    def on_file_table_row_highlighted(self, event: FileTable.RowHighlighted) -> None:
         self.state.cursor_index = event.cursor_row
         self.post_message(FilePanelCursorMoved(self))
 
-    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+    def on_file_table_row_selected(self, event: FileTable.RowSelected) -> None:
         """Enter: 디렉토리 진입 또는 파일 미리보기 요청."""
         item = self.state.active_item
         if item is None:
@@ -246,43 +431,265 @@ class FilePanel(Widget):
 
     # ── 내부 헬퍼 ─────────────────────────────
 
+    def _load(
+        self,
+        path: Path,
+        focus_name: str | None = None,
+        use_cache: bool = True,
+        leave_removed: bool = False,
+    ) -> None:
+        """디렉토리 로드 시작 (UI 스레드에서는 파일시스템에 접근하지 않음).
+
+        경로 정규화, 캐시 서명, 스캔은 모두 워커가 하고 UI 스레드는 결과만 반영한다.
+        새 로드가 시작되면 이전 워커는 취소되고, 늦게 도착한 결과는 세대 번호로 버린다.
+        다른 경로로 이동하면 목록을 바로 비우고, 같은 경로를 다시 읽을 때는
+        새 목록이 올 때까지 기존 목록을 그대로 보여준다.
+        leave_removed: path 가 없으면 워커가 남아 있는 가장 가까운 상위 폴더를 대신 읽는다.
+        """
+        self._load_generation += 1
+        if self._measuring:
+            self.workers.cancel_group(self, "du")
+            self._measuring = False
+        if path != self.state.current_path:
+            self.state.begin_load(path, LoadProbe(path))
+            self._refresh_table()
+        else:
+            self.state.loading = True
+            self._update_path_bar()
+        self._scan(
+            path,
+            self._load_generation,
+            focus_name,
+            use_cache,
+            self.state.show_hidden,
+            leave_removed,
+        )
+
+    @work(thread=True, exclusive=True, group="scan")
+    def _scan(
+        self,
+        path: Path,
+        generation: int,
+        focus_name: str | None,
+        use_cache: bool,
+        show_hidden: bool,
+        leave_removed: bool = False,
+    ) -> None:
+        """백그라운드 로드: 캐시 조회 또는 스캔 후 배치를 읽는 대로 UI 스레드로 전달."""
+        worker = get_current_worker()
+        removed = None
+        if leave_removed:
+            target = _nearest_existing_dir(path)
+            if target != path:
+                removed, path = path, target
+        probe = self.state.probe_load(path)
+        cached = self.state.cached_listing(probe) if use_cache else None
+        if worker.is_cancelled:
+            return
+        if cached is not None:
+            self.app.call_from_thread(self._show_cached, generation, probe, cached, focus_name)
+            if removed is not None:
+                self.app.call_from_thread(self._announce_removed, generation, removed)
+            return
+
+        batches = iter_directory(probe.path, show_hidden)
+        try:
+            first = next(batches, [])
+        except OSError:
+            first = []  # 디렉토리가 사라졌거나 읽을 수 없음 — 빈 목록으로 표시
+        if worker.is_cancelled:
+            return
+        if not self.app.call_from_thread(self._start_listing, generation, probe, first):
+            return
+        if removed is not None:
+            self.app.call_from_thread(self._announce_removed, generation, removed)
+        try:
+            for batch in batches:
+                if worker.is_cancelled:
+                    return
+                self.app.call_from_thread(self._merge_batch, generation, batch)
+        except OSError:
+            pass  # 스캔 도중 디렉토리가 사라진 경우 — 읽은 만큼만 표시
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._finish_scan, generation, focus_name)
+
+    def _begin_listing(self, probe: LoadProbe) -> None:
+        """UI 스레드: 새 목록 시작 (같은 경로면 커서 위치 유지) 및 감시 시작."""
+        cursor_index = self.state.cursor_index if probe.path == self.current_path else 0
+        self.state.begin_load(probe.path, probe)
+        self.state.cursor_index = cursor_index
+        if self.state.current_path != self._watched_path:
+            self._watched_path = self.state.current_path
+            self._pending_changes = ChangeSet()
+            self._watch(self.state.current_path)
+
+    def _show_cached(
+        self,
+        generation: int,
+        probe: LoadProbe,
+        cached: list[FileItem],
+        focus_name: str | None,
+    ) -> None:
+        """UI 스레드: 캐시 적중 — 스캔 없이 목록 확정."""
+        if generation != self._load_generation:
+            return
+        self._begin_listing(probe)
+        self.state.take_cached(cached)
+        self._finish_scan(generation, focus_name)
+
+    def _start_listing(self, generation: int, probe: LoadProbe, first: list[FileItem]) -> bool:
+        """UI 스레드: 첫 배치로 새 목록을 그림. 이미 더 새 로드가 시작됐으면 False."""
+        if generation != self._load_generation:
+            return False
+        self._begin_listing(probe)
+        if first:
+            self.state.add_batch(first)
+        self._refresh_table()
+        self.post_message(FilePanelLoadProgress(self))
+        return True
+
+    @work(exclusive=True, group="watch")
+    async def _watch(self, path: Path) -> None:
+        """현재 디렉토리 변경을 감시해 패널에 증분 반영."""
+        interval = _WATCH_MIN_INTERVAL
+        try:
+            async for raw_changes in awatch(
+                path,
+                watch_filter=None,
+                recursive=False,
+                debounce=_WATCH_DEBOUNCE_MS,
+                ignore_permission_denied=True,
+            ):
+                if path != self._watched_path:
+                    return
+                self._pending_changes.merge(ChangeSet.from_watch(raw_changes))
+                if self.state.loading:
+                    continue  # 로드가 끝날 때 한꺼번에 반영
+                busy = self._flush_changes()
+                if busy:
+                    interval = min(interval * 2, _WATCH_MAX_INTERVAL)
+                else:
+                    interval = max(interval / 2, _WATCH_MIN_INTERVAL)
+                await asyncio.sleep(interval)
+        except (OSError, RuntimeError):
+            # 감시할 수 없는 경로 (권한, inotify 한도 등) — 감시 없이 계속 동작
+            return
+
+    def apply_changes(self, changes: ChangeSet) -> None:
+        """파일 작업 결과를 재스캔 없이 목록에 반영.
+
+        기록이 불완전하거나(trusted=False) 변경이 너무 많으면 전체 재로드.
+        현재 디렉토리 안의 이름 변경은 몇 개든 메모리에서 바로 바꾸고 테이블을 한 번만 그린다.
+        읽는 중이면 로드가 끝난 뒤 반영한다.
+        """
+        if self._leave_removed_path(changes):
+            return
+        if not changes.trusted:
+            self.refresh_current()
+            return
+        if changes.renamed and not self.state.loading:
+            left = self.state.apply_renames(changes.renamed)
+            if len(left) < len(changes.renamed):
+                self._refresh_table()
+                self.post_message(FilePanelCursorMoved(self))
+                changes = replace(changes, renamed=left)
+        self._pending_changes.merge(changes)
+        self._flush_changes()
+
+    def _leave_removed_path(self, changes: ChangeSet) -> bool:
+        """현재 디렉토리(또는 그 상위)가 삭제/이동됐으면 다시 읽는다.
+
+        남아 있는지는 워커가 확인한다 — 같은 이름으로 다시 만들어졌으면 그대로 읽고,
+        없으면 남아 있는 가장 가까운 상위 폴더로 옮겨 간다.
+        """
+        current = self.state.current_path
+        gone = changes.removed | changes.renamed.keys()
+        if not any(p == current or p in current.parents for p in gone):
+            return False
+        self._load(current, leave_removed=True)
+        return True
+
+    def _announce_removed(self, generation: int, removed: Path) -> None:
+        """UI 스레드: 사라진 경로 대신 상위 폴더를 읽기 시작했음을 알림."""
+        if generation == self._load_generation:
+            self.post_message(FilePanelPathRemoved(self, removed))
+
+    def _flush_changes(self) -> bool:
+        """대기 중인 변경 반영. 변경이 많았으면 True (감시 간격을 늘리는 데 사용)."""
+        changes = self._pending_changes
+        if not changes or self.state.loading:
+            return False
+        self._pending_changes = ChangeSet()
+        if self._leave_removed_path(changes):
+            return False
+        count = len(changes)
+        if count > _WATCH_INCREMENTAL_LIMIT:
+            self.refresh_current()
+            return True
+        rows = self.state.apply_changes(changes)
+        if rows is None:
+            self._refresh_table()
+        else:
+            for row in rows:
+                self._table.refresh_row(row)
+        self.post_message(FilePanelCursorMoved(self))
+        return count >= _WATCH_BUSY_THRESHOLD
+
+    def _merge_batch(self, generation: int, batch: list[FileItem]) -> None:
+        """UI 스레드: 배치를 상태에 추가 (새 행이 화면에 보일 때만 다시 그려짐)."""
+        if generation != self._load_generation:
+            return
+        self.state.add_batch(batch)
+        self._table.refresh_rows()
+        self.post_message(FilePanelLoadProgress(self))
+
+    def _finish_scan(self, generation: int, focus_name: str | None) -> None:
+        """UI 스레드: 정렬 확정 후 테이블 다시 그리기."""
+        if generation != self._load_generation:
+            return
+        self.state.finish_load(focus_name)
+        self._refresh_table()
+        self.post_message(FilePanelLoadProgress(self))
+        self._flush_changes()
+        if os.environ.get(AUTO_ENV) == "auto":
+            self.compute_dir_sizes()
+
     @property
-    def _table(self) -> DataTable:
-        return self.query_one(DataTable)
+    def _table(self) -> FileTable:
+        return self.query_one(FileTable)
 
     @property
     def _path_label(self) -> Label:
         return self.query_one(".path-bar", Label)
 
     def _refresh_table(self) -> None:
+        """목록 전체가 바뀐 뒤 호출. 보이는 행만 다시 그리므로 비용은 화면 높이에 비례."""
         table = self._table
-        table.clear()
-        for item in self.state.items:
-            name_cell, size_cell, date_cell = _item_markup(item)
-            table.add_row(name_cell, size_cell, date_cell)
-
-        idx = min(self.state.cursor_index, max(0, table.row_count - 1))
+        table.refresh_rows()
         if table.row_count > 0:
-            table.move_cursor(row=idx)
+            table.move_cursor(row=min(self.state.cursor_index, table.row_count - 1))
 
         self._update_path_bar()
         self._update_column_headers()
 
     def _refresh_row(self, row_index: int) -> None:
-        if row_index >= len(self.state.items):
-            return
-        item = self.state.items[row_index]
-        name_cell, size_cell, date_cell = _item_markup(item)
-        table = self._table
-        table.update_cell_at((row_index, 0), name_cell)
-        table.update_cell_at((row_index, 1), size_cell)
-        table.update_cell_at((row_index, 2), date_cell)
+        self._table.refresh_row(row_index)
+
+    def _refresh_selection_marks(self) -> None:
+        """선택 표시 갱신 (보이는 행만 다시 그림)."""
+        self._table.refresh()
 
     def _update_path_bar(self) -> None:
         """경로 바 레이블 업데이트 (활성 패널에 ▶ 표시기 포함)."""
         prefix = "[bold bright_blue]▶[/bold bright_blue] " if self._is_active else "  "
         safe_path = markup_escape(str(self.state.current_path))
-        self._path_label.update(f"{prefix}{safe_path}")
+        if self.state.loading:
+            loading = "  [dim]읽는 중…[/dim]"
+        elif self._measuring:
+            loading = "  [dim]크기 계산 중…[/dim]"
+        else:
+            loading = ""
+        self._path_label.update(f"{prefix}{safe_path}{loading}")
 
     def _update_column_headers(self) -> None:
         """정렬 상태를 컬럼 헤더에 반영 (화살표 표시)."""
@@ -294,7 +701,4 @@ class FilePanel(Widget):
         table = self._table
         for col_key, label in labels.items():
             indicator = f" {arrow}" if col_key == active_col else ""
-            try:
-                table.update_column(col_key, label=f"{label}{indicator}")
-            except Exception:
-                pass
+            table.update_column(col_key, label=f"{label}{indicator}")
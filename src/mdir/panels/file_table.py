@@ -0,0 +1,289 @@
+"""가상 파일 목록 위젯 (화면에 보이는 행만 그림)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from mdir.models.file_item import FileItem, PanelState
+
+# 셀 좌우 여백
+_CELL_PADDING = 1
+
+
+@dataclass
+class FileColumn:
+    """파일 목록 컬럼 정의. width=None 이면 남는 너비를 모두 사용."""
+
+    key: str
+    label: str
+    width: int | None = None
+
+
+class FileTable(ScrollView, can_focus=True):
+    """PanelState.items 를 직접 읽어 보이는 행만 그리는 가상 목록.
+
+    DataTable 과 달리 행 데이터를 복사해 두지 않으므로 목록을 다시 그리는
+    비용이 디렉토리 크기가 아닌 터미널 높이에만 비례한다.
+    첫 줄은 스크롤되지 않는 헤더이며, 헤더 클릭은 HeaderSelected 로 알린다.
+    """
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "위", show=False),
+        Binding("down", "cursor_down", "아래", show=False),
+        Binding("pageup", "page_up", "이전 페이지", show=False),
+        Binding("pagedown", "page_down", "다음 페이지", show=False),
+        Binding("home", "first", "처음", show=False),
+        Binding("end", "last", "끝", show=False),
+        Binding("enter", "select_cursor", "선택", show=False),
+    ]
+
+    COMPONENT_CLASSES = {
+        "file-table--header",
+        "file-table--cursor",
+        "file-table--even-row",
+        "file-table--odd-row",
+    }
+
+    DEFAULT_CSS = """
+    FileTable {
+        height: 1fr;
+        overflow-x: hidden;
+        overflow-y: auto;
+    }
+    FileTable > .file-table--header {
+        text-style: bold;
+    }
+    FileTable > .file-table--cursor {
+        background: $accent;
+    }
+    """
+
+    cursor_row: reactive[int] = reactive(0, always_update=True, init=False)
+
+    class RowHighlighted(Message):
+        """커서 행 변경 알림."""
+
+        def __init__(self, table: FileTable, cursor_row: int) -> None:
+            super().__init__()
+            self.table = table
+            self.cursor_row = cursor_row
+
+        @property
+        def control(self) -> FileTable:
+            return self.table
+
+    class RowSelected(Message):
+        """Enter 또는 커서 행 클릭 알림."""
+
+        def __init__(self, table: FileTable, cursor_row: int) -> None:
+            super().__init__()
+            self.table = table
+            self.cursor_row = cursor_row
+
+        @property
+        def control(self) -> FileTable:
+            return self.table
+
+    class HeaderSelected(Message):
+        """컬럼 헤더 클릭 알림."""
+
+        def __init__(self, table: FileTable, column_key: str) -> None:
+            super().__init__()
+            self.table = table
+            self.column_key = column_key
+
+        @property
+        def control(self) -> FileTable:
+            return self.table
+
+    def __init__(
+        self,
+        state: PanelState,
+        columns: list[FileColumn],
+        render_cells: Callable[[FileItem], tuple[str, ...]],
+        zebra_stripes: bool = True,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._state = state
+        self.columns = columns
+        self._render_cells = render_cells
+        self.zebra_stripes = zebra_stripes
+
+    # ── 공개 API ──────────────────────────────
+
+    @property
+    def row_count(self) -> int:
+        return len(self._state.items)
+
+    def move_cursor(self, row: int) -> None:
+        """커서를 row 로 옮기고 보이도록 스크롤."""
+        self.cursor_row = row
+
+    def update_column(self, key: str, label: str) -> None:
+        for column in self.columns:
+            if column.key == key:
+                column.label = label
+        self.refresh_line(self.scroll_offset.y)
+
+    def refresh_rows(self) -> None:
+        """목록이 바뀐 뒤 호출: 가상 크기 갱신 후 보이는 행만 다시 그림."""
+        self._update_virtual_size()
+        if self.cursor_row >= self.row_count:
+            self.cursor_row = max(0, self.row_count - 1)
+        self.refresh()
+
+    def refresh_row(self, row_index: int) -> None:
+        """한 행만 다시 그림 (보이지 않는 행이면 비용 없음)."""
+        self.refresh_line(row_index + 1)
+
+    def refresh_row_range(self, start: int, end: int) -> None:
+        """start~end 행(양끝 포함) 중 화면에 보이는 부분만 다시 그림."""
+        top = self.scroll_offset.y
+        first = max(start, top)
+        last = min(end, top + self._visible_rows - 1)
+        if first <= last:
+            self.refresh_lines(first + 1, last - first + 1)
+
+    # ── reactive ─────────────────────────────
+
+    def validate_cursor_row(self, row: int) -> int:
+        return max(0, min(row, self.row_count - 1))
+
+    def watch_cursor_row(self, old_row: int, new_row: int) -> None:
+        if old_row != new_row:
+            self.refresh_row(old_row)
+        self.refresh_row(new_row)
+        self._scroll_cursor_into_view()
+        self.post_message(self.RowHighlighted(self, new_row))
+
+    # ── 액션 ─────────────────────────────────
+
+    def action_cursor_up(self) -> None:
+        self.cursor_row -= 1
+
+    def action_cursor_down(self) -> None:
+        self.cursor_row += 1
+
+    def action_page_up(self) -> None:
+        self.cursor_row -= self._page_height
+
+    def action_page_down(self) -> None:
+        self.cursor_row += self._page_height
+
+    def action_first(self) -> None:
+        self.cursor_row = 0
+
+    def action_last(self) -> None:
+        self.cursor_row = self.row_count - 1
+
+    def action_select_cursor(self) -> None:
+        if self.row_count:
+            self.post_message(self.RowSelected(self, self.cursor_row))
+
+    # ── 이벤트 핸들러 ─────────────────────────
+
+    def on_mount(self) -> None:
+        self._update_virtual_size()
+
+    def on_resize(self, _event: events.Resize) -> None:
+        self._update_virtual_size()
+
+    def on_click(self, event: events.Click) -> None:
+        meta = event.style.meta
+        if "column" in meta:
+            self.post_message(self.HeaderSelected(self, meta["column"]))
+        elif "row" in meta:
+            row = meta["row"]
+            if row == self.cursor_row:
+                self.action_select_cursor()
+            else:
+                self.cursor_row = row
+
+    # ── 렌더링 ─────────────────────────────────
+
+    def render_line(self, y: int) -> Strip:
+        width = self.scrollable_content_region.width
+        if y == 0:
+            return self._render_header(width)
+        row_index = self.scroll_offset.y + y - 1
+        if row_index >= self.row_count:
+            return Strip.blank(width, self.rich_style)
+        return self._render_row(row_index, width)
+
+    def _column_widths(self, width: int) -> list[int]:
+        fixed = sum(c.width + 2 * _CELL_PADDING for c in self.columns if c.width is not None)
+        flex = [c for c in self.columns if c.width is None]
+        flex_width = max(4, (width - fixed) // max(1, len(flex)) - 2 * _CELL_PADDING)
+        return [c.width if c.width is not None else flex_width for c in self.columns]
+
+    def _render_cells_line(self, cells: list[Text], width: int, style: Style) -> Strip:
+        segments: list[Segment] = []
+        pad = " " * _CELL_PADDING
+        for text, cell_width in zip(cells, self._column_widths(width), strict=True):
+            text.truncate(cell_width, overflow="ellipsis", pad=True)
+            segments.append(Segment(pad))
+            segments.extend(text.render(self.app.console))
+            segments.append(Segment(pad))
+        strip = Strip(Segment.apply_style(segments, style))
+        return strip.adjust_cell_length(width, style)
+
+    def _render_header(self, width: int) -> Strip:
+        style = self.rich_style + self.get_component_rich_style("file-table--header")
+        segments: list[Segment] = []
+        pad = " " * _CELL_PADDING
+        for column, cell_width in zip(self.columns, self._column_widths(width), strict=True):
+            text = Text(column.label, no_wrap=True)
+            text.truncate(cell_width, overflow="ellipsis", pad=True)
+            cell_style = style + Style.from_meta({"column": column.key})
+            segments.append(Segment(pad, cell_style))
+            segments.extend(Segment.apply_style(text.render(self.app.console), cell_style))
+            segments.append(Segment(pad, cell_style))
+        return Strip(segments).adjust_cell_length(width, style)
+
+    def _render_row(self, row_index: int, width: int) -> Strip:
+        item = self._state.items[row_index]
+        style = self.rich_style
+        if self.zebra_stripes:
+            stripe = "file-table--even-row" if row_index % 2 == 0 else "file-table--odd-row"
+            style += self.get_component_rich_style(stripe)
+        if row_index == self.cursor_row:
+            style += self.get_component_rich_style("file-table--cursor")
+        style += Style.from_meta({"row": row_index})
+        cells = [Text.from_markup(cell, end="") for cell in self._render_cells(item)]
+        return self._render_cells_line(cells, width, style)
+
+    # ── 내부 헬퍼 ─────────────────────────────
+
+    @property
+    def _page_height(self) -> int:
+        return max(1, self.size.height - 2)
+
+    @property
+    def _visible_rows(self) -> int:
+        # 헤더를 뺀 화면 높이
+        return max(1, self.size.height - 1)
+
+    def _update_virtual_size(self) -> None:
+        # 헤더 1줄 + 행 수. 가로 스크롤은 쓰지 않는다.
+        self.virtual_size = Size(0, self.row_count + 1)
+
+    def _scroll_cursor_into_view(self) -> None:
+        visible_rows = self._visible_rows
+        top = self.scroll_offset.y
+        if self.cursor_row < top:
+            self.scroll_to(y=self.cursor_row, animate=False)
+        elif self.cursor_row >= top + visible_rows:
+            self.scroll_to(y=self.cursor_row - visible_rows + 1, animate=False)
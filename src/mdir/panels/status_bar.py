@@ -20,12 +20,28 @@ class StatusBar(Widget):
 
     def compose(self) -> ComposeResult:
         yield Label("준비", id="status-left")
+        yield Label("", id="status-progress")
         yield Label("", id="status-right")
 
     def update(self, left: str = "", right: str = "") -> None:
         self.query_one("#status-left", Label).update(left)
         self.query_one("#status-right", Label).update(right)
 
+    def update_right(self, right: str) -> None:
+        """오른쪽(패널 정보)만 갱신 — 왼쪽의 작업 결과 메시지는 유지."""
+        self.query_one("#status-right", Label).update(right)
+
+    def show_progress(self, text: str) -> None:
+        """파일 작업 진행 상황 표시 (왼쪽 메시지와 별도 칸 — 커서 이동에 덮이지 않음)."""
+        label = self.query_one("#status-progress", Label)
+        label.update(text)
+        label.display = True
+
+    def clear_progress(self) -> None:
+        label = self.query_one("#status-progress", Label)
+        label.update("")
+        label.display = False
+
     def set_error(self, message: str) -> None:
         self.query_one("#status-left", Label).update(
             f"[bold red]오류: {message}[/]"
@@ -41,6 +57,7 @@ _FKEYS = [
     ("F6", "이동"),
     ("F7", "폴더"),
     ("F8", "삭제"),
+    ("F9", "동기화"),
     ("F10", "종료"),
 ]
 
@@ -0,0 +1,253 @@
+"""작업 취소·일시정지 단위 테스트 (복사·이동·삭제)."""
+
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mdir.models.changes import ChangeSet
+from mdir.models.file_item import FileItem
+from mdir.operations.cancel import CancelToken
+from mdir.operations.copy import CopyReport, copy_items
+from mdir.operations.delete import delete_items
+from mdir.operations.exceptions import OperationCancelledError
+from mdir.operations.jobs import CANCELLED, JobQueue
+from mdir.operations.journal import CopyJournal
+from mdir.operations.move import move_items
+from mdir.operations.progress import OperationProgress
+
+_CHUNK = 1024 * 1024
+
+
+class _CancelAfter(OperationProgress):
+    """데이터를 bytes_limit 만큼 복사했거나 파일을 files_limit 개 끝내면 취소."""
+
+    def __init__(self, token: CancelToken, bytes_limit: int = 0, files_limit: int = 0) -> None:
+        super().__init__()
+        self.token = token
+        self.bytes_limit = bytes_limit
+        self.files_limit = files_limit
+
+    def advance(self, nbytes: int) -> None:
+        super().advance(nbytes)
+        if self.bytes_limit and self.bytes_done >= self.bytes_limit:
+            self.token.cancel()
+
+    def file_done(self, count: int = 1) -> None:
+        super().file_done(count)
+        if self.files_limit and self.files_done >= self.files_limit:
+            self.token.cancel()
+
+
+def _userspace_only(src, dest, **kwargs):
+    """덩어리(1MB)마다 on_bytes 를 부르도록 사용자 공간 복사만 쓰게 함."""
+    from mdir.operations import fastcopy
+
+    return fastcopy.copy_file(src, dest, methods=[fastcopy.METHOD_USERSPACE], **kwargs)
+
+
+class TestCancelToken:
+    def test_pause_blocks_until_resume(self) -> None:
+        token = CancelToken()
+        token.pause()
+        passed = threading.Event()
+
+        def worker() -> None:
+            token.check()
+            passed.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not passed.wait(0.1)
+        token.resume()
+        assert passed.wait(2)
+        thread.join()
+
+    def test_cancel_wakes_paused_thread(self) -> None:
+        token = CancelToken()
+        token.pause()
+        errors: list[Exception] = []
+
+        def worker() -> None:
+            try:
+                token.check()
+            except OperationCancelledError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        token.cancel()
+        thread.join(2)
+        assert len(errors) == 1
+        assert not token.paused
+        token.pause()  # 취소된 뒤에는 일시정지하지 않는다
+        assert not token.paused
+
+
+class TestCopyCancel:
+    def test_cancel_mid_file_removes_partial_copy(self, tmp_path: Path) -> None:
+        src = tmp_path / "big.bin"
+        src.write_bytes(b"x" * (_CHUNK * 8))
+        (tmp_path / "dst").mkdir()
+        token = CancelToken()
+        changes = ChangeSet()
+        report = CopyReport()
+        with patch("mdir.operations.copy.copy_file", side_effect=_userspace_only), pytest.raises(
+            OperationCancelledError
+        ):
+            copy_items(
+                [FileItem.from_path(src)],
+                tmp_path / "dst",
+                changes=changes,
+                report=report,
+                progress=_CancelAfter(token, bytes_limit=_CHUNK * 2),
+                cancel=token,
+                workers=2,
+            )
+        assert list((tmp_path / "dst").iterdir()) == []
+        assert report.discarded == 1
+        assert not changes.trusted
+
+    def test_cancel_between_files_keeps_finished_ones(self, tmp_path: Path) -> None:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "dst").mkdir()
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (tmp_path / "src" / name).write_text(name)
+        items = [FileItem.from_path(p) for p in sorted((tmp_path / "src").iterdir())]
+        token = CancelToken()
+        with pytest.raises(OperationCancelledError):
+            copy_items(
+                items,
+                tmp_path / "dst",
+                progress=_CancelAfter(token, files_limit=1),
+                cancel=token,
+                workers=1,
+            )
+        assert [p.name for p in (tmp_path / "dst").iterdir()] == ["a.txt"]
+
+    def test_cancel_in_tree_stops_walk(self, tmp_path: Path) -> None:
+        tree = tmp_path / "tree"
+        tree.mkdir()
+        for i in range(20):
+            (tree / f"f{i:02d}.txt").write_text("x")
+        (tmp_path / "dst").mkdir()
+        token = CancelToken()
+        with pytest.raises(OperationCancelledError):
+            copy_items(
+                [FileItem.from_path(tree)],
+                tmp_path / "dst",
+                progress=_CancelAfter(token, files_limit=3),
+                cancel=token,
+                workers=1,
+            )
+        assert len(list((tmp_path / "dst" / "tree").iterdir())) == 3
+
+    def test_journaled_cancel_keeps_partial_file_for_resume(self, tmp_path: Path) -> None:
+        src = tmp_path / "big.bin"
+        data = os.urandom(_CHUNK * 6)
+        src.write_bytes(data)
+        (tmp_path / "dst").mkdir()
+        token = CancelToken()
+        journal = CopyJournal.open([src], tmp_path / "dst", tmp_path / "jobs")
+        report = CopyReport()
+        with patch("mdir.operations.copy.CHECKPOINT_BYTES", _CHUNK), patch(
+            "mdir.operations.copy.copy_file", side_effect=_userspace_only
+        ), pytest.raises(OperationCancelledError):
+            copy_items(
+                [FileItem.from_path(src)],
+                tmp_path / "dst",
+                report=report,
+                progress=_CancelAfter(token, bytes_limit=_CHUNK * 3),
+                journal=journal,
+                cancel=token,
+                workers=1,
+            )
+        dest = tmp_path / "dst" / "big.bin"
+        assert dest.exists()
+        assert report.discarded == 0
+
+        again = CopyJournal.open([src], tmp_path / "dst", tmp_path / "jobs")
+        offset = again.resume_offset(str(dest), src.stat())
+        assert offset >= _CHUNK * 2
+        copy_items([FileItem.from_path(src)], tmp_path / "dst", journal=again, workers=1)
+        assert dest.read_bytes() == data
+
+    def test_paused_copy_waits_then_finishes(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.txt"
+        src.write_text("data")
+        (tmp_path / "dst").mkdir()
+        token = CancelToken()
+        token.pause()
+        thread = threading.Thread(
+            target=copy_items,
+            args=([FileItem.from_path(src)], tmp_path / "dst"),
+            kwargs={"cancel": token, "workers": 1},
+        )
+        thread.start()
+        time.sleep(0.1)
+        assert thread.is_alive()
+        token.resume()
+        thread.join(2)
+        assert (tmp_path / "dst" / "a.txt").read_text() == "data"
+
+
+class TestMoveAndDeleteCancel:
+    def test_cross_device_move_cancel_keeps_source(self, tmp_path: Path) -> None:
+        src = tmp_path / "big.bin"
+        src.write_bytes(b"y" * (_CHUNK * 4))
+        (tmp_path / "dst").mkdir()
+        token = CancelToken()
+        with patch(
+            "mdir.operations.move._rename_no_replace", side_effect=OSError(18, "EXDEV")
+        ), patch(
+            "mdir.operations.copy.copy_file", side_effect=_userspace_only
+        ), pytest.raises(OperationCancelledError):
+            move_items(
+                [FileItem.from_path(src)],
+                tmp_path / "dst",
+                progress=_CancelAfter(token, bytes_limit=_CHUNK),
+                cancel=token,
+                workers=1,
+            )
+        assert src.stat().st_size == _CHUNK * 4
+        assert list((tmp_path / "dst").iterdir()) == []
+
+    def test_delete_stops_between_items(self, tmp_path: Path) -> None:
+        paths = [tmp_path / f"{n}.txt" for n in "abc"]
+        for p in paths:
+            p.write_text("x")
+        token = CancelToken()
+        changes = ChangeSet()
+        with patch("mdir.operations.delete.send2trash") as trash, pytest.raises(
+            OperationCancelledError
+        ):
+            delete_items(
+                [FileItem.from_path(p) for p in paths],
+                changes,
+                progress=_CancelAfter(token, files_limit=1),
+                cancel=token,
+            )
+        assert trash.call_count == 1
+        assert changes.removed == {paths[0]}
+        assert not changes.trusted
+
+
+def test_job_reports_completed_work_on_cancel() -> None:
+    def work(progress: OperationProgress, cancel: CancelToken) -> None:
+        progress.add_total(10, 0)
+        progress.finish_scan()
+        for _ in range(10):
+            cancel.check()
+            progress.file_done()
+            if progress.files_done == 4:
+                cancel.cancel()
+
+    queue = JobQueue()
+    job = queue.submit("삭제", work, cancel=CancelToken())
+    with pytest.raises(OperationCancelledError) as info:
+        job.future.result(5)
+    assert job.state == CANCELLED
+    assert info.value.completed == "항목 4/10개 완료"
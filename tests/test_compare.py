@@ -0,0 +1,118 @@
+"""폴더 비교 단위 테스트."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mdir.models.file_item import FileItem, PanelState
+from mdir.operations import compare as compare_mod
+from mdir.operations.cancel import CancelToken
+from mdir.operations.compare import compare_listings, compare_trees, same_content
+from mdir.operations.exceptions import OperationCancelledError
+from mdir.operations.progress import OperationProgress
+
+
+def _pair(root: Path) -> tuple[Path, Path]:
+    """왼쪽·오른쪽 트리. 메타데이터까지 같은 파일과 여러 종류의 차이를 섞어 둔다."""
+    left, right = root / "left", root / "right"
+    for side in (left, right):
+        (side / "sub" / "deep").mkdir(parents=True)
+        (side / "same.txt").write_text("same")
+        (side / "sub" / "deep" / "same.txt").write_text("deep same")
+        (side / "touched.txt").write_text("touched")
+        (side / "edited.txt").write_text("aaaa")
+    (left / "only_left.txt").write_text("l")
+    (right / "only_right").mkdir()
+    (right / "sub" / "deep" / "extra.txt").write_text("x")
+    (right / "edited.txt").write_text("bbbb")
+    for name in ("same.txt", os.path.join("sub", "deep", "same.txt")):
+        st = os.stat(left / name)
+        os.utime(right / name, ns=(st.st_atime_ns, st.st_mtime_ns))
+    # 내용은 같고 시각만 다름 / 크기 같고 내용 다름 (시각도 다름)
+    os.utime(right / "touched.txt", ns=(0, 1_000_000_000))
+    os.utime(right / "edited.txt", ns=(0, 2_000_000_000))
+    return left, right
+
+
+def _items(path: Path) -> list[FileItem]:
+    return [FileItem.from_path(p) for p in sorted(path.iterdir())]
+
+
+class TestCompareTrees:
+    def test_reports_differences_by_relative_path(self, tmp_path: Path) -> None:
+        left, right = _pair(tmp_path)
+        result = compare_trees(left, right, workers=2)
+        assert result.left_only == ["only_left.txt"]
+        assert result.right_only == ["only_right", os.path.join("sub", "deep", "extra.txt")]
+        assert result.different == ["edited.txt"]
+        assert result.left_marks() == {"only_left.txt", "edited.txt"}
+        assert result.right_marks() == {"only_right", "sub", "edited.txt"}
+
+    def test_reads_only_ambiguous_files(self, tmp_path: Path) -> None:
+        left, right = _pair(tmp_path)
+        seen: list[str] = []
+        real = compare_mod.same_content
+
+        def spy(a: str, b: str) -> bool:
+            seen.append(os.path.basename(a))
+            return real(a, b)
+
+        with patch("mdir.operations.compare.same_content", side_effect=spy):
+            result = compare_trees(left, right, workers=2)
+        assert sorted(seen) == ["edited.txt", "touched.txt"]
+        assert result.content_checked == 2
+
+    def test_names_limit_top_level(self, tmp_path: Path) -> None:
+        left, right = _pair(tmp_path)
+        result = compare_trees(left, right, names={"sub", "same.txt"}, workers=1)
+        assert result.left_only == []
+        assert result.right_only == [os.path.join("sub", "deep", "extra.txt")]
+
+    def test_progress_and_cancel(self, tmp_path: Path) -> None:
+        left, right = _pair(tmp_path)
+        progress = OperationProgress()
+        compare_trees(left, right, progress=progress, workers=1)
+        assert progress.files_total == 15
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(OperationCancelledError):
+            compare_trees(left, right, cancel=token, workers=1)
+
+
+class TestCompareListings:
+    def test_uses_listing_metadata(self, tmp_path: Path) -> None:
+        left, right = _pair(tmp_path)
+        result = compare_listings(_items(left), _items(right))
+        # 폴더는 안으로 들어가지 않는다
+        assert result.right_only == ["only_right"]
+        assert result.left_only == ["only_left.txt"]
+        assert result.different == ["edited.txt"]
+
+    def test_symlinks_compare_targets(self, tmp_path: Path) -> None:
+        left, right = tmp_path / "l", tmp_path / "r"
+        left.mkdir()
+        right.mkdir()
+        os.symlink("a", left / "link")
+        os.symlink("b", right / "link")
+        result = compare_listings(_items(left), _items(right))
+        assert result.different == ["link"]
+
+    def test_select_names_marks_panel(self, tmp_path: Path) -> None:
+        left, right = _pair(tmp_path)
+        state = PanelState(current_path=left)
+        state.items = _items(left)
+        state.selection.add(state.items[0])
+        result = compare_listings(state.items, _items(right))
+        assert state.select_names(result.left_marks()) == 2
+        assert sorted(i.name for i in state.selection) == ["edited.txt", "only_left.txt"]
+
+
+def test_same_content(tmp_path: Path) -> None:
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.write_bytes(b"x" * 100 + b"y")
+    b.write_bytes(b"x" * 100 + b"z")
+    assert not same_content(str(a), str(b), chunk=16)
+    b.write_bytes(b"x" * 100 + b"y")
+    assert same_content(str(a), str(b), chunk=16)
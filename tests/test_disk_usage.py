@@ -0,0 +1,54 @@
+"""마운트별 디스크 용량 캐시 단위 테스트."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from mdir.models.disk_usage import DiskUsageCache, read_disk_usage
+from mdir.models.file_item import PanelState
+
+
+class TestDiskUsageCache:
+    def test_refresh_reads_once_within_max_age(self, tmp_path: Path) -> None:
+        cache = DiskUsageCache(max_age=60)
+        with patch("mdir.models.disk_usage.read_disk_usage", return_value=(1, 2)) as read:
+            assert cache.refresh(tmp_path, 1) == (1, 2)
+            assert cache.refresh(tmp_path, 1) == (1, 2)
+            assert read.call_count == 1
+            cache.refresh(tmp_path, 1, force=True)
+            assert read.call_count == 2
+
+    def test_get_missing(self) -> None:
+        assert DiskUsageCache().get(42) is None
+
+    def test_read_disk_usage(self, tmp_path: Path) -> None:
+        free, total = read_disk_usage(tmp_path)
+        assert total >= free >= 0
+
+
+class TestPanelStatusAggregates:
+    def test_disk_info_without_syscall(self, tmp_path: Path) -> None:
+        state = PanelState(current_path=tmp_path, disk_usage=DiskUsageCache())
+        state.enter_directory(tmp_path)
+        expected = state.disk_info()
+        assert expected[1] > 0
+        with patch("mdir.models.disk_usage.read_disk_usage", side_effect=AssertionError("io")):
+            assert state.disk_info() == expected
+
+    def test_disk_shared_per_device(self, tmp_path: Path) -> None:
+        (tmp_path / "sub").mkdir()
+        cache = DiskUsageCache(max_age=60)
+        state = PanelState(current_path=tmp_path, disk_usage=cache)
+        with patch("mdir.models.disk_usage.read_disk_usage", return_value=(1, 2)) as read:
+            state.enter_directory(tmp_path)
+            state.enter_directory(tmp_path / "sub")
+            assert read.call_count == 1
+        assert state.disk_info() == (1, 2)
+        assert cache.get(os.stat(tmp_path).st_dev) == (1, 2)
+
+    def test_entry_count(self, tmp_path: Path) -> None:
+        for name in ("a", "b", "c"):
+            (tmp_path / name).write_text("")
+        state = PanelState(current_path=tmp_path)
+        state.enter_directory(tmp_path)
+        assert state.entry_count == 3
@@ -0,0 +1,119 @@
+"""폴더 재귀 크기 계산 (du) 단위 테스트."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from mdir.models.file_item import FileItem, PanelState, sort_items
+from mdir.operations.du import DirSizeCache, measure_tree
+from mdir.operations.exceptions import OperationCancelledError
+
+_OLD_NS = 1_000_000_000_000_000_000  # 캐시 대상이 되도록 충분히 과거의 mtime
+
+
+def _tree(root: Path) -> Path:
+    """root/top 아래 파일 4개 (100 + 20 + 3 + 하드 링크 한 쌍 50)."""
+    top = root / "top"
+    (top / "a" / "b").mkdir(parents=True)
+    (top / "one.bin").write_bytes(b"x" * 100)
+    (top / "a" / "two.bin").write_bytes(b"y" * 20)
+    (top / "a" / "b" / "three.bin").write_bytes(b"z" * 3)
+    (top / "a" / "linked.bin").write_bytes(b"l" * 50)
+    os.link(top / "a" / "linked.bin", top / "a" / "b" / "linked-again.bin")
+    return top
+
+
+def _age(top: Path) -> None:
+    for dirpath, _, _ in os.walk(top):
+        os.utime(dirpath, ns=(_OLD_NS, _OLD_NS))
+
+
+class TestMeasureTree:
+    def test_sums_files_and_counts_hardlinks_once(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path)
+        size = measure_tree(top, workers=2)
+        assert size.nbytes == 100 + 20 + 3 + 50
+        assert size.files == 5
+        assert size.dirs == 3
+        assert size.errors == 0
+
+    def test_cache_rereads_only_changed_dirs(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path)
+        _age(top)
+        cache = DirSizeCache()
+        first = measure_tree(top, cache, workers=2)
+        assert first.cached_dirs == 0
+        assert len(cache) == 3
+
+        (top / "a" / "b" / "new.bin").write_bytes(b"n" * 7)
+        os.utime(top / "a" / "b", ns=(_OLD_NS, _OLD_NS + 1))
+        second = measure_tree(top, cache, workers=2)
+        assert second.nbytes == first.nbytes + 7
+        assert second.cached_dirs == 2
+
+    def test_recent_dirs_are_not_cached(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path)
+        cache = DirSizeCache()
+        measure_tree(top, cache, workers=1)
+        assert len(cache) == 0
+
+    def test_lru_limit(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path)
+        _age(top)
+        cache = DirSizeCache(max_entries=2)
+        measure_tree(top, cache, workers=1)
+        assert len(cache) == 2
+
+    def test_should_stop_cancels(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path)
+        with pytest.raises(OperationCancelledError):
+            measure_tree(top, workers=1, should_stop=lambda: True)
+
+
+class TestTreeSizeInPanel:
+    def _state(self, root: Path, sort_by: str) -> PanelState:
+        for name, size in (("small", 1), ("big", 500), ("mid", 50)):
+            (root / name).mkdir()
+            (root / name / "f").write_bytes(b"x" * size)
+        (root / "file.txt").write_text("t")
+        state = PanelState(current_path=root, sort_by=sort_by)
+        state.items = sort_items([FileItem.from_path(p) for p in root.iterdir()], sort_by)
+        return state
+
+    def test_size_str(self, tmp_path: Path) -> None:
+        item = FileItem.from_path(tmp_path)
+        assert item.size_str == "  <DIR>"
+        item.tree_size = 2048
+        assert item.size_str.strip() == "2.0K"
+
+    def test_size_sort_moves_dirs_as_sizes_arrive(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "size")
+        state.cursor_index = next(i for i, it in enumerate(state.items) if it.name == "small")
+        for name in ("small", "big", "mid"):
+            measured = measure_tree(tmp_path / name, workers=1).nbytes
+            assert state.set_tree_size(name, measured) is None
+        assert [i.name for i in state.items] == ["small", "mid", "big", "file.txt"]
+        assert state.active_item.name == "small"
+
+    def test_size_sort_keeps_cursor_on_shifted_item(self, tmp_path: Path) -> None:
+        state = PanelState(current_path=tmp_path, sort_by="size")
+        items = [
+            FileItem(name=f"d{i:03d}", parent=tmp_path, is_dir=True, size=0, mtime_ns=0)
+            for i in range(200)
+        ]
+        state.items = sort_items(items, "size")
+        state.cursor_index = 57
+        current = state.active_item
+        sizes = {item.name: (i * 7919) % 1000 for i, item in enumerate(items)}
+        for name in sorted(sizes, key=lambda n: sizes[n] % 13):
+            state.set_tree_size(name, sizes[name])
+            assert state.active_item is current
+        assert state.items == sort_items(list(state.items), "size")
+        assert [i.tree_size for i in state.items] == sorted(sizes.values())
+
+    def test_name_sort_updates_in_place(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "name")
+        row = state.set_tree_size("mid", 50)
+        assert state.items[row].name == "mid"
+        assert state.set_tree_size("missing", 1) == -1
@@ -0,0 +1,141 @@
+"""커널 내 파일 복사(fastcopy) 단위 테스트."""
+
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mdir.operations.fastcopy import (
+    METHOD_COPY_FILE_RANGE,
+    METHOD_REFLINK,
+    METHOD_SENDFILE,
+    METHOD_USERSPACE,
+    MethodUnsupportedError,
+    copy_file,
+    method_cache,
+)
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux 전용")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    method_cache.clear()
+    yield
+    method_cache.clear()
+
+
+def _payload(path: Path, size: int = 3 * 1024 * 1024 + 17) -> bytes:
+    data = os.urandom(size)
+    path.write_bytes(data)
+    return data
+
+
+class TestCopyFile:
+    @pytest.mark.parametrize("method", [METHOD_COPY_FILE_RANGE, METHOD_SENDFILE, METHOD_USERSPACE])
+    def test_forced_method(self, tmp_path: Path, method: str) -> None:
+        data = _payload(tmp_path / "src.bin")
+        assert copy_file(str(tmp_path / "src.bin"), str(tmp_path / "dst.bin"), method) == method
+        assert (tmp_path / "dst.bin").read_bytes() == data
+
+    @pytest.mark.parametrize("method", [METHOD_COPY_FILE_RANGE, METHOD_SENDFILE, METHOD_USERSPACE])
+    def test_on_bytes_reports_every_chunk(self, tmp_path: Path, method: str) -> None:
+        data = _payload(tmp_path / "src.bin")
+        chunks: list[int] = []
+        copy_file(str(tmp_path / "src.bin"), str(tmp_path / "dst.bin"), method, on_bytes=chunks.append)
+        assert sum(chunks) == len(data)
+
+    def test_auto_picks_first_working_and_caches(self, tmp_path: Path) -> None:
+        data = _payload(tmp_path / "src.bin")
+        calls = []
+
+        def no_reflink(*args):
+            calls.append(args)
+            raise OSError(errno.EOPNOTSUPP, "not supported")
+
+        with patch("fcntl.ioctl", side_effect=no_reflink):
+            used = copy_file(str(tmp_path / "src.bin"), str(tmp_path / "a.bin"))
+            assert used != METHOD_REFLINK
+            copy_file(str(tmp_path / "src.bin"), str(tmp_path / "b.bin"))
+        # 장치 쌍마다 한 번만 시도
+        assert len(calls) == 1
+        assert (tmp_path / "a.bin").read_bytes() == data
+        assert (tmp_path / "b.bin").read_bytes() == data
+
+    def test_fallback_continues_from_offset(self, tmp_path: Path) -> None:
+        data = _payload(tmp_path / "src.bin")
+        real = os.copy_file_range
+        state = {"n": 0}
+
+        def flaky(src, dst, count, *args):
+            state["n"] += 1
+            if state["n"] == 1:
+                return real(src, dst, 1000)
+            raise OSError(errno.EXDEV, "cross device")
+
+        with patch("fcntl.ioctl", side_effect=OSError(errno.EOPNOTSUPP, "no")), \
+                patch("os.copy_file_range", side_effect=flaky):
+            used = copy_file(str(tmp_path / "src.bin"), str(tmp_path / "dst.bin"))
+        assert used == METHOD_SENDFILE
+        assert (tmp_path / "dst.bin").read_bytes() == data
+
+    def test_forced_unsupported_raises(self, tmp_path: Path) -> None:
+        _payload(tmp_path / "src.bin", 10)
+        with patch("fcntl.ioctl", side_effect=OSError(errno.EXDEV, "cross")), pytest.raises(
+            MethodUnsupportedError
+        ):
+            copy_file(str(tmp_path / "src.bin"), str(tmp_path / "dst.bin"), METHOD_REFLINK)
+
+    def test_real_errors_propagate(self, tmp_path: Path) -> None:
+        _payload(tmp_path / "src.bin", 10)
+        with patch("os.readv", side_effect=OSError(errno.EIO, "I/O error")), pytest.raises(
+            OSError
+        ) as info:
+            copy_file(str(tmp_path / "src.bin"), str(tmp_path / "dst.bin"), METHOD_USERSPACE)
+        assert info.value.errno == errno.EIO
+
+    def test_metadata_like_copy2(self, tmp_path: Path) -> None:
+        src = tmp_path / "src.bin"
+        _payload(src, 100)
+        os.chmod(src, 0o640)
+        os.utime(src, ns=(3_000_000_000, 3_000_000_000))
+        copy_file(str(src), str(tmp_path / "dst.bin"))
+        st = (tmp_path / "dst.bin").stat()
+        assert st.st_mtime_ns == 3_000_000_000
+        assert st.st_mode & 0o777 == 0o640
+
+    def test_same_file_not_truncated(self, tmp_path: Path) -> None:
+        data = _payload(tmp_path / "src.bin", 100)
+        os.link(tmp_path / "src.bin", tmp_path / "hard.bin")
+        with pytest.raises(shutil.SameFileError):
+            copy_file(str(tmp_path / "src.bin"), str(tmp_path / "hard.bin"))
+        assert (tmp_path / "src.bin").read_bytes() == data
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        (tmp_path / "empty").write_bytes(b"")
+        copy_file(str(tmp_path / "empty"), str(tmp_path / "out"))
+        assert (tmp_path / "out").read_bytes() == b""
+
+    def test_fifo_is_not_opened(self, tmp_path: Path) -> None:
+        """FIFO 는 읽기로 열면 멈추므로 열지 않고 바로 실패해야 한다."""
+        os.mkfifo(tmp_path / "pipe")
+        errors: list[Exception] = []
+
+        def run() -> None:
+            for hasher in (None, hashlib.sha256()):
+                try:
+                    copy_file(str(tmp_path / "pipe"), str(tmp_path / "out"), hasher=hasher)
+                except shutil.SpecialFileError as e:
+                    errors.append(e)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert len(errors) == 2
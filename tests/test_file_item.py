@@ -1,11 +1,24 @@
 """FileItem 및 관련 함수 단위 테스트."""
 
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from watchfiles import Change
 
-from mdir.models.file_item import FileItem, PanelState, format_size, load_directory, SortKey
+from mdir.models.changes import ChangeSet
+from mdir.models.file_item import (
+    FileItem,
+    LoadProbe,
+    PanelState,
+    SortKey,
+    format_size,
+    iter_directory,
+    load_directory,
+)
+from mdir.models.listing_cache import ListingCache
 
 
 class TestFileItem:
@@ -60,6 +73,43 @@ class TestFileItem:
         assert item.is_symlink
         assert item.name == "link.txt"
 
+    def test_slots_no_instance_dict(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        f.write_text("")
+        item = FileItem.from_path(f)
+        assert not hasattr(item, "__dict__")
+
+    def test_path_built_lazily(self, tmp_path: Path) -> None:
+        item = FileItem(name="a.txt", parent=tmp_path, is_dir=False, size=0, mtime_ns=0)
+        assert item._path is None
+        assert item.path == tmp_path / "a.txt"
+        assert item.path is item.path
+
+    def test_modified_from_mtime_ns(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        f.write_text("")
+        item = FileItem.from_path(f)
+        assert item.modified.timestamp() == pytest.approx(f.stat().st_mtime, abs=1e-3)
+
+    def test_parent_entry_path(self, tmp_path: Path) -> None:
+        item = FileItem.parent_entry(tmp_path)
+        assert item.path == tmp_path.parent
+
+    def test_clone_clears_selection(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        f.write_text("")
+        item = FileItem.from_path(f)
+        item.is_selected = True
+        copy = item.clone()
+        assert copy is not item
+        assert not copy.is_selected
+        assert copy.path == item.path
+
+    def test_clone_keeps_tree_size(self, tmp_path: Path) -> None:
+        item = FileItem.from_path(tmp_path)
+        item.tree_size = 4096
+        assert item.clone().tree_size == 4096
+
     def test_modified_str_format(self, tmp_path: Path) -> None:
         """날짜 포맷이 YYYY-MM-DD HH:MM 형식인지 확인."""
         f = tmp_path / "file.txt"
@@ -69,6 +119,40 @@ class TestFileItem:
         assert len(parts[0]) == 4, "연도는 4자리여야 함"
 
 
+class TestFromDirEntry:
+    def _entry(self, path: Path) -> os.DirEntry:
+        with os.scandir(path.parent) as it:
+            return next(e for e in it if e.name == path.name)
+
+    def test_file(self, tmp_path: Path) -> None:
+        f = tmp_path / "hello.txt"
+        f.write_text("hello world")
+        item = FileItem.from_dir_entry(self._entry(f))
+        expected = FileItem.from_path(f)
+        assert item == expected
+
+    def test_directory(self, tmp_path: Path) -> None:
+        d = tmp_path / "subdir"
+        d.mkdir()
+        item = FileItem.from_dir_entry(self._entry(d))
+        assert item.is_dir
+        assert not item.is_symlink
+
+    def test_symlink_to_dir_is_not_dir(self, tmp_path: Path) -> None:
+        """디렉토리 심링크는 디렉토리로 취급하지 않고 lstat 메타데이터 사용 (VULN-08)."""
+        target = tmp_path / "target"
+        target.mkdir()
+        link = tmp_path / "link"
+        try:
+            link.symlink_to(target)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported on this platform")
+        item = FileItem.from_dir_entry(self._entry(link))
+        assert item.is_symlink
+        assert not item.is_dir
+        assert item.size == link.lstat().st_size
+
+
 class TestLoadDirectory:
     def test_basic(self, tmp_path: Path) -> None:
         (tmp_path / "a.txt").write_text("a")
@@ -90,6 +174,19 @@ class TestLoadDirectory:
         items = load_directory(tmp_path, show_hidden=True)
         assert any(i.is_hidden for i in items)
 
+    def test_no_path_stat_calls(self, tmp_path: Path) -> None:
+        """scandir 기반 로더는 Path.stat/is_dir/is_symlink 를 호출하지 않는다."""
+        for i in range(5):
+            (tmp_path / f"f{i}.txt").write_text("x")
+        (tmp_path / "subdir").mkdir()
+        with patch.object(Path, "stat", side_effect=AssertionError("Path.stat called")):
+            items = load_directory(tmp_path)
+        assert len(items) == 6
+
+    def test_missing_permission_returns_empty(self, tmp_path: Path) -> None:
+        with patch("mdir.models.file_item.os.scandir", side_effect=PermissionError):
+            assert load_directory(tmp_path) == []
+
 
 class TestPanelState:
     def test_enter_directory(self, tmp_path: Path) -> None:
@@ -106,9 +203,11 @@ class TestPanelState:
         # items[0] 은 '..' 항목 → 선택 불가. 실제 파일 항목 사용
         item = next(i for i in state.items if i.name != "..")
         state.toggle_selection(item)
-        assert item.path in state.selected_paths
+        assert item in state.selection
+        assert item.is_selected
         state.toggle_selection(item)
-        assert item.path not in state.selected_paths
+        assert item not in state.selection
+        assert not item.is_selected
 
     def test_select_all_and_clear(self, tmp_path: Path) -> None:
         for i in range(3):
@@ -116,9 +215,65 @@ class TestPanelState:
         state = PanelState(current_path=tmp_path)
         state.enter_directory(tmp_path)
         state.select_all()
-        assert len(state.selected_paths) == 3
+        assert len(state.selection) == 3
         state.clear_selection()
-        assert len(state.selected_paths) == 0
+        assert len(state.selection) == 0
+        assert not any(i.is_selected for i in state.items)
+
+
+class TestInMemorySort:
+    def _state(self, tmp_path: Path) -> PanelState:
+        (tmp_path / "b_dir").mkdir()
+        (tmp_path / "A_dir").mkdir()
+        (tmp_path / "big.txt").write_bytes(b"x" * 100)
+        (tmp_path / "Mid.txt").write_bytes(b"x" * 50)
+        (tmp_path / "small.txt").write_bytes(b"x")
+        state = PanelState(current_path=tmp_path)
+        state.enter_directory(tmp_path)
+        return state
+
+    def test_set_sort_does_not_rescan(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path)
+        with patch("mdir.models.file_item.os.scandir", side_effect=AssertionError("rescan")):
+            state.set_sort("size")
+            state.set_sort("size", sort_reverse=True)
+            state.set_sort("modified")
+        assert state.sort_by == "modified"
+
+    def test_sort_by_size_in_memory(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path)
+        state.set_sort("size")
+        names = [i.name for i in state.items]
+        assert names == ["..", "A_dir", "b_dir", "small.txt", "Mid.txt", "big.txt"]
+
+    def test_reverse_within_groups(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path)
+        state.set_sort("name", sort_reverse=True)
+        names = [i.name for i in state.items]
+        assert names == ["..", "b_dir", "A_dir", "small.txt", "Mid.txt", "big.txt"]
+        state.set_sort("name", sort_reverse=False)
+        names = [i.name for i in state.items]
+        assert names == ["..", "A_dir", "b_dir", "big.txt", "Mid.txt", "small.txt"]
+
+    def test_reverse_without_dirs(self, tmp_path: Path) -> None:
+        for name in ["a.txt", "b.txt"]:
+            (tmp_path / name).write_text("")
+        state = PanelState(current_path=tmp_path)
+        state.enter_directory(tmp_path)
+        state.set_sort("name", sort_reverse=True)
+        assert [i.name for i in state.items] == ["..", "b.txt", "a.txt"]
+
+    def test_cursor_follows_item(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path)
+        state.cursor_index = next(i for i, it in enumerate(state.items) if it.name == "big.txt")
+        state.set_sort("size")
+        assert state.active_item is not None
+        assert state.active_item.name == "big.txt"
+
+    def test_name_key_is_cached(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path)
+        item = state.items[1]
+        assert item._name_key == item.name.casefold()
 
 
 class TestLoadDirectorySort:
@@ -150,6 +305,238 @@ class TestLoadDirectorySort:
         assert items[0].is_dir
 
 
+class TestSelection:
+    def _state(self, tmp_path: Path, names: list[str]) -> PanelState:
+        for name in names:
+            (tmp_path / name).write_bytes(b"x" * len(name))
+        state = PanelState(current_path=tmp_path)
+        state.enter_directory(tmp_path)
+        return state
+
+    def test_select_all_has_no_cap(self, tmp_path: Path) -> None:
+        state = PanelState(current_path=tmp_path)
+        state.items = [FileItem.parent_entry(tmp_path)] + [
+            FileItem(name=f"f{i}", parent=tmp_path, is_dir=False, size=1, mtime_ns=0)
+            for i in range(20_000)
+        ]
+        state.select_all()
+        assert len(state.selection) == 20_000
+        assert state.selection.total_bytes == 20_000
+        assert not state.items[0].is_selected
+
+    def test_get_selected_items_in_selection_order(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, ["a.txt", "b.txt", "c.txt"])
+        c, a = state.items[3], state.items[1]
+        state.toggle_selection(c)
+        state.toggle_selection(a)
+        assert state.get_selected_items() == [c, a]
+
+    def test_invert_selection(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, ["a.txt", "b.txt", "c.txt"])
+        state.toggle_selection(state.items[1])
+        state.invert_selection()
+        assert sorted(i.name for i in state.get_selected_items()) == ["b.txt", "c.txt"]
+
+    def test_select_pattern_case_insensitive(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, ["a.JPG", "b.jpg", "c.png", "d.txt"])
+        assert state.select_pattern("*.jpg;*.png") == 3
+        assert sorted(i.name for i in state.get_selected_items()) == ["a.JPG", "b.jpg", "c.png"]
+        assert state.select_pattern("*.png", select=False) == 1
+        assert len(state.selection) == 2
+
+    def test_select_range_skips_parent_entry(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, ["a.txt", "b.txt", "c.txt", "d.txt"])
+        state.select_range(3, 0)
+        assert [i.name for i in state.items if i.is_selected] == ["a.txt", "b.txt", "c.txt"]
+
+    def test_select_range_shrinks_back_toward_anchor(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, ["a.txt", "b.txt", "c.txt", "d.txt", "e.txt"])
+        state.select_range(2, 5)
+        state.select_range(2, 3, previous=5)
+        assert [i.name for i in state.items if i.is_selected] == ["b.txt", "c.txt"]
+        # 기준 행을 지나 반대쪽으로 넘어가면 이전 범위는 모두 해제
+        state.select_range(2, 1, previous=3)
+        assert [i.name for i in state.items if i.is_selected] == ["a.txt", "b.txt"]
+
+    def test_total_bytes_tracks_toggles(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, ["a.txt", "bb.txt"])
+        state.select_all()
+        assert state.selection.total_bytes == len("a.txt") + len("bb.txt")
+        state.toggle_selection(state.items[1])
+        assert state.selection.total_bytes == len("bb.txt")
+
+
+class TestApplyChanges:
+    def _state(self, tmp_path: Path, *names: str, sort_by: str = "name") -> PanelState:
+        for name in names:
+            (tmp_path / name).write_text("")
+        state = PanelState(current_path=tmp_path, sort_by=sort_by)
+        state.enter_directory(tmp_path)
+        return state
+
+    def _names(self, state: PanelState) -> list[str]:
+        return [i.name for i in state.items]
+
+    def test_insert_keeps_sort_order(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "a.txt", "c.txt")
+        (tmp_path / "b.txt").write_text("")
+        (tmp_path / "sub").mkdir()
+        changes = ChangeSet(added={tmp_path / "b.txt", tmp_path / "sub"})
+        with patch("mdir.models.file_item.os.scandir", side_effect=AssertionError("rescan")):
+            assert state.apply_changes(changes) is None
+        assert self._names(state) == ["..", "sub", "a.txt", "b.txt", "c.txt"]
+
+    def test_insert_reverse_order(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "a.txt", "c.txt")
+        state.set_sort("name", sort_reverse=True)
+        (tmp_path / "b.txt").write_text("")
+        state.apply_changes(ChangeSet(added={tmp_path / "b.txt"}))
+        assert self._names(state) == ["..", "c.txt", "b.txt", "a.txt"]
+
+    def test_remove_keeps_cursor_item(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "a.txt", "b.txt", "c.txt")
+        state.cursor_index = 3
+        (tmp_path / "a.txt").unlink()
+        state.apply_changes(ChangeSet(removed={tmp_path / "a.txt"}))
+        assert self._names(state) == ["..", "b.txt", "c.txt"]
+        assert state.active_item is not None
+        assert state.active_item.name == "c.txt"
+
+    def test_modified_in_place(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "a.txt", "b.txt")
+        (tmp_path / "b.txt").write_text("grown")
+        assert state.apply_changes(ChangeSet(modified={tmp_path / "b.txt"})) == [2]
+        assert state.items[2].size == 5
+
+    def test_modified_moves_when_sort_key_changes(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "a.txt", "b.txt", sort_by="size")
+        (tmp_path / "a.txt").write_text("grown")
+        assert state.apply_changes(ChangeSet(modified={tmp_path / "a.txt"})) is None
+        assert self._names(state) == ["..", "b.txt", "a.txt"]
+
+    def test_selection_survives_update(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "a.txt")
+        state.toggle_selection(state.items[1])
+        (tmp_path / "a.txt").write_text("grown")
+        state.apply_changes(ChangeSet(modified={tmp_path / "a.txt"}))
+        assert state.items[1].is_selected
+        assert state.get_selected_items() == [state.items[1]]
+        assert state.selection.total_bytes == 5
+
+    def test_rename_follows_cursor(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "a.txt", "b.txt", "c.txt")
+        state.cursor_index = 1
+        (tmp_path / "a.txt").rename(tmp_path / "z.txt")
+        state.apply_changes(ChangeSet(renamed={tmp_path / "a.txt": tmp_path / "z.txt"}))
+        assert self._names(state) == ["..", "b.txt", "c.txt", "z.txt"]
+        assert state.active_item is not None
+        assert state.active_item.name == "z.txt"
+
+    def test_hidden_and_foreign_paths_ignored(self, tmp_path: Path) -> None:
+        state = self._state(tmp_path, "a.txt")
+        (tmp_path / ".hidden").write_text("")
+        other = tmp_path / "sub"
+        other.mkdir()
+        (other / "x.txt").write_text("")
+        changes = ChangeSet(added={tmp_path / ".hidden", other / "x.txt"})
+        assert state.apply_changes(changes) == []
+
+    def test_from_watch(self, tmp_path: Path) -> None:
+        changes = ChangeSet.from_watch(
+            {
+                (Change.added, str(tmp_path / "a")),
+                (Change.deleted, str(tmp_path / "b")),
+                (Change.modified, str(tmp_path / "c")),
+            }
+        )
+        assert changes.added == {tmp_path / "a"}
+        assert changes.removed == {tmp_path / "b"}
+        assert changes.modified == {tmp_path / "c"}
+        assert len(changes) == 3
+
+
+class TestStreamingLoad:
+    def test_iter_directory_batches(self, tmp_path: Path) -> None:
+        for i in range(7):
+            (tmp_path / f"f{i}.txt").write_text("")
+        batches = list(iter_directory(tmp_path, batch_size=3))
+        assert [len(b) for b in batches] == [3, 3, 1]
+
+    def test_iter_directory_hidden(self, tmp_path: Path) -> None:
+        (tmp_path / ".hidden").write_text("")
+        (tmp_path / "visible.txt").write_text("")
+        names = [i.name for b in iter_directory(tmp_path) for i in b]
+        assert names == ["visible.txt"]
+
+    def test_batches_settle_to_sorted_order(self, tmp_path: Path) -> None:
+        for name in ["d.txt", "b.txt", "c.txt", "a.txt"]:
+            (tmp_path / name).write_text("")
+        (tmp_path / "zdir").mkdir()
+        state = PanelState(current_path=tmp_path)
+        state.begin_load(tmp_path)
+        assert state.loading
+        for batch in iter_directory(tmp_path, batch_size=2):
+            state.add_batch(batch)
+        assert state.loaded_count == 5
+        # 같은 디렉토리의 항목은 부모 Path 를 공유
+        assert len({id(i.parent) for i in state.items[1:]}) == 1
+        state.finish_load()
+        assert not state.loading
+        names = [i.name for i in state.items]
+        assert names == ["..", "zdir", "a.txt", "b.txt", "c.txt", "d.txt"]
+
+    def test_begin_load_with_probe_does_no_io(self, tmp_path: Path) -> None:
+        """워커에서 얻은 probe 로 시작하면 UI 스레드는 파일시스템에 접근하지 않는다."""
+        (tmp_path / "a.txt").write_text("")
+        state = PanelState(current_path=tmp_path, cache=ListingCache())
+        probe = state.probe_load(tmp_path)
+        assert probe.path == tmp_path.resolve()
+        assert probe.signature is not None
+        with patch("mdir.models.file_item.dir_signature", side_effect=AssertionError("io")), \
+                patch.object(Path, "resolve", side_effect=AssertionError("io")):
+            state.begin_load(tmp_path, probe)
+        assert state.loading
+        assert [i.name for i in state.items] == [".."]
+
+    def test_cached_listing_from_probe(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("")
+        cache = ListingCache()
+        first = PanelState(current_path=tmp_path, cache=cache)
+        first.enter_directory(tmp_path)
+        other = PanelState(current_path=tmp_path, cache=cache)
+        probe = other.probe_load(tmp_path)
+        cached = other.cached_listing(probe)
+        assert cached is not None
+        other.begin_load(tmp_path, probe)
+        assert other.take_cached(cached)
+        other.finish_load()
+        assert [i.name for i in other.items] == ["..", "a.txt"]
+        assert other.cached_listing(LoadProbe(tmp_path.resolve())) is None
+
+    def test_finish_load_focus_name(self, tmp_path: Path) -> None:
+        for name in ["a", "b", "c"]:
+            (tmp_path / name).mkdir()
+        state = PanelState(current_path=tmp_path)
+        state.begin_load(tmp_path)
+        for batch in iter_directory(tmp_path, batch_size=1):
+            state.add_batch(batch)
+        state.finish_load(focus_name="b")
+        assert state.active_item is not None
+        assert state.active_item.name == "b"
+
+    def test_finish_load_keeps_cursor_item(self, tmp_path: Path) -> None:
+        for name in ["c.txt", "a.txt", "b.txt"]:
+            (tmp_path / name).write_text("")
+        state = PanelState(current_path=tmp_path)
+        state.begin_load(tmp_path)
+        for batch in iter_directory(tmp_path, batch_size=1):
+            state.add_batch(batch)
+        state.cursor_index = 2
+        held = state.active_item
+        state.finish_load()
+        assert state.active_item is held
+
+
 class TestFormatSize:
     def test_bytes(self) -> None:
         assert "B" in format_size(100)
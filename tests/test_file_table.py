@@ -0,0 +1,236 @@
+"""가상 파일 목록 위젯(FileTable) 테스트 (Textual pilot)."""
+
+import asyncio
+import shutil
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from textual.app import App, ComposeResult
+
+from mdir.app import MdirApp
+from mdir.models.changes import ChangeSet
+from mdir.models.file_item import FileItem, PanelState
+from mdir.panels.file_panel import FilePanel
+from mdir.panels.file_table import FileColumn, FileTable
+
+# 헤더 1줄 + 행 11줄
+_SIZE = (40, 12)
+_VISIBLE = 11
+
+
+class _TableApp(App):
+    CSS = """
+    FileTable > .file-table--even-row { background: #ff0000; }
+    FileTable > .file-table--odd-row { background: #0000ff; }
+    """
+
+    def __init__(self, state: PanelState, zebra_stripes: bool = True) -> None:
+        super().__init__()
+        self.state = state
+        self.zebra_stripes = zebra_stripes
+        self.rendered: list[str] = []
+        self.headers: list[str] = []
+        self.selected: list[int] = []
+
+    def compose(self) -> ComposeResult:
+        yield FileTable(
+            self.state,
+            columns=[FileColumn("name", "이름"), FileColumn("size", "크기", width=6)],
+            render_cells=self._cells,
+            zebra_stripes=self.zebra_stripes,
+        )
+
+    def _cells(self, item: FileItem) -> tuple[str, ...]:
+        self.rendered.append(item.name)
+        return (item.name, str(item.size))
+
+    def on_file_table_header_selected(self, event: FileTable.HeaderSelected) -> None:
+        self.headers.append(event.column_key)
+
+    def on_file_table_row_selected(self, event: FileTable.RowSelected) -> None:
+        self.selected.append(event.cursor_row)
+
+
+def _state(tmp_path: Path, count: int) -> PanelState:
+    state = PanelState(current_path=tmp_path)
+    state.items = [
+        FileItem(name=f"f{i:06d}", parent=tmp_path, is_dir=False, size=i, mtime_ns=0)
+        for i in range(count)
+    ]
+    return state
+
+
+def _row(name: str) -> int:
+    return int(name[1:])
+
+
+def _run(test) -> None:
+    asyncio.run(test())
+
+
+def test_cursor_keys_scroll_cursor_into_view(tmp_path: Path) -> None:
+    async def test() -> None:
+        app = _TableApp(_state(tmp_path, 1000))
+        async with app.run_test(size=_SIZE) as pilot:
+            table = app.query_one(FileTable)
+            table.focus()
+            expected = [
+                ("down", 1, 0),
+                ("pagedown", 11, 1),
+                ("end", 999, 999 - _VISIBLE + 1),
+                ("up", 998, 999 - _VISIBLE + 1),
+                ("pageup", 988, 988),
+                ("home", 0, 0),
+                ("up", 0, 0),
+            ]
+            for key, row, top in expected:
+                await pilot.press(key)
+                await pilot.pause()
+                assert (key, table.cursor_row, table.scroll_offset.y) == (key, row, top)
+
+    _run(test)
+
+
+def test_renders_only_visible_rows(tmp_path: Path) -> None:
+    async def test() -> None:
+        app = _TableApp(_state(tmp_path, 100_000))
+        async with app.run_test(size=_SIZE) as pilot:
+            table = app.query_one(FileTable)
+            table.focus()
+            await pilot.pause()
+            assert app.rendered
+            assert {_row(name) for name in app.rendered} <= set(range(_VISIBLE))
+
+            app.rendered.clear()
+            await pilot.press("end")
+            await pilot.pause()
+            assert app.rendered
+            assert min(_row(name) for name in app.rendered) >= 100_000 - _VISIBLE
+
+    _run(test)
+
+
+def test_refresh_row_range_limits_to_visible_lines(tmp_path: Path) -> None:
+    async def test() -> None:
+        app = _TableApp(_state(tmp_path, 1000))
+        async with app.run_test(size=_SIZE) as pilot:
+            table = app.query_one(FileTable)
+            await pilot.pause()
+            calls: list[tuple[int, int]] = []
+            table.refresh_lines = lambda start, count=1: calls.append((start, count))
+
+            table.refresh_row_range(5, 500)
+            table.refresh_row_range(50, 60)  # 화면 밖
+            assert calls == [(5 + 1, _VISIBLE - 5)]
+
+            calls.clear()
+            table.scroll_to(y=100, animate=False)
+            await pilot.pause()
+            table.refresh_row_range(0, 101)
+            table.refresh_row_range(105, 103)  # 거꾸로 준 범위는 비어 있음
+            assert calls == [(100 + 1, 2)]
+
+    _run(test)
+
+
+@pytest.mark.parametrize("zebra_stripes", [True, False])
+def test_zebra_stripes(tmp_path: Path, zebra_stripes: bool) -> None:
+    async def test() -> None:
+        app = _TableApp(_state(tmp_path, 10), zebra_stripes=zebra_stripes)
+        async with app.run_test(size=_SIZE) as pilot:
+            table = app.query_one(FileTable)
+            table.move_cursor(row=9)
+            await pilot.pause()
+            # 행 0, 1, 2 는 화면의 1, 2, 3 번째 줄
+            colors = [next(iter(table.render_line(y))).style.bgcolor for y in (1, 2, 3)]
+            if zebra_stripes:
+                assert [c.triplet for c in colors] == [(255, 0, 0), (0, 0, 255), (255, 0, 0)]
+            else:
+                assert colors[0] == colors[1] == colors[2]
+
+    _run(test)
+
+
+def test_clicks_on_header_and_rows(tmp_path: Path) -> None:
+    async def test() -> None:
+        app = _TableApp(_state(tmp_path, 10))
+        async with app.run_test(size=_SIZE) as pilot:
+            await pilot.click(FileTable, offset=(2, 0))
+            await pilot.click(FileTable, offset=(_SIZE[0] - 3, 0))
+            assert app.headers == ["name", "size"]
+
+            table = app.query_one(FileTable)
+            await pilot.click(FileTable, offset=(2, 4))
+            assert table.cursor_row == 3
+            assert app.selected == []
+            await pilot.click(FileTable, offset=(2, 4))
+            assert app.selected == [3]
+
+    _run(test)
+
+
+def test_header_click_sorts_panel(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name, size in (("a.txt", 3), ("b.txt", 1), ("c.txt", 2)):
+        (tmp_path / name).write_bytes(b"x" * size)
+    monkeypatch.chdir(tmp_path)
+
+    async def test() -> None:
+        app = MdirApp()
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause(0.2)
+            table = app.query_one("#table-left", FileTable)
+            state = table._state
+            assert [i.name for i in state.items[1:]] == ["a.txt", "b.txt", "c.txt"]
+
+            # 크기 컬럼: 이름 컬럼(가변) 다음
+            widths = table._column_widths(table.scrollable_content_region.width)
+            size_x = widths[0] + 4
+            await pilot.click(table, offset=(size_x, 0))
+            await pilot.pause()
+            assert state.sort_by == "size"
+            assert [i.name for i in state.items[1:]] == ["b.txt", "c.txt", "a.txt"]
+
+            await pilot.click(table, offset=(size_x, 0))
+            await pilot.pause()
+            assert state.sort_reverse
+            assert [i.name for i in state.items[1:]] == ["a.txt", "c.txt", "b.txt"]
+
+    _run(test)
+
+
+def test_removed_current_path_checked_off_ui_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path.resolve()
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "b" / "f.txt").write_text("")
+    monkeypatch.chdir(root / "a" / "b")
+    real_is_dir = Path.is_dir
+
+    def is_dir(self):
+        assert threading.current_thread() is not threading.main_thread()
+        return real_is_dir(self)
+
+    async def test() -> None:
+        app = MdirApp()
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause(0.2)
+            panel = app.query_one("#left", FilePanel)
+            # 같은 이름으로 다시 만들어졌으면 그 자리에 머문다
+            shutil.rmtree(root / "a" / "b")
+            (root / "a" / "b").mkdir()
+            with patch.object(Path, "is_dir", is_dir):
+                panel.apply_changes(ChangeSet(removed={root / "a" / "b"}))
+                await pilot.pause(0.2)
+            assert panel.current_path == root / "a" / "b"
+            assert [i.name for i in panel.state.items] == [".."]
+
+            shutil.rmtree(root / "a")
+            with patch.object(Path, "is_dir", is_dir):
+                panel.apply_changes(ChangeSet(removed={root / "a"}))
+                await pilot.pause(0.2)
+            assert panel.current_path == root
+
+    _run(test)
@@ -0,0 +1,109 @@
+"""작업 큐 단위 테스트."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from mdir.operations.cancel import CancelToken
+from mdir.operations.exceptions import FileOperationError, OperationCancelledError
+from mdir.operations.jobs import CANCELLED, DONE, FAILED, QUEUED, RUNNING, JobQueue, job_devices
+from mdir.operations.progress import OperationProgress
+
+_TIMEOUT = 5
+
+
+class _Gate:
+    """release() 할 때까지 멈춰 있는 작업 함수."""
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self._release = threading.Event()
+
+    def __call__(self, value: int = 0, progress: OperationProgress | None = None, cancel=None):
+        assert progress is not None
+        self.started.set()
+        while not self._release.wait(0.01):
+            if cancel is not None:
+                cancel.check()
+        return value
+
+    def release(self) -> None:
+        self._release.set()
+
+
+class TestJobQueue:
+    def test_runs_and_returns_result(self) -> None:
+        queue = JobQueue()
+        job = queue.submit("더하기", lambda a, b, progress: a + b, 2, 3)
+        assert job.future.result(_TIMEOUT) == 5
+        assert job.state == DONE
+        assert queue.active() == []
+        assert queue.jobs() == [job]
+
+    def test_per_device_limit_and_order(self) -> None:
+        queue = JobQueue()
+        gates = [_Gate() for _ in range(3)]
+        first = queue.submit("a", gates[0], devices={1: 1})
+        second = queue.submit("b", gates[1], devices={1: 1, 2: 1})
+        # 장치 2 는 비어 있지만 장치 2 를 먼저 기다리는 작업이 있으므로 앞지르지 않는다
+        third = queue.submit("c", gates[2], devices={2: 1})
+        other = queue.submit("d", lambda progress: "other", devices={3: 1})
+        assert other.future.result(_TIMEOUT) == "other"
+        assert gates[0].started.wait(_TIMEOUT)
+        assert (first.state, second.state, third.state) == (RUNNING, QUEUED, QUEUED)
+
+        gates[0].release()
+        assert gates[1].started.wait(_TIMEOUT)
+        assert third.state == QUEUED
+        gates[1].release()
+        gates[2].release()
+        assert third.future.result(_TIMEOUT) == 0
+        assert queue.running_count == queue.queued_count == 0
+
+    def test_cancel_queued_job(self) -> None:
+        queue = JobQueue()
+        gate = _Gate()
+        running = queue.submit("a", gate, devices={1: 1})
+        waiting = queue.submit("b", gate, devices={1: 1})
+        assert queue.cancel(waiting)
+        assert waiting.state == CANCELLED
+        with pytest.raises(OperationCancelledError):
+            waiting.future.result(_TIMEOUT)
+        # 취소 토큰이 없는 실행 중 작업은 취소할 수 없다
+        assert not queue.cancel(running)
+        gate.release()
+        running.future.result(_TIMEOUT)
+
+    def test_cancel_running_job_with_token(self) -> None:
+        queue = JobQueue()
+        gate = _Gate()
+        job = queue.submit("a", gate, cancel=CancelToken())
+        assert gate.started.wait(_TIMEOUT)
+        assert queue.cancel(job)
+        with pytest.raises(OperationCancelledError):
+            job.future.result(_TIMEOUT)
+        assert job.state == CANCELLED
+
+    def test_failure_is_reported(self) -> None:
+        def fail(progress: OperationProgress) -> None:
+            raise FileOperationError("실패")
+
+        queue = JobQueue()
+        job = queue.submit("a", fail, description="x.txt")
+        with pytest.raises(FileOperationError):
+            job.future.result(_TIMEOUT)
+        assert job.state == FAILED
+        assert job.describe() == "[실패] a: 실패 — x.txt"
+
+    def test_finished_history_is_bounded(self) -> None:
+        queue = JobQueue(max_finished=2)
+        for i in range(4):
+            queue.submit(str(i), lambda progress: None).future.result(_TIMEOUT)
+        assert [job.label for job in queue.jobs()] == ["3", "2"]
+
+
+def test_job_devices_override(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MDIR_JOBS_PER_DEVICE", "3")
+    devices = job_devices([tmp_path, tmp_path / "missing"])
+    assert list(devices.values()) == [3]
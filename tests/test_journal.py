@@ -0,0 +1,156 @@
+"""복사 이어하기 저널 단위 테스트."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mdir.models.file_item import FileItem
+from mdir.operations import copy as copy_mod
+from mdir.operations.copy import CopyReport, copy_items
+from mdir.operations.exceptions import DiskFullError
+from mdir.operations.fastcopy import copy_file
+from mdir.operations.journal import CopyJournal, job_key
+
+
+def _tree(root: Path) -> Path:
+    src = root / "src"
+    (src / "sub").mkdir(parents=True)
+    for i in range(6):
+        (src / f"f{i}.txt").write_text(f"file {i}")
+        (src / "sub" / f"g{i}.txt").write_text(f"sub {i}")
+    os.symlink("f0.txt", src / "link")
+    return src
+
+
+class TestCopyJournal:
+    def test_job_key_ignores_order(self, tmp_path: Path) -> None:
+        a, b = tmp_path / "a", tmp_path / "b"
+        assert job_key([a, b], tmp_path) == job_key([b, a], tmp_path)
+        assert job_key([a], tmp_path) != job_key([a], tmp_path / "x")
+
+    def test_records_survive_reopen(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.txt"
+        src.write_text("abc")
+        dest = tmp_path / "out" / "a.txt"
+        dest.parent.mkdir()
+        journal = CopyJournal.open([src], dest.parent, tmp_path / "jobs")
+        assert not journal.resumable
+        journal.record_item(src, dest)
+        copy_file(str(src), str(dest))
+        journal.file_done(str(dest), src.stat())
+        journal.close()
+
+        again = CopyJournal.open([src], dest.parent, tmp_path / "jobs")
+        assert again.resumable
+        assert again.dest_for(src) == dest
+        assert again.is_done(str(dest), src.stat())
+
+    def test_changed_source_is_not_done(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.txt"
+        src.write_text("abc")
+        dest = tmp_path / "b.txt"
+        journal = CopyJournal.open([src], tmp_path, tmp_path / "jobs")
+        copy_file(str(src), str(dest))
+        journal.file_done(str(dest), src.stat())
+        src.write_text("abcd")
+        assert not journal.is_done(str(dest), src.stat())
+
+    def test_truncated_last_line_ignored(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.txt"
+        src.write_text("abc")
+        journal = CopyJournal.open([src], tmp_path, tmp_path / "jobs")
+        journal.record_item(src, tmp_path / "x")
+        journal.close()
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"done": "/x", "si')
+        assert CopyJournal.open([src], tmp_path, tmp_path / "jobs").dest_for(src) == tmp_path / "x"
+
+    def test_complete_removes_file(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.txt"
+        src.write_text("abc")
+        journal = CopyJournal.open([src], tmp_path, tmp_path / "jobs")
+        journal.record_item(src, tmp_path / "x")
+        journal.complete()
+        assert not journal.path.exists()
+
+
+class TestResumableCopy:
+    def test_resume_skips_finished_files_without_duplicates(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        jobs = tmp_path / "jobs"
+        real = copy_mod.copy_file
+        calls = {"n": 0}
+
+        def fail_after_five(s, d, **kwargs):
+            calls["n"] += 1
+            if calls["n"] > 5:
+                raise OSError(28, "No space left on device")
+            return real(s, d, **kwargs)
+
+        items = [FileItem.from_path(src)]
+        journal = CopyJournal.open([src], dst, jobs)
+        with patch("mdir.operations.copy.copy_file", side_effect=fail_after_five), pytest.raises(
+            DiskFullError
+        ):
+            copy_items(items, dst, workers=1, journal=journal)
+        assert journal.path.exists()
+
+        journal = CopyJournal.open([src], dst, jobs)
+        assert journal.resumable
+        report = CopyReport()
+        copied = copy_items(items, dst, workers=2, journal=journal, report=report)
+        assert copied == [dst / "src"]
+        assert sorted(p.name for p in dst.iterdir()) == ["src"]
+        assert report.skipped == 5
+        assert report.files == 7
+        out = dst / "src"
+        assert sorted(p.relative_to(out) for p in out.rglob("*")) == sorted(
+            p.relative_to(src) for p in src.rglob("*")
+        )
+        assert (out / "sub" / "g5.txt").read_text() == "sub 5"
+        assert not journal.path.exists()
+
+    def test_partial_file_continues_from_checkpoint(self, tmp_path: Path) -> None:
+        src = tmp_path / "big.bin"
+        data = os.urandom(5 * 1024 * 1024 + 3)
+        src.write_bytes(data)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        jobs = tmp_path / "jobs"
+        dest = dst / "big.bin"
+        # 앞 2 MiB 는 복사됐고, 그 뒤에 체크포인트 이후 쓰다 만 쓰레기가 있는 상태
+        dest.write_bytes(data[: 2 * 1024 * 1024] + b"garbage")
+        journal = CopyJournal.open([src], dst, jobs)
+        journal.record_item(src, dest)
+        journal.checkpoint(str(dest), src.stat(), 2 * 1024 * 1024)
+        journal.close()
+
+        journal = CopyJournal.open([src], dst, jobs)
+        real = copy_mod.copy_file
+
+        def spy(s, d, **kwargs):
+            assert kwargs["resume_from"] == 2 * 1024 * 1024
+            return real(s, d, **kwargs)
+
+        with patch("mdir.operations.copy.copy_file", side_effect=spy):
+            copy_items([FileItem.from_path(src)], dst, workers=1, journal=journal)
+        assert dest.read_bytes() == data
+        assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    def test_checkpoints_written_for_large_files(self, tmp_path: Path) -> None:
+        src = tmp_path / "big.bin"
+        src.write_bytes(os.urandom(3 * 1024 * 1024))
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        journal = CopyJournal.open([src], dst, tmp_path / "jobs")
+        offsets: list[int] = []
+        journal.checkpoint = lambda dest, st, offset: offsets.append(offset)
+        with patch("mdir.operations.copy.CHECKPOINT_BYTES", 1024 * 1024), patch(
+            "mdir.operations.fastcopy._KERNEL_CHUNK", 1024 * 1024
+        ), patch("mdir.operations.fastcopy.USERSPACE_BUFFER_SIZE", 1024 * 1024):
+            copy_items([FileItem.from_path(src)], dst, workers=1, journal=journal)
+        assert offsets == [1024 * 1024, 2 * 1024 * 1024, 3 * 1024 * 1024]
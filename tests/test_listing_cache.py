@@ -0,0 +1,124 @@
+"""ListingCache 및 PanelState 캐시 연동 단위 테스트."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from mdir.models import listing_cache
+from mdir.models.file_item import FileItem, PanelState
+from mdir.models.listing_cache import ListingCache, dir_signature
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """디렉토리 mtime 을 과거로 돌려 racy 판정을 피함."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _items(path: Path, *names: str) -> list[FileItem]:
+    result = []
+    for name in names:
+        p = path / name
+        p.write_text("")
+        result.append(FileItem.from_path(p))
+    return result
+
+
+class TestListingCache:
+    def test_hit_returns_copies(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a.txt")
+        _age(tmp_path)
+        cache = ListingCache()
+        sig = dir_signature(tmp_path)
+        items[0].is_selected = True
+        cache.put(tmp_path, False, sig, items)
+        cached = cache.get(tmp_path, False, sig)
+        assert cached is not None
+        assert cached[0].name == "a.txt"
+        assert cached[0] is not items[0]
+        assert not cached[0].is_selected
+
+    def test_signature_mismatch_misses(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a.txt")
+        _age(tmp_path)
+        cache = ListingCache()
+        sig = dir_signature(tmp_path)
+        cache.put(tmp_path, False, sig, items)
+        (tmp_path / "b.txt").write_text("")
+        assert cache.get(tmp_path, False, dir_signature(tmp_path)) is None
+        assert len(cache) == 0
+
+    def test_show_hidden_is_part_of_key(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a.txt")
+        _age(tmp_path)
+        cache = ListingCache()
+        sig = dir_signature(tmp_path)
+        cache.put(tmp_path, False, sig, items)
+        assert cache.get(tmp_path, True, sig) is None
+
+    def test_lru_entry_budget(self, tmp_path: Path) -> None:
+        cache = ListingCache(max_entries=2)
+        dirs = []
+        for name in ("a", "b", "c"):
+            d = tmp_path / name
+            d.mkdir()
+            _age(d)
+            dirs.append(d)
+        sigs = [dir_signature(d) for d in dirs]
+        cache.put(dirs[0], False, sigs[0], [])
+        cache.put(dirs[1], False, sigs[1], [])
+        cache.get(dirs[0], False, sigs[0])  # a 를 최근 사용으로
+        cache.put(dirs[2], False, sigs[2], [])
+        assert cache.get(dirs[1], False, sigs[1]) is None
+        assert cache.get(dirs[0], False, sigs[0]) is not None
+
+    def test_byte_budget(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a.txt", "b.txt")
+        _age(tmp_path)
+        cache = ListingCache(max_bytes=listing_cache._ITEM_BYTES_ESTIMATE)
+        cache.put(tmp_path, False, dir_signature(tmp_path), items)
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+    def test_racy_entry_expires(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a.txt")
+        cache = ListingCache()
+        sig = dir_signature(tmp_path)
+        cache.put(tmp_path, False, sig, items)  # 방금 수정된 디렉토리 → racy
+        assert cache.get(tmp_path, False, sig) is not None
+        with patch.object(listing_cache.time, "monotonic", return_value=1e12):
+            assert cache.get(tmp_path, False, sig) is None
+
+
+class TestPanelStateCache:
+    def test_enter_directory_reuses_listing(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("")
+        _age(tmp_path)
+        cache = ListingCache()
+        state = PanelState(current_path=tmp_path, cache=cache)
+        state.enter_directory(tmp_path)
+        with patch("mdir.models.file_item.os.scandir", side_effect=AssertionError("rescan")):
+            state.enter_directory(tmp_path)
+        assert [i.name for i in state.items] == ["..", "a.txt"]
+        assert cache.hits == 1
+
+    def test_shared_between_panels(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("")
+        _age(tmp_path)
+        cache = ListingCache()
+        left = PanelState(current_path=tmp_path, cache=cache)
+        right = PanelState(current_path=tmp_path, cache=cache)
+        left.enter_directory(tmp_path)
+        right.enter_directory(tmp_path)
+        assert cache.hits == 1
+        left.toggle_selection(left.items[1])
+        assert not right.items[1].is_selected
+
+    def test_refresh_bypasses_cache(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("")
+        _age(tmp_path)
+        cache = ListingCache()
+        state = PanelState(current_path=tmp_path, cache=cache)
+        state.enter_directory(tmp_path)
+        state.refresh()
+        assert cache.hits == 0
@@ -1,14 +1,27 @@
 """파일 작업 단위 테스트."""
 
+import os
+import threading
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import mock_open, patch
 
 import pytest
 
+from mdir.models.changes import ChangeSet
 from mdir.models.file_item import FileItem
-from mdir.operations.copy import copy_items, resolve_conflict
+from mdir.operations import copy as copy_mod
+from mdir.operations import move as move_mod
+from mdir.operations.copy import (
+    ConflictResolver,
+    CopyEngine,
+    CopyReport,
+    copy_items,
+    create_empty_file,
+    resolve_conflict,
+)
 from mdir.operations.delete import delete_items, make_directory, rename_item
-from mdir.operations.exceptions import FileOperationError, PermissionDeniedError
+from mdir.operations.device import WORKERS_ENV, _find_mount, default_workers
+from mdir.operations.exceptions import DiskFullError, FileOperationError, PermissionDeniedError
 from mdir.operations.move import move_items
 
 
@@ -68,6 +81,238 @@ class TestCopyItems:
         assert copied[0].name == "file_copy.txt"
 
 
+class TestConflictResolver:
+    def test_same_names_as_resolve_conflict(self, tmp_path: Path) -> None:
+        for name in ("file.txt", "file_copy.txt", "file_copy2.txt", "dir"):
+            (tmp_path / name).write_text("")
+        resolver = ConflictResolver(tmp_path)
+        assert resolver.resolve("file.txt") == resolve_conflict(tmp_path / "file.txt")
+        assert resolver.resolve("dir") == tmp_path / "dir_copy"
+        assert resolver.resolve("new.txt") == tmp_path / "new.txt"
+
+    def test_reads_directory_once(self, tmp_path: Path) -> None:
+        for i in range(50):
+            (tmp_path / f"f{i}.txt").write_text("")
+        resolver = ConflictResolver(tmp_path)
+        with patch("os.scandir", wraps=os.scandir) as scandir, patch.object(
+            Path, "exists", side_effect=AssertionError("stat 호출")
+        ):
+            names = [resolver.resolve(f"f{i}.txt").name for i in range(50)]
+        assert scandir.call_count == 1
+        assert names == [f"f{i}_copy.txt" for i in range(50)]
+
+    def test_reservations_do_not_collide(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("")
+        resolver = ConflictResolver(tmp_path)
+        picked = [resolver.resolve("a.txt").name for _ in range(3)]
+        assert picked == ["a_copy.txt", "a_copy2.txt", "a_copy3.txt"]
+
+    def test_release(self, tmp_path: Path) -> None:
+        resolver = ConflictResolver(tmp_path)
+        dest = resolver.resolve("a.txt")
+        resolver.release(dest)
+        assert resolver.resolve("a.txt") == dest
+
+    def test_create_unique_skips_names_taken_after_snapshot(self, tmp_path: Path) -> None:
+        resolver = ConflictResolver(tmp_path)
+        resolver.resolve("other")  # 목록을 읽어 둔다
+        # 목록을 읽은 뒤 다른 프로그램이 만든 파일 (VULN-03)
+        (tmp_path / "a.txt").write_text("keep")
+        dest = resolver.create_unique("a.txt", create_empty_file)
+        assert dest == tmp_path / "a_copy.txt"
+        assert (tmp_path / "a.txt").read_text() == "keep"
+
+    def test_copy_many_into_crowded_directory(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        dst = tmp_path / "dst"
+        src.mkdir()
+        dst.mkdir()
+        items = []
+        for i in range(20):
+            (src / f"f{i}.txt").write_text(str(i))
+            (dst / f"f{i}.txt").write_text("old")
+            items.append(FileItem.from_path(src / f"f{i}.txt"))
+        copied = copy_items(items, dst, workers=2)
+        assert [p.name for p in copied] == [f"f{i}_copy.txt" for i in range(20)]
+        assert (dst / "f7.txt").read_text() == "old"
+        assert (dst / "f7_copy.txt").read_text() == "7"
+
+
+class TestCopyEngine:
+    """병렬 트리 복사 (CopyEngine)."""
+
+    def _tree(self, root: Path) -> Path:
+        src = root / "src"
+        for d in ("a", "a/b", "c"):
+            (src / d).mkdir(parents=True)
+        for i, d in enumerate(("", "a", "a/b", "c")):
+            for j in range(5):
+                (src / d / f"f{i}{j}.txt").write_text(f"{d}-{j}")
+        os.symlink("a/f10.txt", src / "link")
+        os.symlink("/outside", src / "a" / "abs_link")
+        os.utime(src / "a", ns=(1_000_000_000, 1_000_000_000))
+        return src
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_copy_tree(self, tmp_path: Path, workers: int) -> None:
+        src = self._tree(tmp_path)
+        (tmp_path / "dst").mkdir()
+        copy_items([FileItem.from_path(src)], tmp_path / "dst", workers=workers)
+        out = tmp_path / "dst" / "src"
+        src_files = sorted(p.relative_to(src) for p in src.rglob("*"))
+        assert sorted(p.relative_to(out) for p in out.rglob("*")) == src_files
+        assert (out / "a" / "b" / "f24.txt").read_text() == "a/b-4"
+        # 심링크는 따라가지 않고 링크 그대로 (VULN-02)
+        assert os.readlink(out / "link") == "a/f10.txt"
+        assert os.readlink(out / "a" / "abs_link") == "/outside"
+        # 디렉토리 메타데이터는 내용 복사 후 적용
+        assert (out / "a").stat().st_mtime_ns == 1_000_000_000
+
+    def test_report_counts_methods(self, tmp_path: Path) -> None:
+        src = self._tree(tmp_path)
+        (tmp_path / "dst").mkdir()
+        report = CopyReport()
+        copy_items([FileItem.from_path(src)], tmp_path / "dst", workers=2, report=report)
+        assert report.files == 20
+        assert sum(report.methods.values()) == 20
+        assert report.summary()
+
+    def test_file_metadata_preserved(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.txt"
+        f.write_text("x")
+        os.utime(f, ns=(2_000_000_000, 2_000_000_000))
+        (tmp_path / "dst").mkdir()
+        copy_items([FileItem.from_path(f)], tmp_path / "dst", workers=2)
+        assert (tmp_path / "dst" / "a.txt").stat().st_mtime_ns == 2_000_000_000
+
+    def test_failure_mid_batch_leaves_only_finished_copies(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        (src / "d" / "sub").mkdir(parents=True)
+        (src / "d" / "sub" / "x.txt").write_text("x")
+        for name in "abce":
+            (src / f"{name}.txt").write_text(name * 10)
+        (tmp_path / "dst").mkdir()
+        real_copy = copy_mod.copy_file
+
+        def fail_on_b(s, d, **kwargs):
+            if s.endswith("b.txt"):
+                Path(d).write_text("half")
+                raise OSError(5, "I/O error")
+            return real_copy(s, d, **kwargs)
+
+        names = ["a.txt", "b.txt", "c.txt", "d", "e.txt"]
+        items = [FileItem.from_path(src / n) for n in names]
+        report = CopyReport()
+        with patch("mdir.operations.copy.copy_file", side_effect=fail_on_b), pytest.raises(
+            FileOperationError
+        ):
+            copy_items(items, tmp_path / "dst", report=report, workers=1)
+        assert [p.name for p in (tmp_path / "dst").iterdir()] == ["a.txt"]
+        assert (tmp_path / "dst" / "a.txt").read_text() == "a" * 10
+        assert report.discarded == 1
+
+    def test_failure_in_tree_removes_empty_directories(self, tmp_path: Path) -> None:
+        src = tmp_path / "tree"
+        (src / "one").mkdir(parents=True)
+        (src / "two" / "deep").mkdir(parents=True)
+        (src / "one" / "ok.txt").write_text("ok")
+        (src / "two" / "deep" / "bad.txt").write_text("bad")
+        (tmp_path / "dst").mkdir()
+        real_copy = copy_mod.copy_file
+
+        def fail_on_bad(s, d, **kwargs):
+            if s.endswith("bad.txt"):
+                raise OSError(5, "I/O error")
+            return real_copy(s, d, **kwargs)
+
+        with patch("mdir.operations.copy.copy_file", side_effect=fail_on_bad), pytest.raises(
+            FileOperationError
+        ):
+            copy_items([FileItem.from_path(src)], tmp_path / "dst", workers=1)
+        left = sorted(str(p.relative_to(tmp_path / "dst")) for p in (tmp_path / "dst").rglob("*"))
+        assert left == ["tree", "tree/one", "tree/one/ok.txt"]
+
+    def test_worker_failure_stops_and_raises(self, tmp_path: Path) -> None:
+        src = self._tree(tmp_path)
+        (tmp_path / "dst").mkdir()
+        changes = ChangeSet()
+        with patch(
+            "mdir.operations.copy.copy_file", side_effect=OSError(5, "I/O error")
+        ), pytest.raises(FileOperationError, match="복사 실패"):
+            copy_items([FileItem.from_path(src)], tmp_path / "dst", changes=changes, workers=3)
+        assert not changes.trusted
+
+    def test_fifo_in_tree_fails_instead_of_hanging(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        os.mkfifo(src / "pipe")
+        (tmp_path / "dst").mkdir()
+        errors: list[Exception] = []
+
+        def run() -> None:
+            try:
+                copy_items([FileItem.from_path(src)], tmp_path / "dst", workers=2)
+            except FileOperationError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert len(errors) == 1
+
+    def test_disk_full(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.txt"
+        f.write_text("x")
+        (tmp_path / "dst").mkdir()
+        with patch(
+            "mdir.operations.copy.copy_file", side_effect=OSError(28, "No space")
+        ), pytest.raises(DiskFullError):
+            copy_items([FileItem.from_path(f)], tmp_path / "dst", workers=2)
+
+    def test_bounded_queue(self, tmp_path: Path) -> None:
+        """대기열이 작업 스레드 수에 비례하는 크기로 제한된다."""
+        src = tmp_path / "src"
+        src.mkdir()
+        for i in range(200):
+            (src / f"f{i}").write_text("")
+        engine = CopyEngine(2)
+        peak = 0
+        original = engine._slots.acquire
+
+        def acquire(*args, **kwargs):
+            nonlocal peak
+            result = original(*args, **kwargs)
+            peak = max(peak, 8 - engine._slots._value)
+            return result
+
+        engine._slots.acquire = acquire
+        try:
+            engine.copy_tree(str(src), str(tmp_path / "out"))
+            engine.finish()
+        finally:
+            engine.close()
+        assert len(list((tmp_path / "out").iterdir())) == 200
+        assert peak <= 8
+
+    def test_default_workers_env_override(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setenv(WORKERS_ENV, "3")
+        assert default_workers(tmp_path) == 3
+        monkeypatch.delenv(WORKERS_ENV)
+        assert default_workers(tmp_path) >= 1
+
+    def test_find_mount_decodes_octal_escapes_only(self) -> None:
+        mounts = (
+            "/dev/sda1 / ext4 rw 0 0\n"
+            "/dev/sdb1 /media/백업\\040디스크 vfat rw 0 0\n"
+            "server:/x /media/백업 nfs4 rw 0 0\n"
+        )
+        with patch("mdir.operations.device.open", mock_open(read_data=mounts), create=True):
+            assert _find_mount(Path("/media/백업 디스크/a")) == ("vfat", "/media/백업 디스크")
+            assert _find_mount(Path("/media/백업/a")) == ("nfs4", "/media/백업")
+            assert _find_mount(Path("/home")) == ("ext4", "/")
+
+
 class TestMoveItems:
     def test_move_file(self, tmp_path: Path) -> None:
         src = tmp_path / "src"
@@ -81,6 +326,140 @@ class TestMoveItems:
         assert not f.exists()
         assert (dst / "move_me.txt").exists()
 
+    def _tree(self, root: Path) -> Path:
+        src = root / "src" / "tree"
+        (src / "sub").mkdir(parents=True)
+        for i in range(4):
+            (src / f"f{i}.txt").write_text(f"file {i}")
+            (src / "sub" / f"g{i}.txt").write_text(f"sub {i}")
+        os.symlink("f0.txt", src / "link")
+        return src
+
+    def test_same_device_uses_rename(self, tmp_path: Path) -> None:
+        tree = self._tree(tmp_path)
+        (tmp_path / "dst").mkdir()
+        with patch("mdir.operations.copy.copy_file") as copy_mock:
+            move_items([FileItem.from_path(tree)], tmp_path / "dst")
+        copy_mock.assert_not_called()
+        assert (tmp_path / "dst" / "tree" / "sub" / "g3.txt").read_text() == "sub 3"
+
+    @pytest.mark.parametrize("renameat2", [True, False])
+    def test_same_device_does_not_replace_racing_entry(
+        self, tmp_path: Path, renameat2: bool
+    ) -> None:
+        """이름을 고른 뒤 다른 프로그램이 같은 이름을 만들면 덮어쓰지 않고 다음 후보로."""
+        tree = self._tree(tmp_path)
+        f = tmp_path / "a.txt"
+        f.write_text("mine")
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        real = ConflictResolver.resolve
+
+        def racing_resolve(self, name):
+            dest = real(self, name)
+            if not dest.name.startswith(Path(name).stem + "_copy"):
+                if name == "tree":
+                    dest.mkdir()
+                else:
+                    dest.write_text("theirs")
+            return dest
+
+        changes = ChangeSet()
+        native = move_mod._renameat2 if renameat2 else None
+        with patch.object(ConflictResolver, "resolve", racing_resolve), patch.object(
+            move_mod, "_renameat2", native
+        ):
+            moved = move_items(
+                [FileItem.from_path(tree), FileItem.from_path(f)], dst, changes=changes
+            )
+        assert moved == [dst / "tree_copy", dst / "a_copy.txt"]
+        assert (dst / "a.txt").read_text() == "theirs"
+        assert list((dst / "tree").iterdir()) == []
+        assert (dst / "a_copy.txt").read_text() == "mine"
+        assert (dst / "tree_copy" / "sub" / "g3.txt").read_text() == "sub 3"
+        assert not f.exists() and not tree.exists()
+
+    def test_cross_device_deletes_each_source_after_copy(self, tmp_path: Path) -> None:
+        tree = self._tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        real = copy_mod.copy_file
+        pending: list[int] = []
+
+        def spy(src, dest, **kwargs):
+            # 앞서 복사한 파일의 원본은 이미 지워져 있어야 한다
+            pending.append(sum(1 for p in tree.rglob("*.txt")))
+            return real(src, dest, **kwargs)
+
+        exdev = OSError(18, "Invalid cross-device link")
+        changes = ChangeSet()
+        with patch("mdir.operations.move._rename_no_replace", side_effect=exdev), patch(
+            "mdir.operations.copy.copy_file", side_effect=spy
+        ):
+            moved = move_items([FileItem.from_path(tree)], dst, changes=changes, workers=1)
+        assert moved == [dst / "tree"]
+        assert pending == list(range(8, 0, -1))
+        assert not tree.exists()
+        assert os.readlink(dst / "tree" / "link") == "f0.txt"
+        assert (dst / "tree" / "sub" / "g0.txt").read_text() == "sub 0"
+        assert changes.renamed == {tree: dst / "tree"}
+        assert changes.trusted
+
+    def test_cross_device_failure_stops_before_later_items(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        for name in "abcd":
+            (src / f"{name}.txt").write_text(name * 10)
+        (src / "dir").mkdir()
+        os.symlink("a.txt", src / "z_link")
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        real = copy_mod.copy_file
+
+        def fail_on_b(s, d, **kwargs):
+            if s.endswith("b.txt"):
+                raise OSError(5, "I/O error")
+            return real(s, d, **kwargs)
+
+        names = ["a.txt", "b.txt", "c.txt", "dir", "d.txt", "z_link"]
+        items = [FileItem.from_path(src / n) for n in names]
+        changes = ChangeSet()
+        with patch(
+            "mdir.operations.move._rename_no_replace", side_effect=OSError(18, "EXDEV")
+        ), patch(
+            "mdir.operations.copy.copy_file", side_effect=fail_on_b
+        ), pytest.raises(FileOperationError):
+            move_items(items, dst, changes=changes, workers=1)
+        assert [p.name for p in dst.iterdir()] == ["a.txt"]
+        assert sorted(p.name for p in src.iterdir()) == sorted(names[1:])
+        assert set(changes.renamed) <= {src / "a.txt", src / "b.txt"}
+        assert not changes.trusted
+
+    def test_cross_device_keeps_source_on_size_mismatch(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.txt"
+        f.write_text("0123456789")
+        (tmp_path / "dst").mkdir()
+
+        def short_copy(src, dest, **kwargs):
+            Path(dest).write_text("01234")
+            return "userspace"
+
+        changes = ChangeSet()
+        with patch(
+            "mdir.operations.move._rename_no_replace", side_effect=OSError(18, "EXDEV")
+        ), patch(
+            "mdir.operations.copy.copy_file", side_effect=short_copy
+        ), pytest.raises(FileOperationError):
+            move_items([FileItem.from_path(f)], tmp_path / "dst", changes=changes)
+        assert f.read_text() == "0123456789"
+        assert not changes.trusted
+
+    def test_move_into_itself_rejected(self, tmp_path: Path) -> None:
+        tree = self._tree(tmp_path)
+        with pytest.raises(FileOperationError):
+            move_items([FileItem.from_path(tree)], tree / "sub")
+        assert (tree / "sub" / "g0.txt").exists()
+
 
 class TestDeleteItems:
     def test_delete_calls_send2trash(self, tmp_path: Path) -> None:
@@ -140,6 +519,54 @@ class TestMakeDirectory:
             make_directory(tmp_path, "existing")
 
 
+class TestChangeRecording:
+    """파일 작업이 패널 갱신용 변경 집합을 기록하는지."""
+
+    def test_copy_records_added(self, tmp_path: Path) -> None:
+        (tmp_path / "dst").mkdir()
+        f = tmp_path / "a.txt"
+        f.write_text("")
+        changes = ChangeSet()
+        copy_items([FileItem.from_path(f)], tmp_path / "dst", changes=changes)
+        assert changes.added == {tmp_path / "dst" / "a.txt"}
+        assert changes.trusted
+
+    def test_move_records_rename(self, tmp_path: Path) -> None:
+        (tmp_path / "dst").mkdir()
+        f = tmp_path / "a.txt"
+        f.write_text("")
+        changes = ChangeSet()
+        move_items([FileItem.from_path(f)], tmp_path / "dst", changes=changes)
+        assert changes.renamed == {f: tmp_path / "dst" / "a.txt"}
+
+    def test_delete_records_removed(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.txt"
+        f.write_text("")
+        changes = ChangeSet()
+        with patch("mdir.operations.delete.send2trash"):
+            delete_items([FileItem.from_path(f)], changes=changes)
+        assert changes.removed == {f}
+
+    def test_partial_failure_untrusted(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.txt"
+        f.write_text("")
+        changes = ChangeSet()
+        with patch(
+            "mdir.operations.delete.send2trash", side_effect=Exception("fail")
+        ), pytest.raises(FileOperationError):
+            delete_items([FileItem.from_path(f)], changes=changes)
+        assert not changes.trusted
+
+    def test_rename_and_mkdir(self, tmp_path: Path) -> None:
+        f = tmp_path / "old.txt"
+        f.write_text("")
+        changes = ChangeSet()
+        rename_item(FileItem.from_path(f), "new.txt", changes)
+        make_directory(tmp_path, "sub", changes)
+        assert changes.renamed == {f: tmp_path / "new.txt"}
+        assert changes.added == {tmp_path / "sub"}
+
+
 # ── 보안 테스트 (VULN-01, VULN-07) ──────────────────────────────────
 
 class TestSecurityPathTraversal:
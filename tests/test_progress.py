@@ -0,0 +1,131 @@
+"""작업 진행 상황 모델 단위 테스트."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mdir.models.file_item import FileItem
+from mdir.operations.copy import copy_items
+from mdir.operations.move import move_items
+from mdir.operations.progress import OperationProgress, format_duration
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestOperationProgress:
+    def test_scanning_has_no_eta(self) -> None:
+        progress = OperationProgress("복사", clock=FakeClock())
+        progress.add_total(3, 3000)
+        snap = progress.snapshot()
+        assert snap.scanning
+        assert snap.eta is None
+        assert "준비 중" in snap.describe()
+
+    def test_rate_and_eta(self) -> None:
+        clock = FakeClock()
+        progress = OperationProgress("복사", clock=clock)
+        progress.add_total(2, 1000)
+        progress.finish_scan()
+        clock.now = 1.0
+        progress.advance(100)
+        snap = progress.snapshot()
+        assert snap.rate == pytest.approx(100.0)
+        assert snap.eta == pytest.approx(9.0)
+        assert snap.fraction == pytest.approx(0.1)
+
+    def test_rate_is_moving_average(self) -> None:
+        clock = FakeClock()
+        progress = OperationProgress(clock=clock, rate_window=3.0)
+        progress.add_total(1, 10_000)
+        progress.finish_scan()
+        clock.now = 1.0
+        progress.advance(100)
+        progress.snapshot()
+        # 갑자기 10배 빨라져도 평균은 천천히 따라간다
+        clock.now = 2.0
+        progress.advance(1000)
+        rate = progress.snapshot().rate
+        assert 100 < rate < 1000
+
+    def test_short_samples_ignored(self) -> None:
+        clock = FakeClock()
+        progress = OperationProgress(clock=clock)
+        progress.add_total(1, 1000)
+        progress.finish_scan()
+        clock.now = 0.01
+        progress.advance(500)
+        assert progress.snapshot().rate == 0.0
+
+    def test_describe(self) -> None:
+        clock = FakeClock()
+        progress = OperationProgress("이동", clock=clock)
+        progress.add_total(4, 4096)
+        progress.finish_scan()
+        clock.now = 2.0
+        progress.advance(2048)
+        progress.file_done(2)
+        text = progress.snapshot().describe()
+        assert text.startswith("이동 2.0K/4.0K (50%)")
+        assert "2/4개" in text
+        assert "남은 시간 0:02" in text
+
+    def test_format_duration(self) -> None:
+        assert format_duration(5) == "0:05"
+        assert format_duration(3725) == "1:02:05"
+
+
+class TestOperationsReportProgress:
+    def _tree(self, root: Path) -> Path:
+        src = root / "src"
+        (src / "sub").mkdir(parents=True)
+        (src / "a.bin").write_bytes(b"a" * 5000)
+        (src / "sub" / "b.bin").write_bytes(b"b" * 7000)
+        (src / "sub" / "empty").write_bytes(b"")
+        return src
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_copy_counts_bytes_and_files(self, tmp_path: Path, workers: int) -> None:
+        src = self._tree(tmp_path)
+        single = tmp_path / "single.txt"
+        single.write_bytes(b"x" * 10)
+        (tmp_path / "dst").mkdir()
+        progress = OperationProgress("복사")
+        copy_items(
+            [FileItem.from_path(src), FileItem.from_path(single)],
+            tmp_path / "dst",
+            workers=workers,
+            progress=progress,
+        )
+        snap = progress.snapshot()
+        assert not snap.scanning
+        assert (snap.files_done, snap.files_total) == (4, 4)
+        assert snap.bytes_done == snap.bytes_total == 12_010
+        assert snap.fraction == 1.0
+
+    def test_move_same_device_counts_items(self, tmp_path: Path) -> None:
+        src = self._tree(tmp_path)
+        (tmp_path / "dst").mkdir()
+        progress = OperationProgress("이동")
+        move_items([FileItem.from_path(src)], tmp_path / "dst", progress=progress)
+        snap = progress.snapshot()
+        assert (snap.files_done, snap.files_total) == (1, 1)
+
+    def test_move_across_devices_counts_bytes(self, tmp_path: Path) -> None:
+        shm = Path("/dev/shm")
+        if not shm.is_dir() or shm.stat().st_dev == tmp_path.stat().st_dev:
+            pytest.skip("다른 장치의 쓰기 가능한 디렉토리 없음")
+        src = self._tree(tmp_path)
+        with tempfile.TemporaryDirectory(dir=shm) as dest:
+            progress = OperationProgress("이동")
+            move_items([FileItem.from_path(src)], Path(dest), progress=progress)
+            snap = progress.snapshot()
+        assert (snap.files_done, snap.files_total) == (3, 3)
+        assert snap.bytes_done == snap.bytes_total == 12_000
+        assert not src.exists()
@@ -0,0 +1,131 @@
+"""영구 삭제(TreeRemover / purge_items) 단위 테스트."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mdir.models.changes import ChangeSet
+from mdir.models.file_item import FileItem
+from mdir.operations.cancel import CancelToken
+from mdir.operations.delete import purge_items
+from mdir.operations.exceptions import FileOperationError, OperationCancelledError
+from mdir.operations.progress import OperationProgress
+from mdir.operations.remove import TreeRemover, count_entries
+
+
+def _tree(root: Path, dirs: int = 6, files: int = 5) -> Path:
+    top = root / "top"
+    for d in range(dirs):
+        sub = top / f"d{d % 3}" / f"e{d}"
+        sub.mkdir(parents=True)
+        for f in range(files):
+            (sub / f"f{f}.txt").write_text("x")
+    return top
+
+
+class TestTreeRemover:
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_removes_tree(self, tmp_path: Path, workers: int) -> None:
+        top = _tree(tmp_path)
+        progress = OperationProgress()
+        TreeRemover(workers, progress).remove(top)
+        assert not top.exists()
+        # 파일 30 + e* 6 + d* 3 + top 1
+        assert progress.files_done == 40
+
+    def test_symlinks_not_followed(self, tmp_path: Path) -> None:
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        top = _tree(tmp_path)
+        os.symlink(outside, top / "dirlink")
+        os.symlink(outside / "keep.txt", top / "d0" / "filelink")
+        TreeRemover(2).remove(top)
+        assert not top.exists()
+        assert (outside / "keep.txt").read_text() == "keep"
+
+    def test_top_level_symlink_removes_link_only(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path)
+        link = tmp_path / "link"
+        os.symlink(top, link)
+        TreeRemover(2).remove(link)
+        assert not os.path.lexists(link)
+        assert (top / "d0" / "e0" / "f0.txt").exists()
+
+    def test_uses_directory_relative_calls(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path, dirs=2, files=2)
+        real_unlink = os.unlink
+        calls = []
+
+        def spy(path, *, dir_fd=None):
+            calls.append((path, dir_fd))
+            return real_unlink(path, dir_fd=dir_fd)
+
+        with patch("os.unlink", side_effect=spy):
+            TreeRemover(1).remove(top)
+        assert calls and all(fd is not None and "/" not in name for name, fd in calls)
+
+    def test_cancel_stops_and_closes_fds(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path, dirs=6, files=20)
+        token = CancelToken()
+        real_unlink = os.unlink
+        count = {"n": 0}
+
+        def cancelling(path, *, dir_fd=None):
+            count["n"] += 1
+            if count["n"] == 10:
+                token.cancel()
+            return real_unlink(path, dir_fd=dir_fd)
+
+        before = len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else None
+        with patch("os.unlink", side_effect=cancelling), pytest.raises(OperationCancelledError):
+            TreeRemover(1, cancel=token).remove(top)
+        assert top.exists()
+        assert count["n"] < 120
+        if before is not None:
+            assert len(os.listdir("/proc/self/fd")) == before
+
+    def test_error_propagates(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path, dirs=2, files=2)
+        with patch("os.unlink", side_effect=PermissionError(13, "denied")), pytest.raises(
+            PermissionError
+        ):
+            TreeRemover(2).remove(top)
+
+    def test_count_entries(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path)
+        assert count_entries(top) == 40
+
+
+class TestPurgeItems:
+    def test_purge_records_changes(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path)
+        f = tmp_path / "single.txt"
+        f.write_text("x")
+        changes = ChangeSet()
+        progress = OperationProgress("삭제")
+        purge_items([FileItem.from_path(top), FileItem.from_path(f)], changes, progress, workers=2)
+        assert not top.exists() and not f.exists()
+        assert changes.removed == {top, f}
+        assert changes.trusted
+        snap = progress.snapshot()
+        assert snap.files_done == snap.files_total == 41
+
+    def test_purge_cancelled_marks_untrusted(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path)
+        token = CancelToken()
+        token.cancel()
+        changes = ChangeSet()
+        with pytest.raises(OperationCancelledError):
+            purge_items([FileItem.from_path(top)], changes, cancel=token)
+        assert top.exists()
+        assert not changes.trusted
+
+    def test_purge_error_wrapped(self, tmp_path: Path) -> None:
+        top = _tree(tmp_path, dirs=1, files=1)
+        changes = ChangeSet()
+        with patch("os.rmdir", side_effect=OSError(16, "busy")), pytest.raises(FileOperationError):
+            purge_items([FileItem.from_path(top)], changes, workers=1)
+        assert not changes.trusted
@@ -0,0 +1,176 @@
+"""일괄 이름 변경 단위 테스트."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mdir.models.changes import ChangeSet
+from mdir.models.file_item import FileItem, PanelState, sort_items
+from mdir.operations.cancel import CancelToken
+from mdir.operations.exceptions import FileOperationError, OperationCancelledError
+from mdir.operations.progress import OperationProgress
+from mdir.operations.rename import RenameRule, plan_renames, rename_batch
+
+_MTIME_NS = 1_700_000_000_000_000_000  # 2023-11-14 (UTC)
+
+
+def _items(root: Path, *names: str) -> list[FileItem]:
+    for name in names:
+        (root / name).write_text(name)
+    return [FileItem.from_path(root / name) for name in names]
+
+
+def _listing(root: Path) -> dict[str, str]:
+    return {p.name: p.read_text() for p in root.iterdir()}
+
+
+class TestPlan:
+    def test_template_counter_and_regex(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "IMG_0001.JPG", "IMG_0002.JPG", "notes")
+        rule = RenameRule(
+            template="trip_{n:03}_{name}{ext}", find=r"IMG_(\d+)\.JPG$", replace=r"\1.jpg"
+        )
+        plan = plan_renames(items, rule)
+        assert [e.new_name for e in plan.entries] == [
+            "trip_001_0001.jpg",
+            "trip_002_0002.jpg",
+            "trip_003_notes",
+        ]
+        assert plan.problems == []
+
+    def test_mtime_and_folder_names(self, tmp_path: Path) -> None:
+        (tmp_path / "dir.d").mkdir()
+        os.utime(tmp_path / "dir.d", ns=(_MTIME_NS, _MTIME_NS))
+        item = FileItem.from_path(tmp_path / "dir.d")
+        plan = plan_renames([item], RenameRule(template="{mtime:%Y}_{name}{ext}"))
+        # 폴더는 확장자를 나누지 않는다
+        assert plan.entries[0].new_name == "2023_dir.d"
+
+    def test_invalid_template_and_regex(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a.txt")
+        with pytest.raises(FileOperationError):
+            plan_renames(items, RenameRule(template="{name.__class__}"))
+        with pytest.raises(FileOperationError):
+            plan_renames(items, RenameRule(template="{size}"))
+        with pytest.raises(FileOperationError):
+            plan_renames(items, RenameRule(find="("))
+
+    def test_problems_are_found_in_memory(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a.txt", "b.txt")
+        (tmp_path / "keep.log").write_text("keep")
+        plan = plan_renames(items, RenameRule(find=r"\.txt$", replace="/"))
+        assert all("사용할 수 없는 문자" in e.problem for e in plan.entries)
+
+        plan = plan_renames(items, RenameRule(template="same{ext}"))
+        assert all("이름 중복" in e.problem for e in plan.entries)
+
+        plan = plan_renames(items[:1], RenameRule(template="keep.log"))
+        assert "이미 존재" in plan.entries[0].problem
+        assert plan.summary() == "이름 변경 0개 · 그대로 0개 · 문제 1개 (건너뜀)"
+
+    def test_blocked_item_blocks_its_chain(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "1", "2", "3")
+        (tmp_path / "4").write_text("other")
+        # 1→2→3→4 인데 4 가 이미 있으므로 3 은 막히고, 3 을 비워야 하는 2, 1 도 막힌다
+        plan = plan_renames(items, RenameRule(template="{n}", start=2))
+        assert "이미 존재" in plan.entries[2].problem
+        assert all(e.problem for e in plan.entries)
+        assert plan.renames == []
+
+
+class TestSteps:
+    def test_chain_runs_from_the_free_end(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "1", "2", "3")
+        plan = plan_renames(items, RenameRule(template="{n}", start=2))
+        assert plan.steps() == [("3", "4"), ("2", "3"), ("1", "2")]
+
+    def test_cycle_uses_a_temporary_name(self, tmp_path: Path) -> None:
+        by_name = {item.name: item for item in _items(tmp_path, "1", "2", "3")}
+        # 3→1, 1→2, 2→3 순환
+        plan = plan_renames([by_name[n] for n in ("3", "1", "2")], RenameRule(template="{n}"))
+        assert plan.problems == []
+        steps = plan.steps()
+        assert len(steps) == 4
+        assert steps[0] == ("3", ".mdir-rename-0")
+        assert steps[-1] == (".mdir-rename-0", "1")
+
+
+class TestRenameBatch:
+    def test_swap_and_chain_on_disk(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "1", "2", "3")
+        plan = plan_renames(items, RenameRule(template="{n}", start=2))
+        changes = ChangeSet()
+        assert rename_batch(plan, changes) == 3
+        assert _listing(tmp_path) == {"2": "1", "3": "2", "4": "3"}
+        assert changes.renamed[tmp_path / "1"] == tmp_path / "2"
+
+        # 목록 순서를 바꿔 순번을 매기면 2↔3 맞바꾸기
+        items = [FileItem.from_path(tmp_path / name) for name in ("3", "2")]
+        assert rename_batch(plan_renames(items, RenameRule(template="{n}", start=2))) == 2
+        assert _listing(tmp_path) == {"3": "1", "2": "2", "4": "3"}
+
+    def test_failure_rolls_back(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a.txt", "b.txt", "c.txt")
+        plan = plan_renames(items, RenameRule(template="{n}_{name}{ext}"))
+        real_rename = os.rename
+        calls = []
+
+        def flaky(src, dst):
+            calls.append(src)
+            if len(calls) == 3:
+                raise PermissionError(13, "denied")
+            real_rename(src, dst)
+
+        changes = ChangeSet()
+        with patch("mdir.operations.rename.os.rename", side_effect=flaky), pytest.raises(
+            FileOperationError, match="되돌렸습니다"
+        ):
+            rename_batch(plan, changes)
+        assert sorted(_listing(tmp_path)) == ["a.txt", "b.txt", "c.txt"]
+        assert not changes.renamed
+        assert changes.trusted
+
+    def test_target_created_meanwhile_is_not_overwritten(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a.txt")
+        plan = plan_renames(items, RenameRule(template="new{ext}"))
+        (tmp_path / "new.txt").write_text("someone else")
+        with pytest.raises(FileOperationError):
+            rename_batch(plan)
+        assert (tmp_path / "new.txt").read_text() == "someone else"
+        assert (tmp_path / "a.txt").exists()
+
+    def test_cancel_rolls_back(self, tmp_path: Path) -> None:
+        items = _items(tmp_path, "a", "b", "c")
+        plan = plan_renames(items, RenameRule(template="x_{name}"))
+        token = CancelToken()
+
+        class CancelAfterFirst(OperationProgress):
+            def file_done(self, count: int = 1) -> None:
+                super().file_done(count)
+                token.cancel()
+
+        with pytest.raises(OperationCancelledError) as info:
+            rename_batch(plan, progress=CancelAfterFirst(), cancel=token)
+        assert "되돌렸습니다" in info.value.completed
+        assert sorted(_listing(tmp_path)) == ["a", "b", "c"]
+
+
+def test_panel_applies_renames_in_memory(tmp_path: Path) -> None:
+    items = _items(tmp_path, "a", "b", "c")
+    state = PanelState(current_path=tmp_path)
+    state.items = sort_items(items)
+    state.selection.update(state.items[:2])
+    state.cursor_index = 0
+    renamed = {
+        tmp_path / "a": tmp_path / "z",
+        tmp_path / "b": tmp_path / ".hidden",
+        tmp_path / "other" / "x": tmp_path / "other" / "y",
+    }
+    left = state.apply_renames(renamed)
+    assert left == {tmp_path / "other" / "x": tmp_path / "other" / "y"}
+    assert [i.name for i in state.items] == ["c", "z"]
+    assert state.active_item.name == "z"
+    assert [i.name for i in state.selection.items()] == ["z"]
+    assert state.items[1].is_selected
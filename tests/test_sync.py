@@ -0,0 +1,227 @@
+"""단방향 증분 동기화 단위 테스트."""
+
+import errno
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mdir.models.changes import ChangeSet
+from mdir.operations.cancel import CancelToken
+from mdir.operations.exceptions import DiskFullError, FileOperationError, OperationCancelledError
+from mdir.operations.progress import OperationProgress
+from mdir.operations.sync import SYNC_CHANGED, SYNC_NEW, SyncOptions, plan_sync, run_sync
+
+
+def _tree(root: Path) -> Path:
+    src = root / "src"
+    (src / "sub" / "deep").mkdir(parents=True)
+    (src / "a.txt").write_text("alpha")
+    (src / "sub" / "b.txt").write_text("bravo")
+    (src / "sub" / "deep" / "c.txt").write_text("charlie")
+    os.symlink("a.txt", src / "link")
+    return src
+
+
+def _snapshot(root: Path) -> dict[str, str]:
+    result = {}
+    for path in sorted(root.rglob("*")):
+        rel = str(path.relative_to(root))
+        if path.is_symlink():
+            result[rel] = "-> " + os.readlink(path)
+        elif path.is_file():
+            result[rel] = path.read_text()
+        else:
+            result[rel] = "<dir>"
+    return result
+
+
+def _sync(src: Path, dst: Path, options: SyncOptions | None = None, **kwargs):
+    plan = plan_sync(src, dst, options, workers=2, **kwargs)
+    changes = ChangeSet()
+    run_sync(plan, changes=changes, workers=2)
+    return plan, changes
+
+
+class TestSync:
+    def test_initial_sync_then_nothing_to_do(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+
+        plan, changes = _sync(src, dst)
+        assert plan.mkdirs == ["sub", os.path.join("sub", "deep")]
+        assert {c.reason for c in plan.copies} == {SYNC_NEW}
+        assert _snapshot(dst) == _snapshot(src)
+        assert changes.added == {dst / "a.txt", dst / "sub", dst / "link"}
+        # 메타데이터가 보존되므로 다시 비교하면 할 일이 없다
+        again = plan_sync(src, dst)
+        assert again.empty
+        assert again.unchanged == 4
+
+    def test_copies_only_new_and_changed_files(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        _sync(src, dst)
+
+        (src / "sub" / "b.txt").write_text("bravo two")
+        (src / "sub" / "new.txt").write_text("new")
+        (dst / "extra.txt").write_text("only in backup")
+        plan, changes = _sync(src, dst)
+
+        assert [(c.rel, c.reason) for c in plan.copies] == [
+            (os.path.join("sub", "b.txt"), SYNC_CHANGED),
+            (os.path.join("sub", "new.txt"), SYNC_NEW),
+        ]
+        assert plan.deletes == []
+        assert (dst / "sub" / "b.txt").read_text() == "bravo two"
+        assert (dst / "extra.txt").exists()
+        assert changes.modified == {dst / "sub"}
+
+    def test_same_size_changed_mtime_is_copied(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        _sync(src, dst)
+        (src / "a.txt").write_text("ALPHA")
+        os.utime(src / "a.txt", ns=(0, os.stat(dst / "a.txt").st_mtime_ns + 1))
+
+        plan = plan_sync(src, dst)
+        assert [c.rel for c in plan.copies] == ["a.txt"]
+
+    def test_delete_removes_extras_and_replaces_kind_changes(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        _sync(src, dst)
+        (dst / "extra").mkdir()
+        (dst / "extra" / "x.txt").write_text("x")
+        (src / "a.txt").unlink()
+        (src / "a.txt").mkdir()
+
+        plan = plan_sync(src, dst)
+        assert plan.conflicts == ["a.txt"]
+        assert plan.deletes == []
+
+        plan, changes = _sync(src, dst, SyncOptions(delete=True))
+        assert plan.deletes == ["a.txt", "extra"]
+        assert _snapshot(dst) == _snapshot(src)
+        assert changes.removed == {dst / "extra"}
+        assert dst / "a.txt" in changes.modified
+
+    def test_checksum_compares_content(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        _sync(src, dst)
+        # 내용은 같고 시각만 다름 → checksum 이면 같음
+        os.utime(src / "a.txt", ns=(0, 1_000_000_000))
+        # 크기·시각은 같고 내용만 다름 → checksum 이어야 찾는다
+        st = os.stat(dst / "sub" / "b.txt")
+        (dst / "sub" / "b.txt").write_text("BRAVO")
+        os.utime(dst / "sub" / "b.txt", ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert [c.rel for c in plan_sync(src, dst).copies] == ["a.txt"]
+        plan = plan_sync(src, dst, SyncOptions(checksum=True))
+        assert [c.rel for c in plan.copies] == [os.path.join("sub", "b.txt")]
+        assert plan.hashed == 3
+
+    def test_symlink_target_change(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        _sync(src, dst)
+        (src / "link").unlink()
+        os.symlink("sub", src / "link")
+
+        plan, _ = _sync(src, dst)
+        assert [(c.rel, c.reason) for c in plan.copies] == [("link", SYNC_CHANGED)]
+        assert os.readlink(dst / "link") == "sub"
+
+    def test_names_limit_top_level(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        (dst / "extra.txt").write_text("x")
+        plan, _ = _sync(src, dst, SyncOptions(delete=True), names=["sub"])
+        assert sorted(p.name for p in dst.iterdir()) == ["extra.txt", "sub"]
+        assert plan.deletes == []
+
+    def test_overlapping_roots_rejected(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        with pytest.raises(FileOperationError):
+            plan_sync(src, src / "sub")
+        with pytest.raises(FileOperationError):
+            plan_sync(src, src)
+
+    def test_progress_and_cancel(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        progress = OperationProgress()
+        plan = plan_sync(src, dst, progress=progress)
+        assert progress.files_total == 6
+
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(OperationCancelledError):
+            plan_sync(src, dst, cancel=token)
+        changes = ChangeSet()
+        with pytest.raises(OperationCancelledError):
+            run_sync(plan, changes=changes, cancel=token)
+        assert not changes.trusted
+        assert not (dst / "a.txt").exists()
+
+    def test_changed_file_replaced_only_when_complete(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        dst = tmp_path / "dst"
+        src.mkdir()
+        dst.mkdir()
+        (src / "big.bin").write_bytes(b"n" * (1024 * 1024 * 4))
+        (dst / "big.bin").write_bytes(b"old")
+        plan = plan_sync(src, dst)
+        assert [c.reason for c in plan.copies] == [SYNC_CHANGED]
+
+        from mdir.operations import fastcopy
+
+        token = CancelToken()
+
+        class CancelMidFile(OperationProgress):
+            def advance(self, nbytes: int) -> None:
+                super().advance(nbytes)
+                token.cancel()
+
+        def userspace(src, dest, **kwargs):
+            return fastcopy.copy_file(src, dest, methods=[fastcopy.METHOD_USERSPACE], **kwargs)
+
+        with patch("mdir.operations.copy.copy_file", side_effect=userspace), pytest.raises(
+            OperationCancelledError
+        ):
+            run_sync(plan, progress=CancelMidFile(), cancel=token, workers=1)
+        assert _snapshot(dst) == {"big.bin": "old"}
+
+        def disk_full(src, dest, **kwargs):
+            Path(dest).write_bytes(b"partial")
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        with patch("mdir.operations.copy.copy_file", side_effect=disk_full), pytest.raises(
+            DiskFullError
+        ) as info:
+            run_sync(plan, workers=1)
+        assert info.value.path == dst / "big.bin"
+        assert _snapshot(dst) == {"big.bin": "old"}
+
+        run_sync(plan, workers=2)
+        assert (dst / "big.bin").read_bytes() == (src / "big.bin").read_bytes()
+        assert [p.name for p in dst.iterdir()] == ["big.bin"]
+
+    def test_summary_and_preview(self, tmp_path: Path) -> None:
+        src = _tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        plan = plan_sync(src, dst)
+        assert plan.summary().startswith("새 파일 4개, 변경 0개")
+        assert "새 폴더 2개" in plan.summary()
+        assert plan.preview(limit=3)[-1] == "… 외 3개"
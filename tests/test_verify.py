@@ -0,0 +1,145 @@
+"""복사 검증(해시) 단위 테스트."""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mdir.models.file_item import FileItem
+from mdir.operations.copy import copy_items
+from mdir.operations.exceptions import FileOperationError
+from mdir.operations.fastcopy import METHOD_USERSPACE, copy_file, method_cache
+from mdir.operations.journal import CopyJournal
+from mdir.operations.verify import (
+    VERIFY_MISMATCH,
+    VERIFY_OK,
+    VERIFY_TRUSTED,
+    VerifyOptions,
+    VerifyReport,
+    copy_verified,
+    hash_file,
+    new_hasher,
+)
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux 전용")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    method_cache.clear()
+    yield
+    method_cache.clear()
+
+
+def _corrupting_copy(src, dest, **kwargs):
+    """복사는 정상적으로 하되 대상의 첫 바이트를 바꿈 (기록 오류 흉내)."""
+    method = copy_file(src, dest, **kwargs)
+    with open(dest, "r+b") as f:
+        first = f.read(1)
+        f.seek(0)
+        f.write(bytes([first[0] ^ 0xFF]))
+    return method
+
+
+class TestCopyVerified:
+    def test_hashes_source_while_copying(self, tmp_path: Path) -> None:
+        data = os.urandom(3 * 1024 * 1024 + 5)
+        src = tmp_path / "a.bin"
+        src.write_bytes(data)
+        dest = tmp_path / "b.bin"
+        seen: list[int] = []
+
+        result = copy_verified(str(src), str(dest), VerifyOptions(), on_bytes=seen.append)
+
+        assert result.status == VERIFY_OK
+        assert result.method == METHOD_USERSPACE
+        assert result.digest == hashlib.blake2b(data).hexdigest()
+        assert dest.read_bytes() == data
+        assert sum(seen) == len(data)
+        assert os.stat(dest).st_mtime_ns == os.stat(src).st_mtime_ns
+
+    def test_detects_corrupted_copy(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.bin"
+        src.write_bytes(b"hello world")
+        with patch("mdir.operations.verify.copy_file", side_effect=_corrupting_copy):
+            result = copy_verified(str(src), str(tmp_path / "b.bin"), VerifyOptions("sha256"))
+        assert result.status == VERIFY_MISMATCH
+        assert result.digest == hashlib.sha256(b"hello world").hexdigest()
+        assert result.dest_digest != result.digest
+
+    def test_trusted_kernel_copy_is_not_reread(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.bin"
+        src.write_bytes(os.urandom(64 * 1024))
+        dest = tmp_path / "b.bin"
+        with patch("mdir.operations.verify.hash_file", side_effect=AssertionError):
+            result = copy_verified(str(src), str(dest), VerifyOptions(trust_kernel=True))
+        assert result.status == VERIFY_TRUSTED
+        assert result.digest is None
+        assert dest.read_bytes() == src.read_bytes()
+
+    def test_hash_file_matches_hashlib(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.bin"
+        data = os.urandom(100_000)
+        path.write_bytes(data)
+        assert hash_file(str(path), "sha256", drop_cache=True) == hashlib.sha256(data).hexdigest()
+
+    def test_unknown_algorithm(self) -> None:
+        with pytest.raises(ValueError):
+            new_hasher("nope")
+        with patch.dict(sys.modules, {"xxhash": None}), pytest.raises(ValueError, match="xxhash"):
+            new_hasher("xxh3_64")
+
+    def test_options_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("MDIR_VERIFY_ALGORITHM", "sha256")
+        monkeypatch.setenv("MDIR_VERIFY_TRUST_KERNEL", "1")
+        assert VerifyOptions.from_env() == VerifyOptions("sha256", trust_kernel=True)
+
+
+class TestVerifiedCopyItems:
+    def _tree(self, root: Path) -> Path:
+        src = root / "src"
+        (src / "sub").mkdir(parents=True)
+        for i in range(4):
+            (src / f"f{i}.txt").write_text(f"file {i}")
+            (src / "sub" / f"g{i}.txt").write_text(f"sub {i}")
+        return src
+
+    def test_report_lists_every_file(self, tmp_path: Path) -> None:
+        src = self._tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        report = VerifyReport()
+        copy_items([FileItem.from_path(src)], dst, workers=2, verify=VerifyOptions(), verify_report=report)
+
+        assert len(report.results) == 8
+        assert not report.mismatches
+        out = tmp_path / "report.txt"
+        report.write(out)
+        lines = out.read_text(encoding="utf-8").splitlines()
+        assert lines[1] == "# 검증 8개, 불일치 0"
+        assert sum(line.startswith("OK") for line in lines) == 8
+
+    def test_mismatch_fails_and_keeps_journal(self, tmp_path: Path) -> None:
+        src = self._tree(tmp_path)
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        items = [FileItem.from_path(src)]
+        journal = CopyJournal.open([src], dst, tmp_path / "jobs")
+        report = VerifyReport()
+        with (
+            patch("mdir.operations.verify.copy_file", side_effect=_corrupting_copy),
+            pytest.raises(FileOperationError, match="검증 실패"),
+        ):
+            copy_items(items, dst, workers=1, journal=journal, verify=VerifyOptions(), verify_report=report)
+        assert len(report.mismatches) == 8
+        assert journal.path.exists()
+
+        # 다시 실행하면 불일치했던 파일을 다시 복사한다
+        journal = CopyJournal.open([src], dst, tmp_path / "jobs")
+        report = VerifyReport()
+        copy_items(items, dst, workers=1, journal=journal, verify=VerifyOptions(), verify_report=report)
+        assert [r.status for r in report.results] == [VERIFY_OK] * 8
+        assert (dst / "src" / "sub" / "g3.txt").read_text() == "sub 3"